@@ -0,0 +1,127 @@
+"""
+Benchmark construction time and memory of hot-path row types.
+
+Compares pydantic models with the slotted records in src/core/records.py and
+the columnar OddsTable, building 100k rows of each.
+
+Usage:
+    python scripts/bench_records.py [--rows 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.models import KalshiMarket, SportsbookOdds
+from src.core.odds_table import OddsTableBuilder
+from src.core.records import MarketRecord, OddsRecord
+
+
+BOOKS_PER_GAME = 10
+START_TIME = datetime(2030, 1, 1, 18, 0)
+
+
+def odds_kwargs(i: int) -> dict:
+    """Keyword arguments for the i-th odds row."""
+    return dict(
+        game_id=f"game_{i // BOOKS_PER_GAME}",
+        sport="americanfootball_nfl",
+        away_team="Seattle Seahawks",
+        home_team="San Francisco 49ers",
+        start_time=START_TIME,
+        book_name=f"book_{i % BOOKS_PER_GAME}",
+        moneyline_away=120,
+        moneyline_home=-140,
+        spread_away=2.5,
+        spread_home=-2.5,
+        total_over=45.5,
+        total_under=45.5
+    )
+
+
+def market_kwargs(i: int) -> dict:
+    """Keyword arguments for the i-th market row."""
+    return dict(
+        market_id=f"market_{i}",
+        title="Will Seattle Seahawks beat San Francisco 49ers?",
+        event_time=START_TIME,
+        last_price=0.45,
+        volume=1500,
+        open_interest=5000,
+        market_side="YES",
+        outcome_description="Seattle Seahawks wins"
+    )
+
+
+def build_odds_table(rows: int):
+    """Build an OddsTable holding the same rows."""
+    builder = OddsTableBuilder()
+    game_index = -1
+    for i in range(rows):
+        kwargs = odds_kwargs(i)
+        if i % BOOKS_PER_GAME == 0:
+            game_index = builder.add_game(
+                kwargs['game_id'], kwargs['sport'], kwargs['away_team'], kwargs['home_team'], kwargs['start_time']
+            )
+        builder.add_book(
+            game_index,
+            kwargs['book_name'],
+            moneyline_away=kwargs['moneyline_away'],
+            moneyline_home=kwargs['moneyline_home'],
+            spread_away=kwargs['spread_away'],
+            spread_home=kwargs['spread_home'],
+            total_over=kwargs['total_over'],
+            total_under=kwargs['total_under']
+        )
+    return builder.build()
+
+
+def measure(build: Callable[[], object]) -> List[float]:
+    """Return [seconds, retained MiB] for a build; time and memory are measured in separate runs."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    
+    # tracemalloc slows allocation down, so it only runs for the memory pass
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return [elapsed, retained / (1024 * 1024)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000, help='rows to build per case')
+    args = parser.parse_args()
+    rows = args.rows
+    
+    # Argument dicts are built inside each case so every case pays the same overhead
+    cases = [
+        ('SportsbookOdds (pydantic)', lambda: [SportsbookOdds(**odds_kwargs(i)) for i in range(rows)]),
+        ('OddsRecord (slotted)', lambda: [OddsRecord(**odds_kwargs(i)) for i in range(rows)]),
+        ('OddsTable (columnar)', lambda: build_odds_table(rows)),
+        ('KalshiMarket (pydantic)', lambda: [KalshiMarket(**market_kwargs(i)) for i in range(rows)]),
+        ('MarketRecord (slotted)', lambda: [MarketRecord(**market_kwargs(i)) for i in range(rows)]),
+    ]
+    
+    print(f"{rows:,} rows per case")
+    print(f"{'case':<28}{'seconds':>10}{'MiB':>10}{'bytes/row':>12}")
+    for name, build in cases:
+        elapsed, mib = measure(build)
+        print(f"{name:<28}{elapsed:>10.3f}{mib:>10.1f}{mib * 1024 * 1024 / rows:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -26,4 +26,29 @@ def load_config() -> Config:
         min_volume=int(os.getenv("MIN_VOLUME", "100")),
         top_n=int(os.getenv("TOP_N", "10")),
         use_fixtures=os.getenv("USE_FIXTURES", "false").lower() == "true",
+        odds_fetch_workers=int(os.getenv("ODDS_FETCH_WORKERS", "8")),
+        report_refresh_seconds=int(os.getenv("REPORT_REFRESH_SECONDS", "300")),
+        devig_method=os.getenv("DEVIG_METHOD", "multiplicative").lower(),
+        odds_cache_ttl_seconds=int(os.getenv("ODDS_CACHE_TTL_SECONDS", "60")),
+        odds_cache_stale_seconds=int(os.getenv("ODDS_CACHE_STALE_SECONDS", "120")),
+        adaptive_ttl=os.getenv("ADAPTIVE_TTL", "true").lower() == "true",
+        odds_ttl_min_seconds=int(os.getenv("ODDS_TTL_MIN_SECONDS", "30")),
+        odds_ttl_max_seconds=int(os.getenv("ODDS_TTL_MAX_SECONDS", "1800")),
+        odds_markets=[m.strip() for m in os.getenv("ODDS_MARKETS", "h2h").split(",") if m.strip()],
+        odds_bookmakers=[b.strip() for b in os.getenv("ODDS_BOOKMAKERS", "").split(",") if b.strip()],
+        kalshi_cache_ttl_seconds=int(os.getenv("KALSHI_CACHE_TTL_SECONDS", "30")),
+        kalshi_cache_stale_seconds=int(os.getenv("KALSHI_CACHE_STALE_SECONDS", "60")),
+        kalshi_series=[t.strip() for t in os.getenv("KALSHI_SERIES", "").split(",") if t.strip()],
+        kalshi_max_pages=int(os.getenv("KALSHI_MAX_PAGES", "20")),
+        price_feed_url=os.getenv("PRICE_FEED_URL", ""),
+        price_feed_max_age_seconds=int(os.getenv("PRICE_FEED_MAX_AGE_SECONDS", "120")),
+        http_retry_attempts=int(os.getenv("HTTP_RETRY_ATTEMPTS", "3")),
+        circuit_failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+        circuit_reset_seconds=int(os.getenv("CIRCUIT_RESET_SECONDS", "30")),
+        run_deadline_seconds=int(os.getenv("RUN_DEADLINE_SECONDS", "45")),
+        # Unset falls back to the model default, so load_config and Config(...) agree
+        cache_dir=os.getenv("CACHE_DIR", Config.model_fields["cache_dir"].default),
+        cache_max_mb=int(os.getenv("CACHE_MAX_MB", "256")),
+        memory_cache_max_entries=int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", "1024")),
+        memory_cache_max_mb=int(os.getenv("MEMORY_CACHE_MAX_MB", "64")),
     )
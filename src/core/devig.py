@@ -0,0 +1,247 @@
+"""
+Batched de-vig methods for turning sportsbook prices into fair probabilities.
+
+Every method works on whole slates at once: the input is an array whose last
+axis (or the given axis) holds one outcome set, e.g. a games x books x
+outcomes matrix of implied probabilities. Iterative methods (power, Shin)
+solve all outcome sets together with a vectorized bisection instead of a
+Python root-finder per game.
+"""
+
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.core.odds_math import remove_vig_array
+
+
+DEVIG_METHODS = ('none', 'multiplicative', 'additive', 'power', 'shin')
+
+SOLVER_MAX_ITERATIONS = 100
+SOLVER_TOLERANCE = 1e-12
+
+
+def _solve_decreasing(
+    func: Callable[[np.ndarray], np.ndarray],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    max_iterations: int = SOLVER_MAX_ITERATIONS,
+    tolerance: float = SOLVER_TOLERANCE
+) -> np.ndarray:
+    """
+    Find roots of a decreasing function for many rows at once by bisection.
+    
+    Args:
+        func: Maps a column of parameters to a column of residuals; must be
+            positive at lower and negative at upper for every row
+        lower: Lower bracket per row
+        upper: Upper bracket per row
+        max_iterations: Maximum number of bisection steps
+        tolerance: Stop once every bracket is narrower than this
+    
+    Returns:
+        Midpoint of the final bracket per row
+    """
+    lower = lower.copy()
+    upper = upper.copy()
+    
+    for _ in range(max_iterations):
+        middle = (lower + upper) / 2
+        above = func(middle) > 0
+        lower = np.where(above, middle, lower)
+        upper = np.where(above, upper, middle)
+        if np.all(upper - lower < tolerance):
+            break
+    
+    midpoint: np.ndarray = (lower + upper) / 2
+    return midpoint
+
+
+def _outcome_rows(probs: np.ndarray, axis: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Move the outcome axis last and flatten the rest into rows."""
+    moved = np.moveaxis(probs, axis, -1)
+    return moved, moved.reshape(-1, moved.shape[-1])
+
+
+def _restore(rows: np.ndarray, moved: np.ndarray, axis: int) -> np.ndarray:
+    """Undo _outcome_rows."""
+    restored: np.ndarray = np.moveaxis(rows.reshape(moved.shape), -1, axis)
+    return restored
+
+
+def _solvable_rows(rows: np.ndarray) -> np.ndarray:
+    """
+    Rows that can be de-vigged: at least two prices, all strictly inside (0, 1).
+    
+    Missing prices (NaN) are ignored; anything else keeps its raw value.
+    """
+    present = ~np.isnan(rows)
+    with np.errstate(invalid='ignore'):
+        in_range = np.where(present, (rows > 0) & (rows < 1), True)
+    solvable: np.ndarray = (present.sum(axis=1) >= 2) & in_range.all(axis=1)
+    return solvable
+
+
+def devig_multiplicative(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """
+    Scale each outcome set proportionally so it sums to 1.0.
+    
+    Args:
+        probabilities: Implied probabilities; NaN marks a missing price
+        axis: Axis holding the outcomes
+    
+    Returns:
+        Fair probabilities with the same shape
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    moved, rows = _outcome_rows(probs, axis)
+    solvable = _solvable_rows(rows)
+    fair = np.where(solvable[:, None], remove_vig_array(rows), rows)
+    return _restore(fair, moved, axis)
+
+
+def devig_additive(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """
+    Subtract an equal share of the overround from every outcome.
+    
+    Outcomes pushed below zero are clipped and the set renormalized.
+    
+    Args:
+        probabilities: Implied probabilities; NaN marks a missing price
+        axis: Axis holding the outcomes
+    
+    Returns:
+        Fair probabilities with the same shape
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    moved, rows = _outcome_rows(probs, axis)
+    solvable = _solvable_rows(rows)
+    
+    counts = np.sum(~np.isnan(rows), axis=1, keepdims=True)
+    overround = np.nansum(rows, axis=1, keepdims=True) - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shifted = np.clip(rows - overround / counts, 0.0, None)
+    
+    fair = np.where(solvable[:, None], remove_vig_array(shifted), rows)
+    return _restore(fair, moved, axis)
+
+
+def devig_power(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """
+    Raise each outcome to a common power k chosen so the set sums to 1.0.
+    
+    Longshots shrink more than favourites, which matches how books shade
+    prices. k is solved for every outcome set at once.
+    
+    Args:
+        probabilities: Implied probabilities; NaN marks a missing price
+        axis: Axis holding the outcomes
+    
+    Returns:
+        Fair probabilities with the same shape
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    moved, rows = _outcome_rows(probs, axis)
+    solvable = _solvable_rows(rows)
+    if not solvable.any():
+        return probs.copy()
+    
+    # Placeholder values keep unsolvable rows numerically harmless
+    work = np.where(solvable[:, None], rows, 0.5)
+    counts = np.sum(~np.isnan(work), axis=1)
+    largest = np.nanmax(work, axis=1)
+    
+    # sum(p^k) <= n * max(p)^k, which is <= 1 once k >= ln(n) / -ln(max(p))
+    upper = np.maximum(1.0, np.log(counts) / -np.log(largest)) * 2
+    
+    def residual(k: np.ndarray) -> np.ndarray:
+        excess: np.ndarray = np.nansum(work ** k[:, None], axis=1) - 1
+        return excess
+    
+    exponents = _solve_decreasing(residual, np.zeros(len(work)), upper)
+    fair = np.where(solvable[:, None], work ** exponents[:, None], rows)
+    return _restore(fair, moved, axis)
+
+
+def _shin_probabilities(rows: np.ndarray, insider_share: np.ndarray) -> np.ndarray:
+    """Shin fair probabilities for a given insider share z per row."""
+    z = insider_share[:, None]
+    total = np.nansum(rows, axis=1, keepdims=True)
+    fair: np.ndarray = (np.sqrt(z ** 2 + 4 * (1 - z) * rows ** 2 / total) - z) / (2 * (1 - z))
+    return fair
+
+
+def devig_shin(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """
+    Remove vig with Shin's insider-trading model.
+    
+    Solves for the insider share z of every outcome set at once. Sets
+    without an overround have no Shin solution and are scaled
+    multiplicatively instead.
+    
+    Args:
+        probabilities: Implied probabilities; NaN marks a missing price
+        axis: Axis holding the outcomes
+    
+    Returns:
+        Fair probabilities with the same shape
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    moved, rows = _outcome_rows(probs, axis)
+    solvable = _solvable_rows(rows)
+    if not solvable.any():
+        return probs.copy()
+    
+    work = np.where(solvable[:, None], rows, 0.5)
+    overround = np.nansum(work, axis=1) > 1
+    
+    def residual(z: np.ndarray) -> np.ndarray:
+        excess: np.ndarray = np.nansum(_shin_probabilities(work, z), axis=1) - 1
+        return excess
+    
+    # The residual is sqrt(total) - 1 > 0 at z = 0 and negative as z -> 1
+    insider_share = _solve_decreasing(residual, np.zeros(len(work)), np.full(len(work), 1 - 1e-9))
+    shin = remove_vig_array(_shin_probabilities(work, insider_share))
+    
+    fair = np.where(overround[:, None], shin, remove_vig_array(work))
+    fair = np.where(solvable[:, None], fair, rows)
+    return _restore(fair, moved, axis)
+
+
+def devig_none(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """Return raw implied probabilities unchanged."""
+    return np.array(probabilities, dtype=float)
+
+
+_DEVIG_FUNCTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    'none': devig_none,
+    'multiplicative': devig_multiplicative,
+    'additive': devig_additive,
+    'power': devig_power,
+    'shin': devig_shin,
+}
+
+
+def devig(probabilities: ArrayLike, method: str = 'multiplicative', axis: int = -1) -> np.ndarray:
+    """
+    Convert implied probabilities to fair probabilities for a whole slate.
+    
+    Outcome sets with fewer than two prices, or with prices outside (0, 1),
+    are returned unchanged.
+    
+    Args:
+        probabilities: Implied probabilities; each slice along axis is one
+            outcome set and NaN marks a missing price
+        method: One of DEVIG_METHODS
+        axis: Axis holding the outcomes
+    
+    Returns:
+        Fair probabilities with the same shape
+    """
+    try:
+        devig_function = _DEVIG_FUNCTIONS[method.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown de-vig method '{method}', expected one of {', '.join(DEVIG_METHODS)}")
+    
+    return devig_function(probabilities, axis=axis)
@@ -4,7 +4,7 @@ Pydantic models for data structures.
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Team(BaseModel):
@@ -69,6 +69,15 @@ class MatchedGame(BaseModel):
     volume: int
     payout_ratio: float
     expected_value: float
+    
+    # Side-aware book numbers; book probabilities above are for the selection
+    selection: Optional[str] = None  # Canonical team the market pays out on
+    best_price: Optional[int] = None  # Best American odds on the selection
+    consensus_prob: Optional[float] = None  # Median book probability of the selection
+    book_spread: Optional[float] = None  # Max - min book probability of the selection
+    opponent_best_price: Optional[int] = None
+    opponent_consensus_prob: Optional[float] = None
+    opponent_book_spread: Optional[float] = None
 
 
 class DiscrepancyRanking(BaseModel):
@@ -96,6 +105,16 @@ class NewsletterReport(BaseModel):
     total_books: int
 
 
+class ReportSnapshot(BaseModel):
+    """Immutable, pre-rendered report served to web clients."""
+    model_config = ConfigDict(frozen=True)
+    
+    content: str
+    generated_at: datetime
+    build_seconds: float
+    version: int
+
+
 class Config(BaseModel):
     """Application configuration."""
     kalshi_base_url: str
@@ -110,3 +129,27 @@ class Config(BaseModel):
     min_volume: int
     top_n: int
     use_fixtures: bool
+    odds_fetch_workers: int = 8
+    report_refresh_seconds: int = 300
+    devig_method: str = "multiplicative"  # none, multiplicative, additive, power or shin
+    odds_cache_ttl_seconds: int = 60  # 0 disables caching of odds responses
+    odds_cache_stale_seconds: int = 120
+    adaptive_ttl: bool = True  # derive odds TTLs from time to game and price movement
+    odds_ttl_min_seconds: int = 30
+    odds_ttl_max_seconds: int = 1800
+    odds_markets: List[str] = ["h2h"]  # markets requested from TheOddsAPI; the reports only price moneylines
+    odds_bookmakers: List[str] = []  # bookmaker allow-list; empty requests every US book
+    kalshi_cache_ttl_seconds: int = 30  # 0 disables caching of Kalshi responses
+    kalshi_cache_stale_seconds: int = 60
+    kalshi_series: List[str] = []  # series tickers to list markets for; empty lists every series
+    kalshi_max_pages: int = 20  # page budget per series, guarding against runaway cursors
+    price_feed_url: str = ""  # websocket for streamed market prices; empty disables the feed
+    price_feed_max_age_seconds: int = 120  # streamed prices older than this are not used
+    http_retry_attempts: int = 3  # tries per upstream call, including the first
+    circuit_failure_threshold: int = 5  # consecutive failures that open a host's circuit breaker
+    circuit_reset_seconds: int = 30
+    run_deadline_seconds: int = 45  # budget for one run's upstream fetches; 0 disables it
+    cache_dir: str = "data/cache"  # directory for the persistent cache tier; empty disables it
+    cache_max_mb: int = 256
+    memory_cache_max_entries: int = 1024  # limits of the shared in-memory cache tier
+    memory_cache_max_mb: int = 64
@@ -2,9 +2,32 @@
 Odds conversion utilities for sports betting and prediction markets.
 """
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import math
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+# One axis or several, as numpy reductions accept
+Axis = Union[int, Tuple[int, ...]]
+
+
+def american_to_implied_probability_array(american_odds: ArrayLike) -> np.ndarray:
+    """
+    Convert an array of American odds to implied probabilities.
+    
+    Args:
+        american_odds: American odds of any shape; NaN marks a missing price
+        
+    Returns:
+        Float array of the same shape with probabilities between 0 and 1
+        (NaN where the price was missing)
+    """
+    odds = np.asarray(american_odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds > 0, 100 / (odds + 100), -odds / (-odds + 100))
+
 
 def american_to_implied_probability(american_odds: int) -> float:
     """
@@ -16,10 +39,7 @@ def american_to_implied_probability(american_odds: int) -> float:
     Returns:
         Implied probability as float between 0 and 1
     """
-    if american_odds > 0:
-        return 100 / (american_odds + 100)
-    else:
-        return (-american_odds) / ((-american_odds) + 100)
+    return float(american_to_implied_probability_array(american_odds))
 
 
 def decimal_to_implied_probability(decimal_odds: float) -> float:
@@ -64,6 +84,25 @@ def implied_probability_to_decimal(probability: float) -> float:
     return 1 / probability
 
 
+def remove_vig_array(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """
+    Remove vig from many outcome sets at once by proportional scaling.
+    
+    Args:
+        probabilities: Implied probabilities; each slice along axis is one
+            outcome set (NaN entries are ignored)
+        axis: Axis holding the outcomes
+        
+    Returns:
+        Array of the same shape whose outcome sets sum to 1.0 (sets with a
+        non-positive total are returned unchanged)
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    total = np.nansum(probs, axis=axis, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(total > 0, probs / total, probs)
+
+
 def remove_vig(probabilities: List[float]) -> List[float]:
     """
     Remove vig (overround) from a set of probabilities.
@@ -74,11 +113,27 @@ def remove_vig(probabilities: List[float]) -> List[float]:
     Returns:
         List of de-vigged probabilities that sum to 1.0
     """
-    total_prob = sum(probabilities)
-    if total_prob <= 0:
+    if sum(probabilities) <= 0:
         return probabilities
     
-    return [p / total_prob for p in probabilities]
+    fair: List[float] = remove_vig_array(probabilities).tolist()
+    return fair
+
+
+def calculate_payout_ratio_array(probability: ArrayLike) -> np.ndarray:
+    """
+    Calculate payout ratios for an array of probabilities.
+    
+    Args:
+        probability: Implied probabilities (0-1) of any shape
+        
+    Returns:
+        Payout ratios, 0.0 where the probability is not strictly inside (0, 1)
+    """
+    probs = np.asarray(probability, dtype=float)
+    valid = (probs > 0) & (probs < 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(valid, (1 - probs) / probs, 0.0)
 
 
 def calculate_payout_ratio(probability: float) -> float:
@@ -91,9 +146,7 @@ def calculate_payout_ratio(probability: float) -> float:
     Returns:
         Payout ratio (e.g., 3.0 for 3:1 payout)
     """
-    if probability <= 0 or probability >= 1:
-        return 0.0
-    return (1 - probability) / probability
+    return float(calculate_payout_ratio_array(probability))
 
 
 def calculate_discrepancy(prediction_prob: float, book_prob: float) -> float:
@@ -107,7 +160,84 @@ def calculate_discrepancy(prediction_prob: float, book_prob: float) -> float:
     Returns:
         Absolute discrepancy (0-1)
     """
-    return abs(prediction_prob - book_prob)
+    return float(calculate_discrepancy_array(prediction_prob, book_prob))
+
+
+def calculate_discrepancy_array(prediction_prob: ArrayLike, book_prob: ArrayLike) -> np.ndarray:
+    """
+    Calculate absolute discrepancies for arrays of probabilities.
+    
+    Args:
+        prediction_prob: Prediction market implied probabilities
+        book_prob: Sportsbook implied probabilities, broadcastable with prediction_prob
+        
+    Returns:
+        Absolute discrepancies (0-1)
+    """
+    discrepancy: np.ndarray = np.abs(np.asarray(prediction_prob, dtype=float) - np.asarray(book_prob, dtype=float))
+    return discrepancy
+
+
+def calculate_edge_vs_best_array(book_probs: ArrayLike, axis: Axis = -1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate min/avg/max book probabilities for many games at once.
+    
+    Args:
+        book_probs: Sportsbook implied probabilities; NaN marks a missing price
+        axis: Axis or axes to reduce over (e.g. books and outcomes)
+        
+    Returns:
+        Tuple of (min_book_prob, avg_book_prob, max_book_prob) arrays, 0.0
+        where a game has no prices at all
+    """
+    probs = np.asarray(book_probs, dtype=float)
+    has_prices = np.any(~np.isnan(probs), axis=axis)
+    filled_min = np.where(np.isnan(probs), np.inf, probs).min(axis=axis)
+    filled_max = np.where(np.isnan(probs), -np.inf, probs).max(axis=axis)
+    counts = np.sum(~np.isnan(probs), axis=axis)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = np.nansum(probs, axis=axis) / counts
+    
+    return (
+        np.where(has_prices, filled_min, 0.0),
+        np.where(has_prices, avg, 0.0),
+        np.where(has_prices, filled_max, 0.0)
+    )
+
+
+def calculate_best_price_array(american_odds: ArrayLike, axis: Axis = -1) -> np.ndarray:
+    """
+    Find the best (highest-paying) American odds across books.
+    
+    Args:
+        american_odds: American odds; NaN marks a missing price
+        axis: Axis or axes holding the books
+        
+    Returns:
+        Best odds, NaN where no book offers a price
+    """
+    odds = np.asarray(american_odds, dtype=float)
+    has_prices = np.any(~np.isnan(odds), axis=axis)
+    best = np.where(np.isnan(odds), -np.inf, odds).max(axis=axis)
+    return np.where(has_prices, best, np.nan)
+
+
+def calculate_consensus_array(book_probs: ArrayLike, axis: Axis = -1) -> np.ndarray:
+    """
+    Calculate the consensus (median) book probability.
+    
+    Args:
+        book_probs: Sportsbook probabilities; NaN marks a missing price
+        axis: Axis or axes holding the books
+        
+    Returns:
+        Median probabilities, 0.0 where no book offers a price
+    """
+    probs = np.asarray(book_probs, dtype=float)
+    # Fill empty slices so nanmedian has something to reduce
+    empty = np.isnan(probs).all(axis=axis, keepdims=True)
+    consensus: np.ndarray = np.nanmedian(np.where(empty, 0.0, probs), axis=axis)
+    return consensus
 
 
 def calculate_edge_vs_best(prediction_prob: float, book_probs: List[float]) -> Tuple[float, float, float]:
@@ -124,11 +254,9 @@ def calculate_edge_vs_best(prediction_prob: float, book_probs: List[float]) -> T
     if not book_probs:
         return 0.0, 0.0, 0.0
     
-    min_prob = min(book_probs)
-    max_prob = max(book_probs)
-    avg_prob = sum(book_probs) / len(book_probs)
+    min_prob, avg_prob, max_prob = calculate_edge_vs_best_array(book_probs)
     
-    return min_prob, avg_prob, max_prob
+    return float(min_prob), float(avg_prob), float(max_prob)
 
 
 def calculate_expected_value(prediction_prob: float, book_prob: float, stake: float = 1.0) -> float:
@@ -143,11 +271,24 @@ def calculate_expected_value(prediction_prob: float, book_prob: float, stake: fl
     Returns:
         Expected value
     """
-    if book_prob <= 0 or book_prob >= 1:
-        return 0.0
-    
-    payout = stake * (1 / book_prob - 1)
-    win_prob = prediction_prob
-    lose_prob = 1 - prediction_prob
+    return float(calculate_expected_value_array(prediction_prob, book_prob, stake))
+
+
+def calculate_expected_value_array(prediction_prob: ArrayLike, book_prob: ArrayLike, stake: float = 1.0) -> np.ndarray:
+    """
+    Calculate expected values for arrays of bets.
     
-    return (win_prob * payout) - (lose_prob * stake)
+    Args:
+        prediction_prob: True probabilities (from prediction market)
+        book_prob: Book implied probabilities, broadcastable with prediction_prob
+        stake: Bet amount
+        
+    Returns:
+        Expected values, 0.0 where the book probability is not strictly inside (0, 1)
+    """
+    win_prob = np.asarray(prediction_prob, dtype=float)
+    book = np.asarray(book_prob, dtype=float)
+    valid = (book > 0) & (book < 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payout = stake * (1 / book - 1)
+        return np.where(valid, win_prob * payout - (1 - win_prob) * stake, 0.0)
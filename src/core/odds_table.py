@@ -0,0 +1,335 @@
+"""
+Columnar storage for sportsbook odds.
+
+Keeping every bookmaker as its own SportsbookOdds model multiplies memory and
+validation cost by the number of books (10-15 per game). OddsTable instead
+stores one row of metadata per game and float arrays of prices laid out as
+games x books x outcomes, with NaN for prices a book does not offer.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TypeVar, Union
+
+import numpy as np
+
+from src.core.models import SportsbookOdds
+from src.core.records import OddsRecord
+
+
+# Prices are American odds or points, which float32 represents exactly
+PRICE_DTYPE = np.float32
+
+PriceT = TypeVar('PriceT', int, float)
+
+
+class OddsGame(NamedTuple):
+    """Metadata for one game in an OddsTable."""
+    game_id: str
+    sport: str
+    away_team: str
+    home_team: str
+    start_time: datetime
+
+
+class OddsTable:
+    """
+    Sportsbook odds for many games and books in a compact columnar layout.
+    
+    Price arrays have shape (games, books, 2). Moneylines and spreads hold
+    (away, home); totals hold (over, under). A book has a row for a game when
+    it offers at least one moneyline price for it.
+    """
+    
+    def __init__(
+        self,
+        games: List[OddsGame],
+        books: List[str],
+        moneyline: np.ndarray,
+        spread: np.ndarray,
+        total: np.ndarray,
+        primary_book: np.ndarray
+    ):
+        self.games = games
+        self.books = books
+        self.moneyline = moneyline
+        self.spread = spread
+        self.total = total
+        # Column of the first book listed for each game upstream
+        self.primary_book = primary_book
+    
+    def __len__(self) -> int:
+        return len(self.games)
+    
+    def __iter__(self) -> Iterator[OddsGame]:
+        return iter(self.games)
+    
+    @property
+    def has_book(self) -> np.ndarray:
+        """Boolean (games, books) mask of which books price each game."""
+        mask: np.ndarray = ~np.isnan(self.moneyline).all(axis=-1)
+        return mask
+    
+    @property
+    def num_rows(self) -> int:
+        """Number of (game, book) rows, i.e. the old SportsbookOdds count."""
+        return int(self.has_book.sum())
+    
+    @classmethod
+    def empty(cls) -> 'OddsTable':
+        """Create a table with no games."""
+        return OddsTableBuilder().build()
+    
+    @classmethod
+    def from_models(cls, odds_list: Iterable[Union[SportsbookOdds, OddsRecord]]) -> 'OddsTable':
+        """
+        Build a table from SportsbookOdds models or OddsRecords, grouping them by game_id.
+        
+        Args:
+            odds_list: Odds rows; the first row of each game is its primary book
+        
+        Returns:
+            OddsTable with games in first-seen order
+        """
+        builder = OddsTableBuilder()
+        game_indices: Dict[str, int] = {}
+        
+        for odds in odds_list:
+            game_index = game_indices.get(odds.game_id)
+            if game_index is None:
+                game_index = builder.add_game(
+                    odds.game_id, odds.sport, odds.away_team, odds.home_team, odds.start_time
+                )
+                game_indices[odds.game_id] = game_index
+            builder.add_book(
+                game_index,
+                odds.book_name,
+                moneyline_away=odds.moneyline_away,
+                moneyline_home=odds.moneyline_home,
+                spread_away=odds.spread_away,
+                spread_home=odds.spread_home,
+                total_over=odds.total_over,
+                total_under=odds.total_under
+            )
+        
+        return builder.build()
+    
+    @classmethod
+    def concat(cls, tables: Sequence['OddsTable']) -> 'OddsTable':
+        """
+        Stack several tables, merging their book columns.
+        
+        Args:
+            tables: Tables to combine, in output order
+        
+        Returns:
+            OddsTable holding every game of every table
+        """
+        tables = [table for table in tables if len(table)]
+        if not tables:
+            return cls.empty()
+        if len(tables) == 1:
+            return tables[0]
+        
+        books = list(dict.fromkeys(book for table in tables for book in table.books))
+        book_columns = {book: i for i, book in enumerate(books)}
+        num_games = sum(len(table) for table in tables)
+        arrays = [np.full((num_games, len(books), 2), np.nan, dtype=PRICE_DTYPE) for _ in range(3)]
+        primary_book = np.empty(num_games, dtype=np.intp)
+        games: List[OddsGame] = []
+        
+        start = 0
+        for table in tables:
+            stop = start + len(table)
+            columns = np.array([book_columns[book] for book in table.books], dtype=np.intp)
+            for target, source in zip(arrays, (table.moneyline, table.spread, table.total)):
+                target[start:stop, columns] = source
+            primary_book[start:stop] = columns[table.primary_book]
+            games.extend(table.games)
+            start = stop
+        
+        moneyline, spread, total = arrays
+        return cls(games, books, moneyline, spread, total, primary_book)
+    
+    def select(self, indices: Sequence[int]) -> 'OddsTable':
+        """
+        Create a table holding only the given games.
+        
+        Book columns that no selected game uses are dropped.
+        
+        Args:
+            indices: Game positions to keep, in output order
+        
+        Returns:
+            OddsTable for the selected games
+        """
+        rows = np.asarray(indices, dtype=np.intp)
+        used = self.has_book[rows].any(axis=0)
+        columns = np.flatnonzero(used)
+        remap = np.full(len(self.books), -1, dtype=np.intp)
+        remap[columns] = np.arange(len(columns))
+        
+        return OddsTable(
+            [self.games[i] for i in rows],
+            [self.books[i] for i in columns],
+            self.moneyline[rows][:, columns],
+            self.spread[rows][:, columns],
+            self.total[rows][:, columns],
+            remap[self.primary_book[rows]]
+        )
+    
+    def moneyline_rows(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Get the (away, home) moneylines of every book row for some games.
+        
+        Args:
+            indices: Game positions (defaults to all games)
+        
+        Returns:
+            Float array of shape (rows, 2), primary books first within each game
+        """
+        if indices is None:
+            indices = range(len(self.games))
+        
+        rows = []
+        for game_index in indices:
+            rows.append(self.moneyline[game_index, self._book_order(game_index)])
+        
+        if not rows:
+            return np.empty((0, 2), dtype=PRICE_DTYPE)
+        return np.concatenate(rows)
+    
+    def to_models(self, primary_only: bool = False) -> List[SportsbookOdds]:
+        """
+        Convert to SportsbookOdds models for API and serialization boundaries.
+        
+        Args:
+            primary_only: Emit only each game's first-listed book
+        
+        Returns:
+            One SportsbookOdds per (game, book) row, in game order with each
+            game's primary book first
+        """
+        return [record.to_model() for record in self.to_records(primary_only)]
+    
+    def to_records(self, primary_only: bool = False) -> List[OddsRecord]:
+        """
+        Convert to unvalidated OddsRecords for internal consumers.
+        
+        Args:
+            primary_only: Emit only each game's first-listed book
+        
+        Returns:
+            One OddsRecord per (game, book) row, in the same order as to_models
+        """
+        odds_list = []
+        
+        for game_index, game in enumerate(self.games):
+            book_order = self._book_order(game_index)
+            if primary_only:
+                book_order = book_order[:1]
+            for book_index in book_order:
+                odds_list.append(OddsRecord(
+                    game_id=game.game_id,
+                    sport=game.sport,
+                    away_team=game.away_team,
+                    home_team=game.home_team,
+                    start_time=game.start_time,
+                    book_name=self.books[book_index],
+                    moneyline_away=_to_price(self.moneyline[game_index, book_index, 0], int),
+                    moneyline_home=_to_price(self.moneyline[game_index, book_index, 1], int),
+                    spread_away=_to_price(self.spread[game_index, book_index, 0], float),
+                    spread_home=_to_price(self.spread[game_index, book_index, 1], float),
+                    total_over=_to_price(self.total[game_index, book_index, 0], float),
+                    total_under=_to_price(self.total[game_index, book_index, 1], float)
+                ))
+        
+        return odds_list
+    
+    def _book_order(self, game_index: int) -> np.ndarray:
+        """Book columns pricing a game, primary book first."""
+        columns = np.flatnonzero(self.has_book[game_index])
+        primary = self.primary_book[game_index]
+        return np.concatenate(([primary], columns[columns != primary]))
+
+
+def _to_price(value: float, cast: Callable[[float], PriceT]) -> Optional[PriceT]:
+    """Convert a stored price back to a Python value (None when missing)."""
+    return None if np.isnan(value) else cast(value)
+
+
+class OddsTableBuilder:
+    """Accumulates games and book prices, then packs them into an OddsTable."""
+    
+    def __init__(self) -> None:
+        self._games: List[OddsGame] = []
+        self._books: Dict[str, int] = {}
+        self._primary_book: List[int] = []
+        self._rows: List[tuple] = []
+    
+    def __len__(self) -> int:
+        return len(self._games)
+    
+    def add_game(self, game_id: str, sport: str, away_team: str, home_team: str, start_time: datetime) -> int:
+        """
+        Add a game.
+        
+        Returns:
+            The game's position, used to add its book prices
+        """
+        self._games.append(OddsGame(game_id, sport, away_team, home_team, start_time))
+        self._primary_book.append(-1)
+        return len(self._games) - 1
+    
+    def add_book(
+        self,
+        game_index: int,
+        book_name: str,
+        moneyline_away: Optional[int] = None,
+        moneyline_home: Optional[int] = None,
+        spread_away: Optional[float] = None,
+        spread_home: Optional[float] = None,
+        total_over: Optional[float] = None,
+        total_under: Optional[float] = None
+    ) -> None:
+        """Add one book's prices for a game; books without a moneyline are skipped."""
+        if moneyline_away is None and moneyline_home is None:
+            return
+        
+        book_index = self._books.setdefault(book_name, len(self._books))
+        if self._primary_book[game_index] < 0:
+            self._primary_book[game_index] = book_index
+        self._rows.append((
+            game_index, book_index,
+            moneyline_away, moneyline_home, spread_away, spread_home, total_over, total_under
+        ))
+    
+    def build(self) -> OddsTable:
+        """Pack everything added so far into an OddsTable, dropping games with no books."""
+        primary_book = np.array(self._primary_book, dtype=np.intp)
+        kept = np.flatnonzero(primary_book >= 0)
+        positions = np.full(len(self._games), -1, dtype=np.intp)
+        positions[kept] = np.arange(len(kept))
+        
+        shape = (len(kept), len(self._books), 2)
+        moneyline = np.full(shape, np.nan, dtype=PRICE_DTYPE)
+        spread = np.full(shape, np.nan, dtype=PRICE_DTYPE)
+        total = np.full(shape, np.nan, dtype=PRICE_DTYPE)
+        
+        if self._rows:
+            # None becomes NaN when the object array is cast to float
+            rows = np.array(self._rows, dtype=object)
+            game_indices = positions[rows[:, 0].astype(np.intp)]
+            book_indices = rows[:, 1].astype(np.intp)
+            prices = rows[:, 2:].astype(float)
+            moneyline[game_indices, book_indices] = prices[:, 0:2]
+            spread[game_indices, book_indices] = prices[:, 2:4]
+            total[game_indices, book_indices] = prices[:, 4:6]
+        
+        return OddsTable(
+            [self._games[i] for i in kept],
+            list(self._books),
+            moneyline,
+            spread,
+            total,
+            primary_book[kept]
+        )
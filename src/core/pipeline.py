@@ -2,32 +2,55 @@
 Main pipeline for processing prediction market and sportsbook data.
 """
 
+import re
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+import numpy as np
 from src.core.models import (
     Config, KalshiMarket, SportsbookOdds, MatchedGame, 
-    DiscrepancyRanking, NewsletterReport, NewsletterSection, Game
+    NewsletterReport, NewsletterSection, Game
 )
 from src.core.odds_math import (
-    american_to_implied_probability, calculate_discrepancy,
-    calculate_edge_vs_best, calculate_payout_ratio, calculate_expected_value
+    american_to_implied_probability_array, calculate_discrepancy_array,
+    calculate_edge_vs_best_array, calculate_payout_ratio_array,
+    calculate_expected_value_array, calculate_best_price_array,
+    calculate_consensus_array
 )
+from src.core.devig import devig
+from src.core.odds_table import OddsTable
+from src.core.ranking import DEFAULT_SECTIONS, RankingEngine
+from src.core.records import MarketRecord, as_kalshi_market
 from src.data.simple_robinhood_client import SimpleRobinhoodClient
 from src.data.odds_client import OddsClient
 from src.data.mapping import (
     create_game_from_market, match_games_within_timeframe,
-    is_seattle_team, find_team_match
+    is_seattle_team, canonical_team_name, find_team_match
 )
 from src.util.log import get_logger
 
 
+# (sport, unordered pair of canonical team names)
+OddsKey = Tuple[str, FrozenSet[str]]
+
+# Markets arrive as lightweight records from the clients, or as models
+Market = Union[KalshiMarket, MarketRecord]
+
+# Trailing "wins" / "to win ..." in an outcome description like "Seahawks win"
+_OUTCOME_SUFFIX_PATTERN = re.compile(r'\s+(?:to\s+)?wins?\b.*$', re.IGNORECASE)
+
+# market_id suffixes naming the side of the sportsbook game a market pays on
+_MARKET_ID_SIDES = {'-away-win': 'away', '-home-win': 'home'}
+
+
 class EdgeFinderPipeline:
     """Main pipeline for processing and comparing prediction markets vs sportsbooks."""
     
     def __init__(self, config: Config):
         self.config = config
-        self.robinhood_client = SimpleRobinhoodClient(config)
         self.odds_client = OddsClient(config)
+        self.robinhood_client = SimpleRobinhoodClient(config, self.odds_client)
+        # Newsletter sections; each scores and filters matched games its own way
+        self.section_specs = list(DEFAULT_SECTIONS)
         self.logger = get_logger()
     
     def run(self) -> NewsletterReport:
@@ -39,20 +62,18 @@ class EdgeFinderPipeline:
         """
         self.logger.info("Starting EdgeFinder pipeline")
         
-        # Fetch data
-        robinhood_markets = self.robinhood_client.get_prediction_markets()
-        sportsbook_odds = self.odds_client.get_odds()
+        # Fetch data; both consumers share one download per sport this run
+        with self.odds_client.fetch_context():
+            robinhood_markets = self.robinhood_client.get_prediction_markets()
+            sportsbook_odds = self.odds_client.get_odds_table()
         
-        self.logger.info(f"Fetched {len(robinhood_markets)} Robinhood prediction markets and {len(sportsbook_odds)} sportsbook odds")
+        self.logger.info(f"Fetched {len(robinhood_markets)} Robinhood prediction markets and {sportsbook_odds.num_rows} sportsbook odds across {len(sportsbook_odds)} games")
         
         # Process and match data
         matched_games = self._match_and_process_data(robinhood_markets, sportsbook_odds)
         
         self.logger.info(f"Matched {len(matched_games)} games")
         
-        # Generate rankings
-        rankings = self._generate_rankings(matched_games)
-        
         # Find Seattle pick
         seattle_pick = self._find_seattle_pick(matched_games)
         
@@ -60,11 +81,11 @@ class EdgeFinderPipeline:
         report = NewsletterReport(
             generated_at=datetime.utcnow(),
             timezone=self.config.timezone,
-            sections=self._create_sections(rankings),
+            sections=self._create_sections(matched_games),
             seattle_pick=seattle_pick,
             total_games=len(matched_games),
             total_markets=len(robinhood_markets),
-            total_books=len(sportsbook_odds)
+            total_books=sportsbook_odds.num_rows
         )
         
         self.logger.info("Pipeline completed successfully")
@@ -72,18 +93,17 @@ class EdgeFinderPipeline:
     
     def _match_and_process_data(
         self, 
-        robinhood_markets: List[KalshiMarket], 
-        sportsbook_odds: List[SportsbookOdds]
+        robinhood_markets: Sequence[Market], 
+        sportsbook_odds: Union[OddsTable, List[SportsbookOdds]]
     ) -> List[MatchedGame]:
         """Match Robinhood prediction markets with sportsbook odds and process."""
-        matched_games = []
+        candidates = []
+        
+        if not isinstance(sportsbook_odds, OddsTable):
+            sportsbook_odds = OddsTable.from_models(sportsbook_odds)
         
-        # Group sportsbook odds by game
-        odds_by_game = {}
-        for odds in sportsbook_odds:
-            if odds.game_id not in odds_by_game:
-                odds_by_game[odds.game_id] = []
-            odds_by_game[odds.game_id].append(odds)
+        # Index once so each market lookup is a single dict hit
+        odds_index = self._build_odds_index(sportsbook_odds)
         
         # Process each Robinhood prediction market
         for market in robinhood_markets:
@@ -105,26 +125,23 @@ class EdgeFinderPipeline:
                 self.logger.info(f"Created game: {game.away_team} @ {game.home_team} ({game.sport})")
                 
                 # Find matching sportsbook odds
-                matching_odds = self._find_matching_odds(game, odds_by_game)
+                matching_odds = self._find_matching_odds(game, odds_index)
                 
                 if not matching_odds:
                     self.logger.warning(f"No matching odds found for game: {game.away_team} @ {game.home_team}")
                     continue
                 
-                self.logger.info(f"Found {len(matching_odds)} matching odds")
-                
-                # Process the match
-                matched_game = self._process_match(game, market, matching_odds)
-                if matched_game:
-                    matched_games.append(matched_game)
-                    
+                self.logger.info(f"Found odds from {matching_odds.num_rows} books across {len(matching_odds)} matching games")
+                candidates.append((game, market, matching_odds))
+            
             except Exception as e:
                 self.logger.warning(f"Error processing market {market.market_id}: {e}")
                 continue
         
-        return matched_games
+        # Compute every match's numbers in one batch
+        return self._process_matches(candidates)
     
-    def _infer_sport_from_market(self, market: KalshiMarket) -> str:
+    def _infer_sport_from_market(self, market: Market) -> str:
         """Infer sport from market title."""
         title_lower = market.title.lower()
         
@@ -141,110 +158,200 @@ class EdgeFinderPipeline:
         else:
             return 'unknown'
     
-    def _find_matching_odds(self, game: Game, odds_by_game: dict) -> List[SportsbookOdds]:
-        """Find matching sportsbook odds for a game."""
-        matching_odds = []
+    def _odds_key(self, sport: str, team_a: str, team_b: str) -> OddsKey:
+        """Build the index key for a game, independent of home/away order."""
+        return sport, frozenset((
+            canonical_team_name(team_a, sport),
+            canonical_team_name(team_b, sport)
+        ))
+    
+    def _build_odds_index(self, odds_table: OddsTable) -> Dict[OddsKey, OddsTable]:
+        """
+        Index sportsbook odds by sport and unordered canonical team pair.
         
-        for game_id, odds_list in odds_by_game.items():
-            for odds in odds_list:
-                # Check if sport matches
-                if odds.sport != game.sport:
-                    continue
-                
-                # Check if teams match using flexible matching
-                away_match = (find_team_match(odds.away_team, game.sport) == game.away_team or
-                             find_team_match(game.away_team, game.sport) == find_team_match(odds.away_team, game.sport))
-                home_match = (find_team_match(odds.home_team, game.sport) == game.home_team or
-                             find_team_match(game.home_team, game.sport) == find_team_match(odds.home_team, game.sport))
-                
-                # Check both directions (away/home and home/away)
-                if ((away_match and home_match) or
-                    (find_team_match(odds.away_team, game.sport) == game.home_team and
-                     find_team_match(odds.home_team, game.sport) == game.away_team)):
-                    matching_odds.append(odds)
-                    break
+        Args:
+            odds_table: Sportsbook odds for every game
         
-        return matching_odds
+        Returns:
+            Mapping of OddsKey to the matching games, with all their books
+        """
+        game_indices: Dict[OddsKey, List[int]] = {}
+        
+        for game_index, odds_game in enumerate(odds_table):
+            key = self._odds_key(odds_game.sport, odds_game.away_team, odds_game.home_team)
+            game_indices.setdefault(key, []).append(game_index)
+        
+        return {key: odds_table.select(indices) for key, indices in game_indices.items()}
+    
+    def _find_matching_odds(self, game: Game, odds_index: Dict[OddsKey, OddsTable]) -> OddsTable:
+        """Find matching sportsbook odds for a game."""
+        key = self._odds_key(game.sport, game.away_team, game.home_team)
+        return odds_index.get(key) or OddsTable.empty()
     
     def _process_match(
         self, 
         game: Game, 
-        market: KalshiMarket, 
-        odds_list: List[SportsbookOdds]
+        market: Market, 
+        odds: Union[OddsTable, List[SportsbookOdds]]
     ) -> Optional[MatchedGame]:
         """Process a matched game and calculate discrepancies."""
-        try:
-            # Get prediction probability from Kalshi
-            prediction_prob = market.last_price
-            
-            # Convert sportsbook odds to probabilities
-            book_probs = []
-            for odds in odds_list:
-                if odds.moneyline_away is not None:
-                    prob_away = american_to_implied_probability(odds.moneyline_away)
-                    book_probs.append(prob_away)
-                if odds.moneyline_home is not None:
-                    prob_home = american_to_implied_probability(odds.moneyline_home)
-                    book_probs.append(prob_home)
-            
-            if not book_probs:
-                return None
-            
-            # Calculate statistics
-            min_book_prob = min(book_probs)
-            max_book_prob = max(book_probs)
-            avg_book_prob = sum(book_probs) / len(book_probs)
-            
-            # Calculate discrepancies
-            discrepancy_abs = calculate_discrepancy(prediction_prob, avg_book_prob)
-            discrepancy_vs_best = prediction_prob - min_book_prob
-            
-            # Calculate payout ratio
-            payout_ratio = calculate_payout_ratio(prediction_prob)
-            
-            # Calculate expected value
-            expected_value = calculate_expected_value(prediction_prob, avg_book_prob)
-            
-            return MatchedGame(
-                game=game,
-                kalshi_market=market,  # This is actually a Robinhood market now
-                sportsbook_odds=odds_list,
-                prediction_prob=prediction_prob,
-                book_probs=book_probs,
-                min_book_prob=min_book_prob,
-                avg_book_prob=avg_book_prob,
-                max_book_prob=max_book_prob,
-                discrepancy_abs=discrepancy_abs,
-                discrepancy_vs_best=discrepancy_vs_best,
-                volume=market.volume,
-                payout_ratio=payout_ratio,
-                expected_value=expected_value
-            )
+        if not isinstance(odds, OddsTable):
+            odds = OddsTable.from_models(odds)
+        matched_games = self._process_matches([(game, market, odds)])
+        return matched_games[0] if matched_games else None
+    
+    def _resolve_selection(self, game: Game, market: Market, odds_table: OddsTable) -> str:
+        """
+        Find the canonical team a market pays out on.
+        
+        Tries the outcome description ("Seahawks win"), then a -home-win /
+        -away-win market_id suffix, then the first team in the title. A NO
+        position pays out on the other team.
+        
+        Args:
+            game: Game parsed from the market title
+            market: Prediction market
+            odds_table: Matching sportsbook odds (at least one game)
+        
+        Returns:
+            Canonical team name of the selection
+        """
+        sport = game.sport
+        odds_game = odds_table.games[0]
+        away = canonical_team_name(odds_game.away_team, sport)
+        home = canonical_team_name(odds_game.home_team, sport)
+        
+        selection = None
+        described_team = _OUTCOME_SUFFIX_PATTERN.sub('', market.outcome_description or '').strip()
+        if described_team:
+            described_match = find_team_match(described_team, sport)
+            if described_match in (away, home):
+                selection = described_match
+        
+        if selection is None:
+            for suffix, side in _MARKET_ID_SIDES.items():
+                if market.market_id.endswith(suffix):
+                    selection = away if side == 'away' else home
+                    break
+        
+        if selection is None:
+            selection = canonical_team_name(game.away_team, sport)
+        
+        if market.market_side.upper() == 'NO':
+            selection = home if selection == away else away
+        
+        return selection
+    
+    def _build_price_matrix(
+        self,
+        odds_tables: List[OddsTable],
+        selections: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """
+        Lay out moneyline prices as a games x books x sides matrix.
+        
+        Each matched game's book axis holds every book row of its matching
+        odds. With selections, side 0 is the selected team and side 1 its
+        opponent, whatever the home/away order of each sportsbook game;
+        without, side 0 is the away team and side 1 the home team. Games with
+        fewer books are padded with NaN, as are missing prices.
+        """
+        rows_per_game = []
+        for i, odds_table in enumerate(odds_tables):
+            if selections is None:
+                rows_per_game.append(odds_table.moneyline_rows())
+                continue
             
-        except Exception as e:
-            self.logger.warning(f"Error processing match: {e}")
-            return None
+            oriented_rows = []
+            for game_index, odds_game in enumerate(odds_table):
+                rows = odds_table.moneyline_rows([game_index])
+                if canonical_team_name(odds_game.home_team, odds_game.sport) == selections[i]:
+                    rows = rows[:, ::-1]
+                oriented_rows.append(rows)
+            rows_per_game.append(np.concatenate(oriented_rows) if oriented_rows else np.empty((0, 2)))
+        
+        max_books = max((len(rows) for rows in rows_per_game), default=0)
+        prices = np.full((len(odds_tables), max_books, 2), np.nan)
+        
+        for game_index, rows in enumerate(rows_per_game):
+            prices[game_index, :len(rows)] = rows
+        
+        return prices
     
-    def _generate_rankings(self, matched_games: List[MatchedGame]) -> List[DiscrepancyRanking]:
-        """Generate rankings from matched games."""
-        rankings = []
-        
-        for i, game in enumerate(matched_games):
-            ranking = DiscrepancyRanking(
-                rank=i + 1,
-                matched_game=game,
-                discrepancy_score=game.discrepancy_abs
-            )
-            rankings.append(ranking)
-        
-        # Sort by discrepancy (descending)
-        rankings.sort(key=lambda x: x.discrepancy_score, reverse=True)
-        
-        # Update ranks
-        for i, ranking in enumerate(rankings):
-            ranking.rank = i + 1
-        
-        return rankings
+    def _process_matches(
+        self,
+        candidates: List[Tuple[Game, Market, OddsTable]]
+    ) -> List[MatchedGame]:
+        """
+        Calculate discrepancies for all matched games in one vectorized pass.
+        
+        Book numbers are taken per side of a games x books x sides matrix, so
+        each market is compared only with the prices for the team it pays
+        out on.
+        
+        Args:
+            candidates: (game, market, matching odds) for each matched market
+        
+        Returns:
+            MatchedGame for every candidate with a moneyline price on its selection
+        """
+        candidates = [candidate for candidate in candidates if len(candidate[2])]
+        if not candidates:
+            return []
+        
+        # Get prediction probabilities and fair (de-vigged) sportsbook probabilities per side
+        selections = [self._resolve_selection(game, market, odds_table) for game, market, odds_table in candidates]
+        prediction_probs = np.array([market.last_price for _, market, _ in candidates], dtype=float)
+        price_matrix = self._build_price_matrix([odds_table for _, _, odds_table in candidates], selections)
+        book_prob_matrix = devig(american_to_implied_probability_array(price_matrix), self.config.devig_method)
+        
+        # Best price, consensus and spread for both sides at once (books on axis 1)
+        min_book_probs, avg_book_probs, max_book_probs = calculate_edge_vs_best_array(book_prob_matrix, axis=1)
+        consensus_probs = calculate_consensus_array(book_prob_matrix, axis=1)
+        best_prices = calculate_best_price_array(price_matrix, axis=1)
+        book_spreads = max_book_probs - min_book_probs
+        has_prices = np.any(~np.isnan(book_prob_matrix[:, :, 0]), axis=1)
+        
+        # Calculate discrepancies, payout ratios and expected values against the selection
+        discrepancies_abs = calculate_discrepancy_array(prediction_probs, avg_book_probs[:, 0])
+        discrepancies_vs_best = prediction_probs - min_book_probs[:, 0]
+        payout_ratios = calculate_payout_ratio_array(prediction_probs)
+        expected_values = calculate_expected_value_array(prediction_probs, avg_book_probs[:, 0])
+        
+        matched_games = []
+        for i, (game, market, odds_table) in enumerate(candidates):
+            if not has_prices[i]:
+                continue
+            
+            try:
+                book_probs = book_prob_matrix[i, :, 0]
+                matched_games.append(MatchedGame(
+                    game=game,
+                    kalshi_market=as_kalshi_market(market),  # This is actually a Robinhood market now
+                    sportsbook_odds=odds_table.to_models(),
+                    prediction_prob=float(prediction_probs[i]),
+                    book_probs=book_probs[~np.isnan(book_probs)].tolist(),
+                    min_book_prob=float(min_book_probs[i, 0]),
+                    avg_book_prob=float(avg_book_probs[i, 0]),
+                    max_book_prob=float(max_book_probs[i, 0]),
+                    discrepancy_abs=float(discrepancies_abs[i]),
+                    discrepancy_vs_best=float(discrepancies_vs_best[i]),
+                    volume=market.volume,
+                    payout_ratio=float(payout_ratios[i]),
+                    expected_value=float(expected_values[i]),
+                    selection=selections[i],
+                    best_price=_optional_price(best_prices[i, 0]),
+                    consensus_prob=float(consensus_probs[i, 0]),
+                    book_spread=float(book_spreads[i, 0]),
+                    opponent_best_price=_optional_price(best_prices[i, 1]),
+                    opponent_consensus_prob=float(consensus_probs[i, 1]),
+                    opponent_book_spread=float(book_spreads[i, 1])
+                ))
+            except Exception as e:
+                self.logger.warning(f"Error processing match: {e}")
+                continue
+        
+        return matched_games
     
     def _find_seattle_pick(self, matched_games: List[MatchedGame]) -> Optional[MatchedGame]:
         """Find the best Seattle team pick."""
@@ -261,38 +368,11 @@ class EdgeFinderPipeline:
         # Return the one with highest volume or biggest discrepancy
         return max(seattle_games, key=lambda g: g.volume * g.discrepancy_abs)
     
-    def _create_sections(self, rankings: List[DiscrepancyRanking]) -> List[NewsletterSection]:
-        """Create newsletter sections."""
-        sections = []
-        
-        # Best Robinhood Opportunities
-        biggest_discrepancies = rankings[:self.config.top_n]
-        sections.append(NewsletterSection(
-            title='Best Robinhood Opportunities',
-            description='Games where Robinhood prediction markets differ most from sportsbooks',
-            rankings=biggest_discrepancies
-        ))
-        
-        # Most Popular on Robinhood
-        volume_rankings = sorted(rankings, key=lambda x: x.matched_game.volume, reverse=True)
-        most_bet = volume_rankings[:self.config.top_n]
-        sections.append(NewsletterSection(
-            title='Most Popular on Robinhood',
-            description='Games with the highest Robinhood prediction market volume',
-            rankings=most_bet
-        ))
-        
-        # Highest Payout Potential on Robinhood
-        payout_rankings = [
-            r for r in rankings 
-            if r.matched_game.payout_ratio >= 2.0  # Lower threshold for more opportunities
-        ]
-        payout_rankings.sort(key=lambda x: x.matched_game.volume, reverse=True)
-        highest_payout = payout_rankings[:self.config.top_n]
-        sections.append(NewsletterSection(
-            title='Highest Payout Potential on Robinhood',
-            description='Robinhood prediction markets with the best payout ratios',
-            rankings=highest_payout
-        ))
-        
-        return sections
+    def _create_sections(self, matched_games: List[MatchedGame]) -> List[NewsletterSection]:
+        """Create newsletter sections, selecting only the top_n games each section shows."""
+        return RankingEngine(self.config.top_n, self.section_specs).build_sections(matched_games)
+
+
+def _optional_price(price: float) -> Optional[int]:
+    """Convert a best-price cell to American odds (None when no book priced it)."""
+    return None if np.isnan(price) else int(price)
@@ -0,0 +1,173 @@
+"""
+Top-K ranking of matched games into newsletter sections.
+
+Each section only shows config.top_n rows, so instead of fully sorting every
+matched game once per section, scores are computed once into arrays and each
+section selects its top K with a partition followed by a sort of just the
+survivors: O(n + k log k) per section rather than O(n log n).
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from src.core.models import DiscrepancyRanking, MatchedGame, NewsletterSection
+
+
+# Column name -> one value per matched game
+ScoreColumns = Dict[str, np.ndarray]
+
+
+class SectionSpec(NamedTuple):
+    """
+    A newsletter section defined by how it scores and filters matched games.
+    
+    score returns sort keys, most significant first, where higher is better;
+    remaining ties keep matched-game order. include returns a boolean mask of
+    eligible games (all games when omitted).
+    """
+    title: str
+    description: str
+    score: Callable[[ScoreColumns], Sequence[np.ndarray]]
+    include: Optional[Callable[[ScoreColumns], np.ndarray]] = None
+
+
+DEFAULT_SECTIONS = (
+    SectionSpec(
+        title='Best Robinhood Opportunities',
+        description='Games where Robinhood prediction markets differ most from sportsbooks',
+        score=lambda columns: [columns['discrepancy']]
+    ),
+    SectionSpec(
+        title='Most Popular on Robinhood',
+        description='Games with the highest Robinhood prediction market volume',
+        score=lambda columns: [columns['volume'], columns['discrepancy']]
+    ),
+    SectionSpec(
+        title='Highest Payout Potential on Robinhood',
+        description='Robinhood prediction markets with the best payout ratios',
+        score=lambda columns: [columns['volume'], columns['discrepancy']],
+        include=lambda columns: columns['payout_ratio'] >= 2.0  # Lower threshold for more opportunities
+    ),
+)
+
+
+def score_columns(matched_games: Sequence[MatchedGame]) -> ScoreColumns:
+    """
+    Extract the values sections rank on into arrays, once per run.
+    
+    Args:
+        matched_games: Matched games to rank
+    
+    Returns:
+        Mapping of column name to a float array with one entry per game
+    """
+    return {
+        'discrepancy': np.array([g.discrepancy_abs for g in matched_games], dtype=float),
+        'discrepancy_vs_best': np.array([g.discrepancy_vs_best for g in matched_games], dtype=float),
+        'volume': np.array([g.volume for g in matched_games], dtype=float),
+        'payout_ratio': np.array([g.payout_ratio for g in matched_games], dtype=float),
+        'expected_value': np.array([g.expected_value for g in matched_games], dtype=float),
+    }
+
+
+def top_k_indices(keys: Sequence[np.ndarray], k: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Select the k best items by several sort keys without a full sort.
+    
+    Ordering matches a stable descending sort on keys[0], then keys[1], ...,
+    then ascending position.
+    
+    Args:
+        keys: Sort keys, most significant first; higher is better, NaN worst
+        k: Number of items to return
+        mask: Optional boolean array of eligible items
+    
+    Returns:
+        Positions of the selected items, best first
+    """
+    keys = [np.where(np.isnan(key), -np.inf, key) for key in (np.asarray(key, dtype=float) for key in keys)]
+    candidates = np.arange(len(keys[0])) if mask is None else np.flatnonzero(mask)
+    if k <= 0 or not len(candidates):
+        return candidates[:0]
+    
+    # Anything below the k-th best primary key cannot make the cut
+    primary = keys[0][candidates]
+    if k < len(candidates):
+        kth_best = np.partition(primary, len(primary) - k)[len(primary) - k]
+        candidates = candidates[primary >= kth_best]
+    
+    # np.lexsort sorts by its last key first and is stable, so ties keep position order
+    order = np.lexsort([-key[candidates] for key in reversed(keys)])
+    return candidates[order][:k]
+
+
+def descending_ranks(scores: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Find the 1-based rank some items would get in a stable descending sort.
+    
+    Counts the items ranked ahead of each one instead of sorting everything.
+    
+    Args:
+        scores: Score of every item
+        indices: Positions to rank
+    
+    Returns:
+        Rank of each position in indices
+    """
+    scores = np.where(np.isnan(scores), -np.inf, np.asarray(scores, dtype=float))
+    selected = scores[indices][:, None]
+    ahead = (scores[None, :] > selected) | (
+        (scores[None, :] == selected) & (np.arange(len(scores))[None, :] < indices[:, None])
+    )
+    ranks: np.ndarray = ahead.sum(axis=1) + 1
+    return ranks
+
+
+class RankingEngine:
+    """Builds newsletter sections from matched games using top-K selection."""
+    
+    def __init__(self, top_n: int, sections: Sequence[SectionSpec] = DEFAULT_SECTIONS):
+        self.top_n = top_n
+        self.sections = list(sections)
+    
+    def build_sections(self, matched_games: List[MatchedGame]) -> List[NewsletterSection]:
+        """
+        Rank matched games into sections.
+        
+        Every ranking's rank is the game's position by discrepancy across all
+        matched games, and a game appearing in several sections shares one
+        DiscrepancyRanking.
+        
+        Args:
+            matched_games: Matched games to rank
+        
+        Returns:
+            One NewsletterSection per section spec, in spec order
+        """
+        columns = score_columns(matched_games)
+        selections = []
+        for spec in self.sections:
+            mask = spec.include(columns) if spec.include else None
+            selections.append(top_k_indices(spec.score(columns), self.top_n, mask))
+        
+        # Build each selected game's ranking once, ranked by discrepancy
+        selected = np.unique(np.concatenate(selections)) if selections else np.array([], dtype=np.intp)
+        ranks = descending_ranks(columns['discrepancy'], selected) if len(selected) else np.array([], dtype=np.intp)
+        rankings = {
+            int(index): DiscrepancyRanking(
+                rank=int(rank),
+                matched_game=matched_games[index],
+                discrepancy_score=matched_games[index].discrepancy_abs
+            )
+            for index, rank in zip(selected, ranks)
+        }
+        
+        return [
+            NewsletterSection(
+                title=spec.title,
+                description=spec.description,
+                rankings=[rankings[int(index)] for index in indices]
+            )
+            for spec, indices in zip(self.sections, selections)
+        ]
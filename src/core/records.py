@@ -0,0 +1,78 @@
+"""
+Lightweight internal records for the data hot path.
+
+Pydantic models validate every field on construction, which is a measurable
+share of run time when clients build thousands of rows per refresh. These
+slotted dataclasses carry the same fields as their models without validation;
+they are converted to models (and validated) only at the API and
+serialization boundary, e.g. when a MatchedGame is built.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+from src.core.models import KalshiMarket, SportsbookOdds
+
+
+@dataclass(slots=True, kw_only=True)
+class MarketRecord:
+    """Prediction market row; same fields as KalshiMarket."""
+    market_id: str
+    title: str
+    event_time: datetime
+    last_price: float
+    volume: int
+    open_interest: Optional[int] = None
+    market_side: str
+    outcome_description: str
+    
+    def to_model(self) -> KalshiMarket:
+        """Validate into a KalshiMarket."""
+        return KalshiMarket(**_fields(self))
+    
+    @classmethod
+    def from_model(cls, market: KalshiMarket) -> 'MarketRecord':
+        """Create a record from an already validated KalshiMarket."""
+        return cls(**market.__dict__)
+
+
+@dataclass(slots=True, kw_only=True)
+class OddsRecord:
+    """Sportsbook odds row for one game and book; same fields as SportsbookOdds."""
+    game_id: str
+    sport: str
+    away_team: str
+    home_team: str
+    start_time: datetime
+    book_name: str
+    moneyline_away: Optional[int] = None
+    moneyline_home: Optional[int] = None
+    spread_away: Optional[float] = None
+    spread_home: Optional[float] = None
+    total_over: Optional[float] = None
+    total_under: Optional[float] = None
+    
+    def to_model(self) -> SportsbookOdds:
+        """Validate into a SportsbookOdds."""
+        return SportsbookOdds(**_fields(self))
+    
+    @classmethod
+    def from_model(cls, odds: SportsbookOdds) -> 'OddsRecord':
+        """Create a record from an already validated SportsbookOdds."""
+        return cls(**odds.__dict__)
+
+
+def _fields(record: Union[MarketRecord, OddsRecord]) -> Dict[str, Any]:
+    """Get a record's fields as keyword arguments."""
+    return {name: getattr(record, name) for name in record.__slots__}
+
+
+def as_kalshi_market(market: Union[MarketRecord, KalshiMarket]) -> KalshiMarket:
+    """Get a validated KalshiMarket from either a record or a model."""
+    return market.to_model() if isinstance(market, MarketRecord) else market
+
+
+def as_sportsbook_odds(odds: Union[OddsRecord, SportsbookOdds]) -> SportsbookOdds:
+    """Get a validated SportsbookOdds from either a record or a model."""
+    return odds.to_model() if isinstance(odds, OddsRecord) else odds
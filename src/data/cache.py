@@ -1,71 +1,582 @@
 """
 Simple in-process cache for API responses.
+
+Entries live in an OrderedDict kept in least-recently-used order, so hits and
+evictions are O(1). The cache is bounded by both an entry count and an
+approximate byte budget. Expired entries are found through a min-heap of
+expiry times and removed in small batches, so no sweep holds the lock for
+more than a bounded amount of work.
+
+get_or_compute adds single-flight computation: one caller computes a missing
+key while concurrent callers for it wait on the same result. Entries set with
+a stale_ttl keep serving their old value for that long past expiry while one
+background refresh runs. aget_or_compute does the same for coroutine
+functions on an event loop.
+
+An optional backing DiskCache makes this the first of two tiers: byte values
+computed through get_or_compute are written through to disk, and a memory
+miss is served from disk (fresh or stale) before anything is recomputed, so
+payloads survive restarts.
 """
 
+import asyncio
+import heapq
+import sys
+import threading
 import time
-from typing import Any, Optional, Dict
-from threading import Lock
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple, Union
+
+from src.core.models import Config
+from src.data.disk_cache import DiskCache, open_disk_cache
+
+
+# A fixed TTL in seconds, or a policy computing one from the freshly computed value
+TTL = Union[int, float, Callable[[Any], float], None]
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached value with its expiry times and estimated size."""
+    value: Any
+    expires_at: float
+    stale_until: float
+    size: int
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the memory held by a cached value.
+    
+    Byte and text payloads (the common case for API responses) are measured by
+    length; anything else falls back to sys.getsizeof, which does not follow
+    references.
+    
+    Args:
+        value: Value to measure
+    
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8', errors='ignore'))
+    return sys.getsizeof(value)
 
 
 class SimpleCache:
-    """Simple in-process cache with TTL support."""
+    """Bounded in-process LRU cache with TTL support."""
     
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
+    def __init__(
+        self,
+        default_ttl: int = 300,  # 5 minutes default
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_batch: int = 256,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+        backing: Optional[DiskCache] = None
+    ):
+        """
+        Args:
+            default_ttl: Seconds an entry lives when set() gets no ttl
+            max_entries: Maximum number of entries kept
+            max_bytes: Approximate byte budget across all entries
+            sweep_batch: Maximum expired entries removed per lock acquisition
+            sizeof: Function estimating a value's size in bytes
+            clock: Monotonic time source, in seconds
+            backing: Persistent second tier for byte values
+        """
         self.default_ttl = default_ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_batch = sweep_batch
+        self.sizeof = sizeof
+        self.clock = clock
+        self.backing = backing
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Superseded heap whose current items are being moved back in batches
+        self._compacting: List[Tuple[float, str]] = []
+        self._compact_pos = 0
+        self._inflight: Dict[str, Future] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self.restored = 0
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
         with self._lock:
-            if key not in self._cache:
-                return None
-            
-            entry = self._cache[key]
-            if time.time() > entry['expires_at']:
-                del self._cache[key]
+            now = self.clock()
+            entry = self._live_entry(key, now)
+            if entry is None or now > entry.expires_at:
+                self.misses += 1
                 return None
             
-            return entry['value']
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry.value
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache with TTL."""
-        ttl = ttl or self.default_ttl
-        expires_at = time.time() + ttl
+    def get_or_compute(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        ttl: TTL = None,
+        stale_ttl: float = 0
+    ) -> Any:
+        """
+        Get a cached value, computing it at most once at a time per key.
+        
+        On a miss the first caller runs fn and caches the result; concurrent
+        callers for the same key wait for it and share its result or
+        exception. Exceptions are not cached. Within stale_ttl seconds after
+        expiry the old value is returned immediately while a single
+        background thread recomputes it. With a backing tier, a miss is first
+        looked up on disk and computed byte values are written through.
+        
+        Args:
+            key: Cache key
+            fn: Zero-argument callable producing the value
+            ttl: Seconds the value is fresh (defaults to default_ttl), or a
+                callable taking the computed value and returning them
+            stale_ttl: Seconds past expiry the value may still be served
+        
+        Returns:
+            Cached, stale or freshly computed value
+        """
+        entry, future, is_owner = self._claim(key)
+        
+        if entry is not None:
+            if future is not None:
+                self._refresh_in_background(key, fn, ttl, stale_ttl, future)
+            return entry.value
+        
+        # A miss always comes with an in-flight future
+        assert future is not None
+        if not is_owner:
+            return future.result()
+        
+        restored = self._load_backing(key)
+        if restored is None:
+            self._compute(key, fn, ttl, stale_ttl, future)
+            return future.result()
+        
+        value, fresh_for, stale_for = restored
+        if self._restore(key, value, fresh_for, stale_for, future):
+            # Stale on disk: serve it now; callers arriving meanwhile wait on the refresh
+            self._refresh_in_background(key, fn, ttl, stale_ttl, future)
+        return value
+    
+    async def aget_or_compute(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        ttl: TTL = None,
+        stale_ttl: float = 0
+    ) -> Any:
+        """
+        Async counterpart of get_or_compute; fn returns an awaitable.
+        
+        Computation and background refreshes run on the caller's event loop,
+        and waiting callers await the owner's result instead of blocking.
+        Single flight is shared with get_or_compute, so sync and async
+        callers of one key never compute it twice at once.
+        """
+        entry, future, is_owner = self._claim(key)
+        
+        if entry is not None:
+            if future is not None:
+                self._spawn(self._acompute(key, fn, ttl, stale_ttl, future, background=True))
+            return entry.value
+        
+        assert future is not None
+        if not is_owner:
+            return await asyncio.wrap_future(future)
+        
+        restored = await asyncio.to_thread(self._load_backing, key)
+        if restored is None:
+            await self._acompute(key, fn, ttl, stale_ttl, future)
+            return future.result()
+        
+        value, fresh_for, stale_for = restored
+        if self._restore(key, value, fresh_for, stale_for, future):
+            self._spawn(self._acompute(key, fn, ttl, stale_ttl, future, background=True))
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, stale_ttl: float = 0) -> None:
+        """Set value in cache with TTL, evicting least recently used entries to stay in budget."""
+        self._store(key, value, ttl or self.default_ttl, stale_ttl)
+    
+    def _store(self, key: str, value: Any, ttl: float, stale_ttl: float) -> None:
+        """Insert an entry expiring ttl seconds from now (possibly already past) and enforce the budget."""
+        size = self.sizeof(value)
         
         with self._lock:
-            self._cache[key] = {
-                'value': value,
-                'expires_at': expires_at
-            }
+            previous = self._cache.get(key)
+            self._remove(key)
+            
+            # A value larger than the whole budget would flush everything else for nothing
+            if size > self.max_bytes:
+                self.rejections += 1
+                return
+            
+            expires_at = self.clock() + ttl
+            stale_until = expires_at + max(stale_ttl, 0)
+            self._cache[key] = _CacheEntry(value, expires_at, stale_until, size)
+            self._bytes += size
+            # A live entry's heap item stays valid for a rewrite expiring at the same time
+            if previous is None or previous.stale_until != stale_until:
+                heapq.heappush(self._expiry_heap, (stale_until, key))
+            self._compact_heap()
+            
+            # Reclaim a bounded batch of expired entries before evicting live ones
+            self._sweep_batch(self.clock())
+            self._evict_over_budget()
+    
+    def resize(self, max_entries: int, max_bytes: int) -> None:
+        """Change the entry and byte limits, evicting least recently used entries over them."""
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict_over_budget()
+    
+    def _evict_over_budget(self) -> None:
+        """Evict least recently used entries until both limits hold. Caller holds the lock."""
+        while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
     
     def delete(self, key: str) -> None:
         """Delete key from cache."""
         with self._lock:
-            self._cache.pop(key, None)
+            self._remove(key)
     
     def clear(self) -> None:
-        """Clear all cache entries."""
+        """Clear all cache entries (counters are kept)."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._compacting = []
+            self._bytes = 0
     
-    def cleanup_expired(self) -> None:
-        """Remove expired entries."""
-        current_time = time.time()
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired entries.
         
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if current_time > entry['expires_at']
-            ]
-            for key in expired_keys:
-                del self._cache[key]
+        Work is done in batches of sweep_batch, releasing the lock between
+        batches so readers are never blocked for a full scan. A heap
+        compaction in progress is finished the same way.
+        
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        while True:
+            with self._lock:
+                compacting = self._compact_heap()
+                popped, expired = self._sweep_batch(self.clock())
+            removed += expired
+            if popped < self.sweep_batch and not compacting:
+                return removed
+    
+    def start_sweeper(self, interval: float = 30.0) -> None:
+        """Run cleanup_expired every interval seconds on a daemon thread."""
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        
+        self._sweeper_stop.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop, args=(interval,), name="cache-sweeper", daemon=True
+        )
+        self._sweeper.start()
+    
+    def stop_sweeper(self, timeout: Optional[float] = None) -> None:
+        """Stop the background sweeper thread, if running."""
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout)
+            self._sweeper = None
     
     def size(self) -> int:
         """Get number of cache entries."""
         with self._lock:
             return len(self._cache)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss, eviction and expiry counters plus current usage."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'rejections': self.rejections,
+                'stale_hits': self.stale_hits,
+                'coalesced': self.coalesced,
+                'restored': self.restored,
+                'size': len(self._cache),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+    
+    def _live_entry(self, key: str, now: float) -> Optional[_CacheEntry]:
+        """Get an entry that is fresh or still servable stale, dropping it otherwise. Caller holds the lock."""
+        entry = self._cache.get(key)
+        if entry is not None and now > entry.stale_until:
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return entry
+    
+    def _claim(self, key: str) -> Tuple[Optional[_CacheEntry], Optional[Future], bool]:
+        """
+        Look key up and claim the right to compute it.
+        
+        Returns:
+            The live entry (fresh or stale) or None; the in-flight future the
+            caller must resolve (a stale entry's refresh, or a miss it owns)
+            or wait on (a miss someone else owns); and whether the caller
+            owns that future
+        """
+        with self._lock:
+            now = self.clock()
+            entry = self._live_entry(key, now)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                if now <= entry.expires_at:
+                    self.hits += 1
+                    return entry, None, False
+                
+                # Stale: serve the old value and make sure one refresh is running
+                self.stale_hits += 1
+                if key in self._inflight:
+                    return entry, None, False
+                refresh = self._inflight[key] = Future()
+                return entry, refresh, True
+            
+            self.misses += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+            future = self._inflight[key] = Future()
+            return None, future, True
+    
+    def _restore(self, key: str, value: Any, fresh_for: float, stale_for: float, future: Future) -> bool:
+        """
+        Cache a value loaded from the backing tier.
+        
+        Returns:
+            Whether it is stale and the caller must refresh it, resolving future
+        """
+        self._store(key, value, fresh_for, stale_for - fresh_for)
+        if fresh_for <= 0:
+            return True
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return False
+    
+    def _compute(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        ttl: TTL,
+        stale_ttl: float,
+        future: Future,
+        background: bool = False
+    ) -> None:
+        """Run fn for key, cache its value and resolve the in-flight future."""
+        try:
+            value = fn()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            if background:
+                print(f"⚠️ Background refresh failed for {key}: {e}")
+            return
+        
+        self._complete(key, value, ttl, stale_ttl, future)
+    
+    async def _acompute(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        ttl: TTL,
+        stale_ttl: float,
+        future: Future,
+        background: bool = False
+    ) -> None:
+        """Async counterpart of _compute; the TTL policy and disk write run in a worker thread."""
+        try:
+            value = await fn()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            if background:
+                print(f"⚠️ Background refresh failed for {key}: {e}")
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        
+        await asyncio.to_thread(self._complete, key, value, ttl, stale_ttl, future)
+    
+    def _complete(self, key: str, value: Any, ttl: TTL, stale_ttl: float, future: Future) -> None:
+        """Cache a computed value and resolve its in-flight future."""
+        # Cache before leaving the in-flight table so no caller can miss in between
+        fresh_for = ttl(value) if callable(ttl) else ttl
+        fresh_for = fresh_for or self.default_ttl
+        self._store(key, value, fresh_for, stale_ttl)
+        self._store_backing(key, value, fresh_for, stale_ttl)
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_result(value)
+    
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a background refresh on the current event loop, keeping a reference until it ends."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def _refresh_in_background(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        ttl: TTL,
+        stale_ttl: float,
+        future: Future
+    ) -> None:
+        """Recompute key on a daemon thread, resolving future when done."""
+        threading.Thread(
+            target=self._compute, args=(key, fn, ttl, stale_ttl, future, True),
+            name="cache-refresh", daemon=True
+        ).start()
+    
+    def _load_backing(self, key: str) -> Optional[Tuple[Any, float, float]]:
+        """Look key up in the backing tier; disk errors are treated as misses."""
+        if self.backing is None:
+            return None
+        try:
+            restored = self.backing.get_with_ttl(key)
+        except Exception as e:
+            print(f"⚠️ Disk cache read failed for {key}: {e}")
+            return None
+        if restored is not None:
+            with self._lock:
+                self.restored += 1
+        return restored
+    
+    def _store_backing(self, key: str, value: Any, ttl: float, stale_ttl: float) -> None:
+        """Write a byte value through to the backing tier; disk errors are logged and ignored."""
+        if self.backing is None or not isinstance(value, bytes):
+            return
+        try:
+            self.backing.set(key, value, ttl, stale_ttl)
+        except Exception as e:
+            print(f"⚠️ Disk cache write failed for {key}: {e}")
+    
+    def _remove(self, key: str) -> None:
+        """Drop an entry; its heap item goes stale and is skipped by the sweep. Caller holds the lock."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+    
+    def _sweep_batch(self, now: float) -> Tuple[int, int]:
+        """
+        Pop up to sweep_batch due heap items, removing entries that are still expired.
+        
+        Heap items left behind by overwritten, deleted or evicted keys are
+        discarded as they come due. Caller holds the lock.
+        
+        Returns:
+            Number of heap items popped and number of entries removed
+        """
+        heap = self._expiry_heap
+        popped = 0
+        expired = 0
+        while heap and heap[0][0] < now and popped < self.sweep_batch:
+            due, key = heapq.heappop(heap)
+            popped += 1
+            entry = self._cache.get(key)
+            if entry is not None and entry.stale_until == due:
+                self._remove(key)
+                expired += 1
+        self.expirations += expired
+        return popped, expired
+    
+    def _compact_heap(self) -> bool:
+        """
+        Drop stale expiry heap items, sweep_batch at a time, once they dominate the heap.
+        
+        Rewriting a hot key pushes a new heap item each time, so without this
+        the heap would grow with the write rate rather than the entry count.
+        An oversized heap is set aside in O(1) and a fresh one started; each
+        call then moves at most sweep_batch of the old items that still match
+        their entry into it. Items still waiting to move are only swept
+        late, and reads check expiry themselves. Caller holds the lock.
+        
+        Returns:
+            Whether a compaction is still in progress
+        """
+        if not self._compacting:
+            if len(self._expiry_heap) <= 2 * len(self._cache) + self.sweep_batch:
+                return False
+            self._compacting, self._expiry_heap = self._expiry_heap, []
+            self._compact_pos = 0
+        
+        end = min(self._compact_pos + self.sweep_batch, len(self._compacting))
+        for index in range(self._compact_pos, end):
+            due, key = self._compacting[index]
+            entry = self._cache.get(key)
+            if entry is not None and entry.stale_until == due:
+                heapq.heappush(self._expiry_heap, (due, key))
+        self._compact_pos = end
+        
+        if end == len(self._compacting):
+            self._compacting = []
+        return bool(self._compacting)
+    
+    def _sweep_loop(self, interval: float) -> None:
+        """Sweeper thread body."""
+        while not self._sweeper_stop.wait(interval):
+            self.cleanup_expired()
 
 
 # Global cache instance
 cache = SimpleCache()
+
+
+def configure_shared_cache(config: Config) -> Optional[DiskCache]:
+    """
+    Apply the configured memory limits and attach the disk tier to the global cache.
+    
+    Call once at startup; later calls re-apply the limits but keep the tier
+    already attached.
+    
+    Args:
+        config: Application configuration
+    
+    Returns:
+        The backing DiskCache, or None when disk caching is disabled
+    """
+    cache.resize(config.memory_cache_max_entries, config.memory_cache_max_mb * 1024 * 1024)
+    if cache.backing is None:
+        cache.backing = open_disk_cache(config)
+    return cache.backing
@@ -0,0 +1,55 @@
+"""
+Request coalescing for upstream API calls.
+"""
+
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Hashable, TypeVar, cast
+
+
+T = TypeVar('T')
+
+
+class RequestCoalescer:
+    """
+    Shares one call per key among all callers for the coalescer's lifetime.
+    
+    The first caller for a key runs the fetch; concurrent and later callers
+    for the same key wait on and reuse that result (or exception) instead of
+    issuing their own request. Create a fresh coalescer per pipeline run so
+    results never outlive the run that fetched them.
+    """
+    
+    def __init__(self) -> None:
+        self._results: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+    
+    def get(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """
+        Get the result for key, running fetch only if no caller has yet.
+        
+        Args:
+            key: Identity of the request (e.g. sport, markets, regions)
+            fetch: Zero-argument callable performing the request
+            
+        Returns:
+            The shared result of fetch
+        """
+        with self._lock:
+            future = self._results.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._results[key] = future
+        
+        if is_owner:
+            try:
+                future.set_result(fetch())
+            except BaseException as e:
+                future.set_exception(e)
+        
+        return cast(T, future.result())
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
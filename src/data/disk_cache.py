@@ -0,0 +1,202 @@
+"""
+Persistent SQLite-backed cache tier for upstream API responses.
+
+Sits behind SimpleCache so recent payloads and the last report snapshot
+survive restarts. Every write is a single SQLite transaction in WAL mode, so
+a crash mid-write leaves the previous row intact and readers never see a
+partial value. The file is disposable: a corrupt database is recreated.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+from src.core.models import Config
+
+
+class DiskCache:
+    """Size-bounded, TTL-aware byte cache stored in a SQLite file."""
+    
+    FILENAME = "cache.sqlite3"
+    
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: int = 300,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            directory: Directory holding the cache file (created if missing)
+            max_bytes: Approximate byte budget across all values
+            default_ttl: Seconds an entry lives when set() gets no ttl
+            clock: Wall-clock time source, in seconds since the epoch
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / self.FILENAME
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            print(f"⚠️ Disk cache at {self.path} is unreadable ({e}), starting fresh")
+            self.path.unlink(missing_ok=True)
+            self._conn = self._connect()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value if it has not expired."""
+        entry = self.get_with_ttl(key)
+        if entry is None or entry[1] <= 0:
+            return None
+        return entry[0]
+    
+    def get_with_ttl(self, key: str) -> Optional[Tuple[bytes, float, float]]:
+        """
+        Get a value with its remaining lifetimes, including values past expiry but within their stale window.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            (value, seconds until expiry, seconds until the stale window ends),
+            or None if missing or past its stale window
+        """
+        now = self.clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, stale_until FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            value, expires_at, stale_until = row
+            if now > stale_until:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(value), expires_at - now, stale_until - now
+    
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None, stale_ttl: float = 0) -> None:
+        """Store a value atomically, evicting least recently used entries to stay in budget."""
+        ttl = ttl or self.default_ttl
+        now = self.clock()
+        expires_at = now + ttl
+        size = len(value)
+        
+        with self._lock:
+            if size > self.max_bytes:
+                return
+            
+            with self._transaction():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, stale_until, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, value, expires_at, expires_at + max(stale_ttl, 0), size, now)
+                )
+                self._evict(now)
+    
+    def delete(self, key: str) -> None:
+        """Delete key from the cache."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+    
+    def cleanup_expired(self) -> int:
+        """
+        Remove entries past their stale window.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._conn.execute("DELETE FROM entries WHERE stale_until < ?", (self.clock(),)).rowcount
+    
+    def stats(self) -> Dict[str, int]:
+        """Get entry count, stored bytes and eviction counter."""
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {
+            'size': count,
+            'bytes': total,
+            'evictions': self.evictions,
+            'max_bytes': self.max_bytes
+        }
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema."""
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, "
+            "stale_until REAL NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_stale_until ON entries (stale_until)")
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+        return conn
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements as one atomic write transaction. Caller holds the lock."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def _evict(self, now: float) -> None:
+        """Drop dead entries, then the least recently used ones until within budget. Caller holds the lock."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        self._conn.execute("DELETE FROM entries WHERE stale_until < ?", (now,))
+        # Keep the most recently used entries whose running size fits the budget
+        self.evictions += self._conn.execute(
+            "DELETE FROM entries WHERE key IN ("
+            "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS kept FROM entries) "
+            "WHERE kept > ?)",
+            (self.max_bytes,)
+        ).rowcount
+
+
+def open_disk_cache(config: Config) -> Optional[DiskCache]:
+    """
+    Open the disk cache configured by cache_dir, if any.
+    
+    Args:
+        config: Application configuration
+    
+    Returns:
+        DiskCache, or None when disabled or the directory is unusable
+    """
+    if not config.cache_dir:
+        return None
+    
+    try:
+        return DiskCache(config.cache_dir, max_bytes=config.cache_max_mb * 1024 * 1024)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️ Disk cache disabled, could not open {config.cache_dir}: {e}")
+        return None
@@ -0,0 +1,35 @@
+"""
+Shared HTTP client helpers.
+"""
+
+import httpx
+
+
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'EdgeFinder/1.0'
+}
+
+
+def create_async_http_client(max_connections: int = 20, timeout: float = 30.0) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client.
+    
+    One client should be shared by every async API client in the process so
+    connections to the same upstream host are reused.
+    
+    Args:
+        max_connections: Maximum number of open connections in the pool
+        timeout: Default request timeout in seconds
+        
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        )
+    )
@@ -3,9 +3,13 @@ Team and market mapping utilities.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import deque
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from src.core.models import Team, Game
+from src.util.memo import LRUMemo
 
 
 # Seattle team aliases
@@ -171,6 +175,70 @@ TEAM_ALIASES = {
 }
 
 
+# Sizes of the memo tables for team name lookups and for market titles.
+# Titles get their own table so a burst of new market titles cannot evict
+# the team names every game comparison looks up.
+TEAM_MATCH_CACHE_SIZE = 4096
+TEAM_TITLE_CACHE_SIZE = 4096
+_team_match_memo = LRUMemo(TEAM_MATCH_CACHE_SIZE)
+_team_title_memo = LRUMemo(TEAM_TITLE_CACHE_SIZE)
+
+# Bumped by reload_team_aliases; part of every memo key so lookups computed
+# against the old tables are never served after a reload
+_alias_tables_version = 0
+
+
+def reload_team_aliases() -> None:
+    """
+    Rebuild derived lookups after SEATTLE_TEAMS or TEAM_ALIASES changed.
+    
+    Alias matchers are compiled and team lookups memoized from the tables on
+    first use, so call this after editing either table in place.
+    set_team_aliases and remove_team_aliases call it for you.
+    """
+    global _alias_tables_version
+    with _alias_matchers_lock:
+        _alias_matchers.clear()
+        _alias_tables_version += 1
+    _team_match_memo.clear()
+    _team_title_memo.clear()
+
+
+def set_team_aliases(sport: str, team: str, aliases: List[str]) -> None:
+    """
+    Add or replace a team's aliases and rebuild the derived lookups.
+    
+    Args:
+        sport: Sport abbreviation
+        team: Canonical team name
+        aliases: Names the team is matched by
+    """
+    TEAM_ALIASES.setdefault(sport, {})[team] = list(aliases)
+    reload_team_aliases()
+
+
+def remove_team_aliases(sport: str, team: str) -> None:
+    """
+    Remove a team's aliases, if any, and rebuild the derived lookups.
+    
+    Args:
+        sport: Sport abbreviation
+        team: Canonical team name
+    """
+    TEAM_ALIASES.get(sport, {}).pop(team, None)
+    reload_team_aliases()
+
+
+def team_match_cache_stats() -> Dict[str, int]:
+    """Get hit, miss and eviction counters for the team lookup memo."""
+    return _team_match_memo.stats()
+
+
+def team_title_cache_stats() -> Dict[str, int]:
+    """Get hit, miss and eviction counters for the market title memo."""
+    return _team_title_memo.stats()
+
+
 def normalize_team_name(name: str, sport: str) -> str:
     """
     Normalize a team name for consistent matching.
@@ -182,6 +250,15 @@ def normalize_team_name(name: str, sport: str) -> str:
     Returns:
         Normalized team name
     """
+    version = _alias_tables_version
+    return _team_match_memo.get_or_compute(
+        ('normalize', name, sport, version),
+        lambda: _normalize_team_name(name, sport)
+    )
+
+
+def _normalize_team_name(name: str, sport: str) -> str:
+    """Normalize a team name (uncached)."""
     # Convert to lowercase and remove extra spaces
     normalized = re.sub(r'\s+', ' ', name.lower().strip())
     
@@ -199,6 +276,109 @@ def normalize_team_name(name: str, sport: str) -> str:
     return normalized
 
 
+class _AliasMatcher:
+    """
+    Compiled alias lookup for one sport.
+    
+    Holds an Aho-Corasick automaton over every alias so one pass over a
+    normalized name finds all aliases it contains. Ties are broken the same
+    way the alias tables read: the first canonical team listed wins.
+    """
+    
+    def __init__(self, sport_aliases: Dict[str, List[str]], seattle_teams: Dict[str, Sequence[str]]):
+        self.canonicals: List[str] = list(sport_aliases)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Lowest canonical index matched by any alias ending at this node
+        # (including aliases reachable through fail links)
+        self._best: List[int] = [len(self.canonicals)]
+        
+        for priority, aliases in enumerate(sport_aliases.values()):
+            for alias in aliases:
+                self._add_alias(alias, priority)
+        self._link_failures()
+        
+        # Seattle aliases only ever match exactly; first team listed wins
+        self.seattle_exact: Dict[str, str] = {}
+        for team_name, team_aliases in seattle_teams.items():
+            if team_name == "abbreviation":
+                continue
+            for alias in team_aliases:
+                self.seattle_exact.setdefault(alias, team_name)
+        
+        # Names that are exactly an alias resolve with one dict hit
+        self.exact: Dict[str, Optional[str]] = {}
+        for alias in set(alias for aliases in sport_aliases.values() for alias in aliases) | set(self.seattle_exact):
+            self.exact[alias] = self._resolve(alias)
+    
+    def _add_alias(self, alias: str, priority: int) -> None:
+        """Insert an alias into the trie."""
+        node = 0
+        for char in alias:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(len(self.canonicals))
+            node = next_node
+        self._best[node] = min(self._best[node], priority)
+    
+    def _link_failures(self) -> None:
+        """Compute failure links breadth-first and fold in their matches."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._best[child] = min(self._best[child], self._best[self._fail[child]])
+                queue.append(child)
+    
+    def _scan(self, text: str) -> Optional[str]:
+        """Find the highest-priority canonical team with an alias inside text."""
+        goto, fail, best_at = self._goto, self._fail, self._best
+        best = best_at[0]
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if best_at[node] < best:
+                best = best_at[node]
+        return self.canonicals[best] if best < len(self.canonicals) else None
+    
+    def _resolve(self, normalized_name: str) -> Optional[str]:
+        """Resolve a normalized name without the exact-match shortcut."""
+        return self._scan(normalized_name) or self.seattle_exact.get(normalized_name)
+    
+    def match(self, normalized_name: str) -> Optional[str]:
+        """Resolve a normalized name to its canonical team, if any."""
+        if normalized_name in self.exact:
+            return self.exact[normalized_name]
+        return self._resolve(normalized_name)
+
+
+_alias_matchers: Dict[str, _AliasMatcher] = {}
+_alias_matchers_lock = Lock()
+
+
+def _get_alias_matcher(sport: str) -> _AliasMatcher:
+    """Get the compiled alias matcher for a sport, building it on first use."""
+    matcher = _alias_matchers.get(sport)
+    if matcher is None:
+        with _alias_matchers_lock:
+            matcher = _alias_matchers.get(sport)
+            if matcher is None:
+                matcher = _AliasMatcher(TEAM_ALIASES.get(sport, {}), SEATTLE_TEAMS.get(sport, {}))
+                _alias_matchers[sport] = matcher
+    return matcher
+
+
 def find_team_match(name: str, sport: str) -> Optional[str]:
     """
     Find a matching team name from aliases.
@@ -210,21 +390,30 @@ def find_team_match(name: str, sport: str) -> Optional[str]:
     Returns:
         Canonical team name if found, None otherwise
     """
-    normalized_name = normalize_team_name(name, sport)
-    
-    # Check sport-specific aliases
-    sport_aliases = TEAM_ALIASES.get(sport, {})
-    for canonical, aliases in sport_aliases.items():
-        if normalized_name in aliases or any(alias in normalized_name for alias in aliases):
-            return canonical
+    version = _alias_tables_version
+    return _team_match_memo.get_or_compute(
+        ('match', name, sport, version),
+        lambda: _get_alias_matcher(sport).match(normalize_team_name(name, sport))
+    )
+
+
+def canonical_team_name(name: str, sport: str) -> str:
+    """
+    Resolve a team name to a stable key for equality and hashing.
     
-    # Check Seattle teams
+    Args:
+        name: Team name, either raw or already canonical
+        sport: Sport abbreviation
+        
+    Returns:
+        The name itself if it is already a canonical key for the sport, else
+        the alias match, else the normalized name
+    """
     seattle_teams = SEATTLE_TEAMS.get(sport, {})
-    for team_name, aliases in seattle_teams.items():
-        if team_name != "abbreviation" and normalized_name in aliases:
-            return team_name
+    if name in TEAM_ALIASES.get(sport, {}) or (name != "abbreviation" and name in seattle_teams):
+        return name
     
-    return None
+    return find_team_match(name, sport) or normalize_team_name(name, sport)
 
 
 def is_seattle_team(team_name: str, sport: str) -> bool:
@@ -238,14 +427,65 @@ def is_seattle_team(team_name: str, sport: str) -> bool:
     Returns:
         True if Seattle team, False otherwise
     """
-    normalized_name = normalize_team_name(team_name, sport)
-    seattle_teams = SEATTLE_TEAMS.get(sport, {})
+    version = _alias_tables_version
+    return _team_match_memo.get_or_compute(
+        ('seattle', team_name, sport, version),
+        lambda: normalize_team_name(team_name, sport) in _get_alias_matcher(sport).seattle_exact
+    )
+
+
+# Separators between the two teams in a market title, in the order they are
+# tried. Named groups let one compiled pattern find all of them in one pass.
+_TITLE_SEPARATORS = [
+    ('vs', r'vs\.?'),
+    ('at_sign', r'@'),
+    ('at', r'at'),
+    ('over', r'over'),
+    ('beats', r'beats?'),
+    ('defeats', r'defeats?'),
+    ('wins_against', r'wins?\s+against'),
+]
+
+# Zero-width so that every position is considered and the first occurrence of
+# each separator is found, exactly as a separate re.search per pattern would.
+_TITLE_SEPARATOR_PATTERN = re.compile(
+    r'(?=\s+(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _TITLE_SEPARATORS) + r')\s+.)',
+    re.IGNORECASE
+)
+
+TITLE_CACHE_SIZE = 8192
+_title_split_memo = LRUMemo(TITLE_CACHE_SIZE)
+
+
+def _split_title(title: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Split a market title into candidate (team1, team2) pairs.
     
-    for team_key, aliases in seattle_teams.items():
-        if team_key != "abbreviation" and normalized_name in aliases:
-            return True
+    Args:
+        title: Kalshi market title
+        
+    Returns:
+        One pair per separator found, split at its first occurrence, ordered
+        by separator priority
+    """
+    first_split: Dict[str, Tuple[str, str]] = {}
+    
+    for match in _TITLE_SEPARATOR_PATTERN.finditer(title):
+        # The first team needs at least one character
+        if match.start() == 0:
+            continue
+        separator = match.lastgroup
+        # Every alternative in the pattern is a named group
+        assert separator is not None
+        if separator not in first_split:
+            first_split[separator] = (
+                title[:match.start()].strip(),
+                title[match.end(separator):].strip()
+            )
+            if len(first_split) == len(_TITLE_SEPARATORS):
+                break
     
-    return False
+    return tuple(first_split[name] for name, _ in _TITLE_SEPARATORS if name in first_split)
 
 
 def extract_teams_from_kalshi_title(title: str, sport: str) -> Optional[Tuple[str, str]]:
@@ -259,29 +499,25 @@ def extract_teams_from_kalshi_title(title: str, sport: str) -> Optional[Tuple[st
     Returns:
         Tuple of (team1, team2) if found, None otherwise
     """
-    # Common patterns for team extraction
-    patterns = [
-        r'(.+?)\s+vs\.?\s+(.+)',
-        r'(.+?)\s+@\s+(.+)',
-        r'(.+?)\s+at\s+(.+)',
-        r'(.+?)\s+over\s+(.+)',
-        r'(.+?)\s+beats?\s+(.+)',
-        r'(.+?)\s+defeats?\s+(.+)',
-        r'(.+?)\s+wins?\s+against\s+(.+)',
-    ]
+    version = _alias_tables_version
+    return _team_title_memo.get_or_compute(
+        (title, sport, version),
+        lambda: _extract_teams(title, sport)
+    )
+
+
+def _extract_teams(title: str, sport: str) -> Optional[Tuple[str, str]]:
+    """Resolve a title's candidate splits to canonical teams (uncached)."""
+    # Titles are stable across refreshes, so the split is cached by title alone
+    candidates = _title_split_memo.get_or_compute(title, lambda: _split_title(title))
     
-    for pattern in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
-        if match:
-            team1 = match.group(1).strip()
-            team2 = match.group(2).strip()
-            
-            # Try to match both teams
-            team1_match = find_team_match(team1, sport)
-            team2_match = find_team_match(team2, sport)
-            
-            if team1_match and team2_match:
-                return team1_match, team2_match
+    for team1, team2 in candidates:
+        # Try to match both teams
+        team1_match = find_team_match(team1, sport)
+        team2_match = find_team_match(team2, sport)
+        
+        if team1_match and team2_match:
+            return team1_match, team2_match
     
     return None
 
@@ -313,6 +549,12 @@ def create_game_from_market(market_title: str, event_time: datetime, sport: str)
     )
 
 
+def _game_pair_key(game: Game) -> Tuple[str, Tuple[str, str]]:
+    """Key a game by sport and its teams regardless of home/away order."""
+    first, second = sorted((game.away_team, game.home_team))
+    return game.sport, (first, second)
+
+
 def match_games_within_timeframe(
     kalshi_games: List[Game], 
     sportsbook_games: List[Game], 
@@ -321,6 +563,10 @@ def match_games_within_timeframe(
     """
     Match Kalshi games with sportsbook games within a time tolerance.
     
+    Sportsbook games are bucketed by sport and team pair and sorted by start
+    time, so each Kalshi game only bisects into its own bucket. Each Kalshi
+    game is paired with the earliest-listed sportsbook game that matches.
+    
     Args:
         kalshi_games: List of Kalshi games
         sportsbook_games: List of sportsbook games
@@ -332,26 +578,28 @@ def match_games_within_timeframe(
     matches = []
     time_tolerance = timedelta(hours=time_tolerance_hours)
     
+    # (sport, team pair) -> start times in order, and each game's list position
+    buckets: Dict[Tuple[str, Tuple[str, str]], Tuple[List[datetime], List[int]]] = {}
+    grouped: Dict[Tuple[str, Tuple[str, str]], List[Tuple[datetime, int]]] = {}
+    for position, sportsbook_game in enumerate(sportsbook_games):
+        grouped.setdefault(_game_pair_key(sportsbook_game), []).append(
+            (sportsbook_game.start_time, position)
+        )
+    for key, entries in grouped.items():
+        entries.sort(key=lambda entry: entry[0])
+        buckets[key] = ([start for start, _ in entries], [position for _, position in entries])
+    
     for kalshi_game in kalshi_games:
-        for sportsbook_game in sportsbook_games:
-            # Check if games are the same sport
-            if kalshi_game.sport != sportsbook_game.sport:
-                continue
-            
-            # Check if teams match (either direction)
-            teams_match = (
-                (kalshi_game.away_team == sportsbook_game.away_team and 
-                 kalshi_game.home_team == sportsbook_game.home_team) or
-                (kalshi_game.away_team == sportsbook_game.home_team and 
-                 kalshi_game.home_team == sportsbook_game.away_team)
-            )
-            
-            # Check if times are within tolerance
-            time_diff = abs(kalshi_game.start_time - sportsbook_game.start_time)
-            time_match = time_diff <= time_tolerance
-            
-            if teams_match and time_match:
-                matches.append((kalshi_game, sportsbook_game))
-                break  # Found a match, move to next Kalshi game
+        bucket = buckets.get(_game_pair_key(kalshi_game))
+        if bucket is None:
+            continue
+        
+        start_times, positions = bucket
+        low = bisect_left(start_times, kalshi_game.start_time - time_tolerance)
+        high = bisect_right(start_times, kalshi_game.start_time + time_tolerance)
+        
+        if low < high:
+            # Keep first-match semantics: earliest in the input list wins
+            matches.append((kalshi_game, sportsbook_games[min(positions[low:high])]))
     
     return matches
@@ -2,111 +2,286 @@
 Sportsbook odds API client.
 """
 
+import asyncio
+import hashlib
 import json
+import threading
+import traceback
+import httpx
 import requests
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Callable, Iterator, Mapping, NamedTuple, Tuple, TypeVar
 from src.core.models import SportsbookOdds, Config
+from src.core.odds_table import OddsTable, OddsTableBuilder
+from src.data.cache import TTL, SimpleCache, cache as shared_cache
+from src.data.coalesce import RequestCoalescer
+from src.data.http import DEFAULT_HEADERS, create_async_http_client
+from src.data.quota import QuotaStatus, QuotaTracker, quota_tracker
+from src.data.resilience import Deadline, Resilience, gather_within, resilience as shared_resilience
+from src.data.schemas import ODDS_PAYLOAD_ADAPTER
+from src.data.ttl_policy import TTLPolicy
 from src.util.time import get_time_window
 
+T = TypeVar('T')
 
-class OddsClient:
-    """Client for sportsbook odds API (TheOddsAPI)."""
+# Bodies this large are hashed and decoded in a worker thread, which keeps
+# the event loop serving other requests meanwhile
+OFFLOAD_DECODE_BYTES = 256 * 1024
+
+
+class OddsRequest(NamedTuple):
+    """A sport's odds request and the key its payload is cached under."""
+    sport: str
+    url: str
+    params: Dict[str, Any]
+    key: str
+    deadline: Optional[Deadline] = None
+
+
+def odds_query_params(
+    config: Config,
+    hours: int,
+    markets: Optional[str] = None,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Build TheOddsAPI query parameters that project the response down to what a consumer needs.
+    
+    The commence-time window starts at the top of the current hour and covers
+    at least the next `hours` hours, so parameters (and any validators the API
+    returns for them) stay stable for an hour. A bookmaker allow-list replaces
+    the region, since the API bills and filters by whichever is given.
     
-    def __init__(self, config: Config):
+    Args:
+        config: Application configuration
+        hours: Hours to look ahead
+        markets: Comma-separated market keys (defaults to config.odds_markets)
+        now: Current time (defaults to the wall clock)
+    
+    Returns:
+        Query parameters for the /sports/{sport}/odds endpoint
+    """
+    start = (now or datetime.now(timezone.utc)).astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    params = {
+        'apiKey': config.odds_api_key,
+        'markets': markets or ','.join(config.odds_markets),
+        'oddsFormat': 'american',
+        'dateFormat': 'iso',
+        'commenceTimeFrom': start.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'commenceTimeTo': (start + timedelta(hours=hours + 1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    }
+    if config.odds_bookmakers:
+        params['bookmakers'] = ','.join(config.odds_bookmakers)
+    else:
+        params['regions'] = 'us'
+    return params
+
+
+class BaseOddsClient:
+    """Request building and response parsing shared by the sync and async odds clients."""
+    
+    def __init__(
+        self,
+        config: Config,
+        quota: Optional[QuotaTracker] = None,
+        resilience: Optional[Resilience] = None
+    ):
         self.config = config
         self.base_url = config.odds_api_base_url
         self.api_key = config.odds_api_key
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'EdgeFinder/1.0'
-        })
+        self.ttl_policy = TTLPolicy.from_config(config)
+        self.quota = quota if quota is not None else quota_tracker
+        self.resilience = resilience if resilience is not None else shared_resilience
+        self.parse_skips = 0
+        # Per payload key: digest and table of the last parsed body, digest
+        # and games of the last decoded body, and the conditional-request
+        # validators with the body they describe
+        self._last_parsed: Dict[str, Tuple[bytes, OddsTable]] = {}
+        self._last_decoded: Dict[str, Tuple[bytes, List[Dict[str, Any]]]] = {}
+        self._validators: Dict[str, Tuple[Dict[str, str], bytes]] = {}
+        self._payload_lock = threading.Lock()
     
-    def get_odds(self, sports: Optional[List[str]] = None, lookahead_hours: Optional[int] = None) -> List[SportsbookOdds]:
+    def quota_status(self) -> Optional[QuotaStatus]:
+        """Latest quota headers TheOddsAPI returned for this client's API key."""
+        return self.quota.get(self.api_key)
+    
+    def _sport_odds_request(
+        self,
+        sport: str,
+        hours: int,
+        markets: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> OddsRequest:
         """
-        Fetch odds from sportsbook API.
+        Build a sport's odds request.
         
-        Args:
-            sports: List of sports to fetch (defaults to config)
-            lookahead_hours: Hours to look ahead (defaults to config)
-            
-        Returns:
-            List of SportsbookOdds objects
+        The key identifies the payload for the cache, parse memo and TTL
+        policy. It names the window by its length rather than its bounds so
+        it does not change every hour. The deadline bounds the request's
+        attempts and backoff.
         """
-        if self.config.use_fixtures:
-            return self._get_fixture_odds()
-        
-        sports_list = sports or self.config.sports_filter
-        hours = lookahead_hours or self.config.lookahead_hours
-        
-        all_odds = []
+        params = odds_query_params(self.config, hours, markets)
+        scope = params.get('bookmakers') or params['regions']
+        return OddsRequest(
+            sport=sport,
+            url=f"{self.base_url}/sports/{sport}/odds",
+            params=params,
+            key=f"odds:{sport}:{params['markets']}:{scope}:{hours}h",
+            deadline=deadline
+        )
+    
+    def _content_ttl(self, request: OddsRequest) -> TTL:
+        """Get the cache TTL for a sport's response body: fixed, or from the TTL policy with adaptive_ttl."""
+        if not self.config.adaptive_ttl:
+            return self.config.odds_cache_ttl_seconds
+        # The parse memo makes the caller's parse of the same body free
+        return lambda content: self.ttl_policy.observe(request.key, self._parse_unchanged(request.key, request.sport, content))
+    
+    def _parse_unchanged(self, key: str, sport: str, content: bytes) -> OddsTable:
+        """
+        Parse a response body unless it is identical to the last one parsed for key.
         
-        for sport in sports_list:
-            try:
-                print(f"Fetching odds for sport: {sport}")
-                print(f"API Key: {self.api_key[:10]}..." if self.api_key else "No API key")
-                print(f"Base URL: {self.base_url}")
-                odds = self._fetch_sport_odds(sport, hours)
-                print(f"Successfully fetched {len(odds)} odds for {sport}")
-                all_odds.extend(odds)
-            except Exception as e:
-                print(f"❌ Error fetching odds for {sport}: {e}")
-                import traceback
-                traceback.print_exc()
-                # Continue with other sports, but log the error
-                continue
+        Odds often do not move between refreshes; hashing the body costs a
+        small fraction of parsing it, so an unchanged payload reuses the
+        previous table. Tables are never mutated, so sharing one is safe.
         
-        # If we got no odds at all, raise an error to see what's happening
-        if not all_odds and not self.config.use_fixtures:
-            print("❌ No odds fetched from API!")
-            print(f"   Sports attempted: {sports_list}")
-            print(f"   API Key available: {bool(self.api_key)}")
-            print(f"   Base URL: {self.base_url}")
-            raise Exception(f"Failed to fetch odds for any sport. Sports attempted: {sports_list}")
+        Args:
+            key: Payload key
+            sport: Sport key the body belongs to
+            content: Raw JSON response body
         
-        return all_odds
+        Returns:
+            OddsTable for the body
+        """
+        return self._reuse_unchanged(self._last_parsed, key, content, lambda: self._parse_sport_content(sport, content))
     
-    def _fetch_sport_odds(self, sport: str, hours: int) -> List[SportsbookOdds]:
-        """Fetch odds for a specific sport."""
-        url = f"{self.base_url}/sports/{sport}/odds"
-        params = {
-            'apiKey': self.api_key,
-            'regions': 'us',
-            'markets': 'h2h,spreads,totals',
-            'oddsFormat': 'american',
-            'dateFormat': 'iso'
-        }
+    def _decode_unchanged(self, key: str, content: bytes) -> List[Dict[str, Any]]:
+        """
+        Decode a response body unless it is identical to the last one decoded for key.
         
-        print(f"Making request to: {url}")
-        print(f"With params: {params}")
+        The games are shared between callers of an unchanged payload, so
+        they must be treated as read-only.
         
-        response = self.session.get(url, params=params, timeout=30)
-        print(f"Response status: {response.status_code}")
+        Args:
+            key: Payload key
+            content: Raw JSON response body
         
-        if response.status_code != 200:
-            print(f"❌ API Error: {response.status_code} - {response.text}")
-            print(f"   URL: {url}")
-            print(f"   Params: {params}")
-            raise Exception(f"API returned {response.status_code}: {response.text}")
+        Returns:
+            List of game dicts in the body
+        """
+        return self._reuse_unchanged(self._last_decoded, key, content, lambda: json.loads(content))
+    
+    def _reuse_unchanged(
+        self,
+        memo: Dict[str, Tuple[bytes, T]],
+        key: str,
+        content: bytes,
+        build: Callable[[], T]
+    ) -> T:
+        """Get memo's value for key if it was built from the same body, else build and remember it."""
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        with self._payload_lock:
+            last = memo.get(key)
+            if last is not None and last[0] == digest:
+                self.parse_skips += 1
+                return last[1]
         
-        data = response.json()
+        value = build()
+        with self._payload_lock:
+            memo[key] = (digest, value)
+        return value
+    
+    def _conditional_headers(self, key: str) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for the last body seen for key."""
+        with self._payload_lock:
+            validators = self._validators.get(key)
+        return dict(validators[0]) if validators else {}
+    
+    def _remember_response(self, key: str, headers: Any, content: bytes) -> None:
+        """Record validators for conditional requests when the API sends them."""
+        conditional = {}
+        if headers.get('etag'):
+            conditional['If-None-Match'] = headers['etag']
+        if headers.get('last-modified'):
+            conditional['If-Modified-Since'] = headers['last-modified']
+        if conditional:
+            with self._payload_lock:
+                self._validators[key] = (conditional, content)
+    
+    def _not_modified_content(self, key: str) -> Optional[bytes]:
+        """Get the body a 304 Not Modified response refers to."""
+        with self._payload_lock:
+            validators = self._validators.get(key)
+        return validators[1] if validators else None
+    
+    def _parse_sport_payload(self, sport: str, data: List[Dict[str, Any]]) -> OddsTable:
+        """Parse a sport's odds payload into an OddsTable holding every bookmaker."""
         print(f"Received {len(data)} games for {sport}")
-        odds_list = []
+        builder = OddsTableBuilder()
         
         for game_data in data:
             try:
-                odds = self._parse_game_odds(game_data)
-                if odds:
-                    odds_list.append(odds)
+                self._parse_game_odds(game_data, builder)
             except Exception as e:
                 print(f"Error parsing odds for game: {e}")
                 continue
         
-        return odds_list
+        return builder.build()
     
-    def _parse_game_odds(self, data: Dict[str, Any]) -> Optional[SportsbookOdds]:
-        """Parse odds for a single game."""
+    def _parse_sport_content(self, sport: str, content: bytes) -> OddsTable:
+        """
+        Parse a sport's raw response body into an OddsTable.
+        
+        The whole body is validated in one TypeAdapter call. If any game fails
+        validation, the body is parsed game by game instead so only the bad
+        games are dropped.
+        
+        Args:
+            sport: Sport key the body belongs to
+            content: Raw JSON response body
+        
+        Returns:
+            OddsTable holding every bookmaker
+        """
+        try:
+            games = ODDS_PAYLOAD_ADAPTER.validate_json(content)
+        except ValidationError as e:
+            print(f"⚠️ Batch validation failed for {sport} ({e.error_count()} errors), parsing game by game")
+            return self._parse_sport_payload(sport, json.loads(content))
+        
+        print(f"Received {len(games)} games for {sport}")
+        builder = OddsTableBuilder()
+        
+        for game in games:
+            away_team = game.get('away_team', '')
+            home_team = game.get('home_team', '')
+            self._add_game_books(
+                builder,
+                game.get('id', ''),
+                game.get('sport_key', ''),
+                away_team,
+                home_team,
+                game['commence_time'],
+                [self._book_prices(bookmaker, away_team, home_team) for bookmaker in game.get('bookmakers', [])]
+            )
+        
+        return builder.build()
+    
+    def _parse_game_odds(self, data: Dict[str, Any], builder: OddsTableBuilder) -> int:
+        """
+        Parse odds for a single game into the table builder.
+        
+        Args:
+            data: Game dict from the API
+            builder: Builder collecting the sport's games
+        
+        Returns:
+            Number of bookmakers kept for the game
+        """
         try:
             game_id = data.get('id', '')
             sport = data.get('sport_key', '')
@@ -118,68 +293,86 @@ class OddsClient:
             commence_time_dt = datetime.fromisoformat(commence_time.replace('Z', '+00:00'))
             
             # Parse bookmaker odds
-            bookmakers = data.get('bookmakers', [])
-            odds_list = []
-            
-            for bookmaker in bookmakers:
-                book_name = bookmaker.get('title', '')
-                markets = bookmaker.get('markets', [])
-                
-                # Extract moneyline odds
-                moneyline_away = None
-                moneyline_home = None
-                spread_away = None
-                spread_home = None
-                total_over = None
-                total_under = None
-                
-                for market in markets:
-                    if market.get('key') == 'h2h':
-                        outcomes = market.get('outcomes', [])
-                        for outcome in outcomes:
-                            if outcome.get('name') == away_team:
-                                moneyline_away = outcome.get('price')
-                            elif outcome.get('name') == home_team:
-                                moneyline_home = outcome.get('price')
-                    
-                    elif market.get('key') == 'spreads':
-                        outcomes = market.get('outcomes', [])
-                        for outcome in outcomes:
-                            if outcome.get('name') == away_team:
-                                spread_away = outcome.get('point')
-                            elif outcome.get('name') == home_team:
-                                spread_home = outcome.get('point')
-                    
-                    elif market.get('key') == 'totals':
-                        outcomes = market.get('outcomes', [])
-                        for outcome in outcomes:
-                            if outcome.get('name') == 'Over':
-                                total_over = outcome.get('point')
-                            elif outcome.get('name') == 'Under':
-                                total_under = outcome.get('point')
-                
-                if moneyline_away is not None or moneyline_home is not None:
-                    odds = SportsbookOdds(
-                        game_id=game_id,
-                        sport=sport,
-                        away_team=away_team,
-                        home_team=home_team,
-                        start_time=commence_time_dt,
-                        book_name=book_name,
-                        moneyline_away=moneyline_away,
-                        moneyline_home=moneyline_home,
-                        spread_away=spread_away,
-                        spread_home=spread_home,
-                        total_over=total_over,
-                        total_under=total_under
-                    )
-                    odds_list.append(odds)
-            
-            return odds_list[0] if odds_list else None
+            book_prices = [
+                self._book_prices(bookmaker, away_team, home_team)
+                for bookmaker in data.get('bookmakers', [])
+            ]
             
+            return self._add_game_books(builder, game_id, sport, away_team, home_team, commence_time_dt, book_prices)
+        
         except (ValueError, KeyError) as e:
             print(f"Error parsing odds data: {e}")
+            return 0
+    
+    def _book_prices(self, bookmaker: Mapping[str, Any], away_team: str, home_team: str) -> Optional[Dict[str, Any]]:
+        """Extract one bookmaker's prices, or None if it has no moneyline."""
+        book_name = bookmaker.get('title', '')
+        markets = bookmaker.get('markets', [])
+        
+        # Extract moneyline odds
+        moneyline_away = None
+        moneyline_home = None
+        spread_away = None
+        spread_home = None
+        total_over = None
+        total_under = None
+        
+        for market in markets:
+            if market.get('key') == 'h2h':
+                outcomes = market.get('outcomes', [])
+                for outcome in outcomes:
+                    if outcome.get('name') == away_team:
+                        moneyline_away = outcome.get('price')
+                    elif outcome.get('name') == home_team:
+                        moneyline_home = outcome.get('price')
+            
+            elif market.get('key') == 'spreads':
+                outcomes = market.get('outcomes', [])
+                for outcome in outcomes:
+                    if outcome.get('name') == away_team:
+                        spread_away = outcome.get('point')
+                    elif outcome.get('name') == home_team:
+                        spread_home = outcome.get('point')
+            
+            elif market.get('key') == 'totals':
+                outcomes = market.get('outcomes', [])
+                for outcome in outcomes:
+                    if outcome.get('name') == 'Over':
+                        total_over = outcome.get('point')
+                    elif outcome.get('name') == 'Under':
+                        total_under = outcome.get('point')
+        
+        if moneyline_away is None and moneyline_home is None:
             return None
+        
+        return dict(
+            book_name=book_name,
+            moneyline_away=moneyline_away,
+            moneyline_home=moneyline_home,
+            spread_away=spread_away,
+            spread_home=spread_home,
+            total_over=total_over,
+            total_under=total_under
+        )
+    
+    def _add_game_books(
+        self,
+        builder: OddsTableBuilder,
+        game_id: str,
+        sport: str,
+        away_team: str,
+        home_team: str,
+        start_time: datetime,
+        book_prices: List[Optional[Dict[str, Any]]]
+    ) -> int:
+        """Add a game and its priced bookmakers; games without any are skipped."""
+        priced = [prices for prices in book_prices if prices]
+        if priced:
+            game_index = builder.add_game(game_id, sport, away_team, home_team, start_time)
+            for prices in priced:
+                builder.add_book(game_index, **prices)
+        
+        return len(priced)
     
     def _get_fixture_odds(self) -> List[SportsbookOdds]:
         """Get fixture odds for testing."""
@@ -271,3 +464,394 @@ class OddsClient:
                 total_under=8.5
             )
         ]
+
+
+class OddsClient(BaseOddsClient):
+    """Client for sportsbook odds API (TheOddsAPI)."""
+    
+    def __init__(
+        self,
+        config: Config,
+        cache: Optional[SimpleCache] = None,
+        quota: Optional[QuotaTracker] = None,
+        resilience: Optional[Resilience] = None
+    ):
+        """
+        Args:
+            config: Application configuration
+            cache: Response cache shared across clients (defaults to the process-wide cache)
+            quota: Quota tracker (defaults to the process-wide tracker)
+            resilience: Retry and circuit-breaker policy (defaults to the process-wide policy)
+        """
+        super().__init__(config, quota, resilience)
+        self.cache = cache if cache is not None else shared_cache
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        # Size the connection pool for the concurrent per-sport fetches
+        adapter = HTTPAdapter(pool_maxsize=max(1, config.odds_fetch_workers))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._coalescer: Optional[RequestCoalescer] = None
+        self._deadline: Optional[Deadline] = None
+    
+    @contextmanager
+    def fetch_context(self) -> Iterator[RequestCoalescer]:
+        """
+        Share downloads between every consumer of this client for one run.
+        
+        Inside the context, each (sport, markets, bookmakers, window) request is made at
+        most once; repeat and concurrent get_odds calls reuse the result. All
+        of them share one run_deadline_seconds budget.
+        
+        Yields:
+            The RequestCoalescer backing this run
+        """
+        previous = self._coalescer, self._deadline
+        self._coalescer = RequestCoalescer()
+        self._deadline = Deadline(self.config.run_deadline_seconds)
+        try:
+            yield self._coalescer
+        finally:
+            self._coalescer, self._deadline = previous
+    
+    def get_odds(self, sports: Optional[List[str]] = None, lookahead_hours: Optional[int] = None) -> List[SportsbookOdds]:
+        """
+        Fetch odds from sportsbook API.
+        
+        Args:
+            sports: List of sports to fetch (defaults to config)
+            lookahead_hours: Hours to look ahead (defaults to config)
+        
+        Returns:
+            List of SportsbookOdds objects, one per game and bookmaker
+        """
+        return self.get_odds_table(sports, lookahead_hours).to_models()
+    
+    def get_odds_table(self, sports: Optional[List[str]] = None, lookahead_hours: Optional[int] = None) -> OddsTable:
+        """
+        Fetch odds from sportsbook API as a columnar table.
+        
+        Args:
+            sports: List of sports to fetch (defaults to config)
+            lookahead_hours: Hours to look ahead (defaults to config)
+        
+        Returns:
+            OddsTable with every bookmaker's prices, games ordered by sport
+        """
+        if self.config.use_fixtures:
+            return OddsTable.from_models(self._get_fixture_odds())
+        
+        sports_list = sports or self.config.sports_filter
+        hours = lookahead_hours or self.config.lookahead_hours
+        
+        print(f"Fetching odds for sports: {sports_list}")
+        print(f"API Key: {self.api_key[:10]}..." if self.api_key else "No API key")
+        print(f"Base URL: {self.base_url}")
+        
+        # Fetch every sport at once; results are collected per sport so the
+        # output order always follows sports_list, not completion order.
+        deadline = self._deadline if self._deadline is not None else Deadline(self.config.run_deadline_seconds)
+        results_by_sport = self._fetch_all_sports(sports_list, hours, deadline)
+        
+        all_odds = OddsTable.concat([
+            results_by_sport[sport] for sport in sports_list if sport in results_by_sport
+        ])
+        
+        # If we got no odds at all, raise an error to see what's happening
+        if not len(all_odds) and not self.config.use_fixtures:
+            print("❌ No odds fetched from API!")
+            print(f"   Sports attempted: {sports_list}")
+            print(f"   API Key available: {bool(self.api_key)}")
+            print(f"   Base URL: {self.base_url}")
+            raise Exception(f"Failed to fetch odds for any sport. Sports attempted: {sports_list}")
+        
+        return all_odds
+    
+    def _fetch_all_sports(
+        self,
+        sports_list: List[str],
+        hours: int,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, OddsTable]:
+        """
+        Fetch odds for several sports concurrently.
+        
+        Each sport runs in its own worker so one slow or failing sport does not
+        hold up or break the others. Sports still running at the deadline are
+        left out, so a slow host costs at most the run's budget.
+        
+        Args:
+            sports_list: Sports to fetch
+            hours: Hours to look ahead
+            deadline: Run deadline (None waits for every sport)
+        
+        Returns:
+            Mapping of sport key to its parsed odds (failed and late sports are omitted)
+        """
+        results: Dict[str, OddsTable] = {}
+        if not sports_list:
+            return results
+        
+        max_workers = max(1, min(self.config.odds_fetch_workers, len(sports_list)))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="odds-fetch")
+        futures = {
+            executor.submit(self._fetch_sport_odds, sport, hours, deadline): sport
+            for sport in dict.fromkeys(sports_list)
+        }
+        try:
+            for future in as_completed(futures, timeout=deadline.remaining() if deadline else None):
+                sport = futures[future]
+                try:
+                    odds = future.result()
+                    print(f"Successfully fetched odds for {len(odds)} games for {sport}")
+                    results[sport] = odds
+                except Exception as e:
+                    print(f"❌ Error fetching odds for {sport}: {e}")
+                    traceback.print_exc()
+                    # Continue with other sports, but log the error
+                    continue
+        except FuturesTimeoutError:
+            late = [sport for future, sport in futures.items() if not future.done()]
+            print(f"⚠️ Run deadline reached, returning partial odds without: {late}")
+        finally:
+            # Late workers finish on their own; their timeouts are clamped to the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+    
+    def _fetch_sport_odds(self, sport: str, hours: int, deadline: Optional[Deadline] = None) -> OddsTable:
+        """Fetch odds for a specific sport, coalescing with the current run's fetches."""
+        request = self._sport_odds_request(sport, hours, deadline=deadline)
+        coalescer = self._coalescer
+        if coalescer is None:
+            return self._download_sport_odds(request)
+        
+        return coalescer.get(request.key, lambda: self._download_sport_odds(request))
+    
+    def _download_sport_odds(self, request: OddsRequest) -> OddsTable:
+        """
+        Download and parse odds for a specific sport.
+        
+        Response bodies go through the shared cache, so clients across runs
+        and threads make one upstream request per key and TTL; an expired body
+        keeps being served for odds_cache_stale_seconds while a single
+        background request refreshes it. With adaptive_ttl, each body's TTL
+        comes from the TTL policy instead of odds_cache_ttl_seconds. Bodies
+        identical to the last one are not parsed again.
+        """
+        key, sport = request.key, request.sport
+        if self.config.odds_cache_ttl_seconds <= 0:
+            return self._parse_unchanged(key, sport, self._request_sport_content(request))
+        
+        content = self.cache.get_or_compute(
+            key,
+            lambda: self._request_sport_content(request),
+            ttl=self._content_ttl(request),
+            stale_ttl=self.config.odds_cache_stale_seconds
+        )
+        return self._parse_unchanged(key, sport, content)
+    
+    def _request_sport_content(self, request: OddsRequest) -> bytes:
+        """Request a sport's odds, recording quota headers, and return the raw response body."""
+        url, params, key = request.url, request.params, request.key
+        print(f"Making request to: {url}")
+        print(f"With params: {params}")
+        
+        headers = self._conditional_headers(key)
+        response = self.resilience.call(
+            url,
+            lambda timeout: self.session.get(url, params=params, headers=headers, timeout=timeout),
+            timeout=30,
+            deadline=request.deadline
+        )
+        print(f"Response status: {response.status_code}")
+        # Error responses (429s included) still report the quota
+        self.quota.record(self.api_key, response.headers)
+        
+        if response.status_code == 304:
+            content = self._not_modified_content(key)
+            if content is not None:
+                return content
+        
+        if response.status_code != 200:
+            print(f"❌ API Error: {response.status_code} - {response.text}")
+            print(f"   URL: {url}")
+            print(f"   Params: {params}")
+            raise Exception(f"API returned {response.status_code}: {response.text}")
+        
+        body: bytes = response.content
+        self._remember_response(key, response.headers, body)
+        return body
+
+
+class AsyncOddsClient(BaseOddsClient):
+    """Async client for sportsbook odds API (TheOddsAPI) backed by a pooled httpx client."""
+    
+    def __init__(
+        self,
+        config: Config,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[SimpleCache] = None,
+        quota: Optional[QuotaTracker] = None,
+        resilience: Optional[Resilience] = None
+    ):
+        """
+        Args:
+            config: Application configuration
+            http_client: Pooled client to send requests on (created and owned if None)
+            cache: Response cache shared across clients (defaults to the process-wide cache)
+            quota: Quota tracker (defaults to the process-wide tracker)
+            resilience: Retry and circuit-breaker policy (defaults to the process-wide policy)
+        """
+        super().__init__(config, quota, resilience)
+        self.cache = cache if cache is not None else shared_cache
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_async_http_client()
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+    
+    async def get_odds(self, sports: Optional[List[str]] = None, lookahead_hours: Optional[int] = None) -> List[SportsbookOdds]:
+        """
+        Fetch odds from sportsbook API without blocking the event loop.
+        
+        Args:
+            sports: List of sports to fetch (defaults to config)
+            lookahead_hours: Hours to look ahead (defaults to config)
+        
+        Returns:
+            List of SportsbookOdds objects, one per game and bookmaker, ordered by sport
+        """
+        table = await self.get_odds_table(sports, lookahead_hours)
+        return table.to_models()
+    
+    async def get_odds_table(self, sports: Optional[List[str]] = None, lookahead_hours: Optional[int] = None) -> OddsTable:
+        """
+        Fetch odds from sportsbook API as a columnar table without blocking the event loop.
+        
+        Args:
+            sports: List of sports to fetch (defaults to config)
+            lookahead_hours: Hours to look ahead (defaults to config)
+        
+        Returns:
+            OddsTable with every bookmaker's prices, games ordered by sport
+        """
+        if self.config.use_fixtures:
+            return OddsTable.from_models(self._get_fixture_odds())
+        
+        sports_list = sports or self.config.sports_filter
+        hours = lookahead_hours or self.config.lookahead_hours
+        
+        # Sports still running at the deadline come back as DeadlineExceeded
+        deadline = Deadline(self.config.run_deadline_seconds)
+        results = await gather_within(
+            (self._fetch_sport_odds(sport, hours, deadline) for sport in sports_list),
+            deadline
+        )
+        
+        tables = []
+        for sport, result in zip(sports_list, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error fetching odds for {sport}: {result}")
+                continue
+            print(f"Successfully fetched odds for {len(result)} games for {sport}")
+            tables.append(result)
+        
+        all_odds = OddsTable.concat(tables)
+        if not len(all_odds):
+            print("❌ No odds fetched from API!")
+            raise Exception(f"Failed to fetch odds for any sport. Sports attempted: {sports_list}")
+        
+        return all_odds
+    
+    async def fetch_sport_payload(
+        self,
+        sport: str,
+        hours: Optional[int] = None,
+        markets: Optional[str] = None,
+        timeout: float = 30,
+        deadline: Optional[Deadline] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the raw odds payload for a sport.
+        
+        Like _fetch_sport_odds, a body identical to the last one is not
+        decoded again, so the games returned are shared and read-only.
+        
+        Args:
+            sport: Sport key to fetch
+            hours: Hours to look ahead (defaults to config)
+            markets: Comma-separated market keys to request (defaults to config)
+            timeout: Request timeout in seconds
+            deadline: Run deadline bounding retries and timeouts
+        
+        Returns:
+            List of game dicts as returned by the API
+        """
+        request = self._sport_odds_request(sport, hours or self.config.lookahead_hours, markets, deadline)
+        if self.config.odds_cache_ttl_seconds <= 0:
+            content = await self._fetch_sport_content(request, timeout)
+        else:
+            content = await self.cache.aget_or_compute(
+                request.key,
+                lambda: self._fetch_sport_content(request, timeout),
+                ttl=self._content_ttl(request),
+                stale_ttl=self.config.odds_cache_stale_seconds
+            )
+        
+        if len(content) >= OFFLOAD_DECODE_BYTES:
+            return await asyncio.to_thread(self._decode_unchanged, request.key, content)
+        return self._decode_unchanged(request.key, content)
+    
+    async def _fetch_sport_content(self, request: OddsRequest, timeout: float = 30) -> bytes:
+        """Fetch the raw response body for a sport's odds, recording quota headers."""
+        key = request.key
+        headers = self._conditional_headers(key)
+        response = await self.resilience.acall(
+            request.url,
+            lambda attempt_timeout: self.http_client.get(
+                request.url, params=request.params, headers=headers, timeout=attempt_timeout
+            ),
+            timeout=timeout,
+            deadline=request.deadline
+        )
+        # Error responses (429s included) still report the quota
+        self.quota.record(self.api_key, response.headers)
+        
+        if response.status_code == 304:
+            content = self._not_modified_content(key)
+            if content is not None:
+                return content
+        
+        if response.status_code != 200:
+            print(f"❌ API Error: {response.status_code} - {response.text}")
+            raise Exception(f"API returned {response.status_code}: {response.text}")
+        
+        body: bytes = response.content
+        self._remember_response(key, response.headers, body)
+        return body
+    
+    async def _fetch_sport_odds(self, sport: str, hours: int, deadline: Optional[Deadline] = None) -> OddsTable:
+        """
+        Fetch odds for a specific sport through the shared cache.
+        
+        Mirrors OddsClient._download_sport_odds: each sport's body is kept
+        for its own TTL and served stale while one background request
+        refreshes it. Bodies identical to the last one are not parsed again.
+        """
+        request = self._sport_odds_request(sport, hours, deadline=deadline)
+        if self.config.odds_cache_ttl_seconds <= 0:
+            table = self._parse_unchanged(request.key, sport, await self._fetch_sport_content(request))
+            if self.config.adaptive_ttl:
+                self.ttl_policy.observe(request.key, table)
+            return table
+        
+        content = await self.cache.aget_or_compute(
+            request.key,
+            lambda: self._fetch_sport_content(request),
+            ttl=self._content_ttl(request),
+            stale_ttl=self.config.odds_cache_stale_seconds
+        )
+        return self._parse_unchanged(request.key, sport, content)
@@ -0,0 +1,390 @@
+"""
+Streaming prediction-market prices.
+
+The web report otherwise sees Kalshi prices only as fresh as its last full
+/markets listing. PriceFeedSubscriber, started by the app lifespan, keeps a
+websocket open to the exchange's ticker channel and writes every update into
+a PriceBook keyed by market ticker, an in-memory table the report reads with
+no network call. Quotes not updated within the book's max_age are dropped, so
+subscribing to every market does not grow the table without bound. The transport is pluggable so the
+subscriber can run against InMemoryTransport, a local stand-in server, in tests.
+"""
+
+import asyncio
+import dataclasses
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Protocol, Sequence, TypeVar
+
+from src.core.models import KalshiMarket
+from src.core.records import MarketRecord
+
+
+# Tradeable last_price bounds, matching KalshiMarket
+MIN_LAST_PRICE = 0.01
+MAX_LAST_PRICE = 0.99
+
+# Seconds a quote is kept after its last update unless the book is configured
+DEFAULT_MAX_QUOTE_AGE = 3600.0
+
+MarketT = TypeVar('MarketT', MarketRecord, KalshiMarket)
+
+
+class PriceQuote(NamedTuple):
+    """Latest streamed state of one market; prices are probabilities in [0, 1]."""
+    last_price: Optional[float]
+    yes_bid: Optional[float]
+    yes_ask: Optional[float]
+    volume: Optional[int]
+    updated_at: float
+
+
+class PriceBook:
+    """Thread-safe latest-quote table keyed by market_id."""
+    
+    def __init__(self, clock: Callable[[], float] = time.time, max_age: float = DEFAULT_MAX_QUOTE_AGE):
+        """
+        Args:
+            clock: Wall-clock time source, in seconds since the epoch
+            max_age: Seconds a quote is kept after its last update (settled
+                and expired markets stop updating and age out)
+        """
+        self.clock = clock
+        self.max_age = max_age
+        # Bumped on every update, so readers can tell whether anything changed
+        self.version = 0
+        self._quotes: Dict[str, PriceQuote] = {}
+        # Arrival time per market, least recently updated first
+        self._received_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def update(
+        self,
+        market_id: str,
+        last_price: Optional[float] = None,
+        yes_bid: Optional[float] = None,
+        yes_ask: Optional[float] = None,
+        volume: Optional[int] = None,
+        updated_at: Optional[float] = None
+    ) -> PriceQuote:
+        """
+        Merge a (possibly partial) update into a market's quote.
+        
+        Fields left as None keep their previous value, since ticker messages
+        only carry what changed. Quotes not updated within max_age are
+        dropped along the way.
+        
+        Args:
+            market_id: Market the update is for
+            last_price: Last traded price
+            yes_bid: Best YES bid
+            yes_ask: Best YES ask
+            volume: Traded volume
+            updated_at: Time of the update (defaults to now)
+        
+        Returns:
+            The merged quote
+        """
+        now = self.clock()
+        with self._lock:
+            previous = self._quotes.get(market_id)
+            quote = PriceQuote(
+                last_price=last_price if last_price is not None else (previous.last_price if previous else None),
+                yes_bid=yes_bid if yes_bid is not None else (previous.yes_bid if previous else None),
+                yes_ask=yes_ask if yes_ask is not None else (previous.yes_ask if previous else None),
+                volume=volume if volume is not None else (previous.volume if previous else None),
+                updated_at=updated_at if updated_at is not None else now
+            )
+            self._quotes[market_id] = quote
+            self._received_at.pop(market_id, None)
+            self._received_at[market_id] = now
+            self.version += 1
+            self._prune(now)
+        return quote
+    
+    def get(self, market_id: str, max_age: Optional[float] = None) -> Optional[PriceQuote]:
+        """Get a market's quote, or None if unknown or older than max_age seconds."""
+        with self._lock:
+            quote = self._quotes.get(market_id)
+        if quote is None or (max_age is not None and self.clock() - quote.updated_at > max_age):
+            return None
+        return quote
+    
+    def snapshot(self) -> Dict[str, PriceQuote]:
+        """Get a copy of every quote."""
+        with self._lock:
+            return dict(self._quotes)
+    
+    def apply(self, markets: Sequence[MarketT], max_age: Optional[float] = None) -> List[MarketT]:
+        """
+        Overlay streamed prices on polled markets.
+        
+        Markets with a quote no older than max_age get its last price (when
+        tradeable) and volume; the rest are returned unchanged. Inputs are
+        never mutated.
+        
+        Args:
+            markets: Markets from the last /markets listing
+            max_age: Oldest quote to use, in seconds (any age if None)
+        
+        Returns:
+            Markets with live prices, in input order
+        """
+        if not len(self):
+            return list(markets)
+        
+        updated = []
+        for market in markets:
+            quote = self.get(market.market_id, max_age)
+            changes: Dict[str, Any] = {}
+            if quote is not None:
+                if quote.last_price is not None and MIN_LAST_PRICE <= quote.last_price <= MAX_LAST_PRICE:
+                    changes['last_price'] = quote.last_price
+                if quote.volume is not None:
+                    changes['volume'] = quote.volume
+            
+            if not changes:
+                updated.append(market)
+            elif isinstance(market, MarketRecord):
+                updated.append(dataclasses.replace(market, **changes))
+            else:
+                updated.append(market.model_copy(update=changes))
+        return updated
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._quotes)
+    
+    def _prune(self, now: float) -> None:
+        """Drop quotes not updated within max_age; the caller holds the lock."""
+        cutoff = now - self.max_age
+        stale = []
+        for market_id, received_at in self._received_at.items():
+            if received_at >= cutoff:
+                break
+            stale.append(market_id)
+        for market_id in stale:
+            del self._received_at[market_id]
+            del self._quotes[market_id]
+
+
+class FeedConnection(Protocol):
+    """One open feed connection; websockets client connections satisfy this."""
+    
+    async def send(self, message: str) -> None: ...
+    
+    async def recv(self) -> str: ...
+    
+    async def close(self) -> None: ...
+
+
+# Opens a connection to a URL with the given headers
+FeedTransport = Callable[[str, Dict[str, str]], Awaitable[FeedConnection]]
+
+
+async def websocket_transport(url: str, headers: Dict[str, str]) -> FeedConnection:
+    """Open a websocket with the optional `websockets` package."""
+    try:
+        import websockets
+    except ImportError as e:
+        raise RuntimeError("The live price feed needs the 'websockets' package (pip install edgefinder[live])") from e
+    
+    # additional_headers needs websockets >= 14
+    connection: FeedConnection = await websockets.connect(url, additional_headers=headers)
+    return connection
+
+
+class InMemoryTransport:
+    """
+    Local stand-in for the feed server.
+    
+    Each connect() opens a connection that receives whatever publish() queues
+    and records what the client sends. disconnect() drops the current
+    connection so reconnect handling can be exercised.
+    """
+    
+    def __init__(self) -> None:
+        self.connections = 0
+        self.sent: List[Dict[str, Any]] = []
+        self._inbox: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._connected = asyncio.Event()
+    
+    async def __call__(self, url: str, headers: Dict[str, str]) -> FeedConnection:
+        self.connections += 1
+        self._inbox = asyncio.Queue()
+        self._connected.set()
+        return _InMemoryConnection(self, self._inbox)
+    
+    async def wait_connected(self) -> None:
+        """Wait until a client is connected."""
+        await self._connected.wait()
+    
+    async def publish(self, message: Dict[str, Any]) -> None:
+        """Send a message to the connected client."""
+        await self.wait_connected()
+        await self._inbox.put(json.dumps(message))
+    
+    async def disconnect(self) -> None:
+        """Drop the connected client."""
+        await self.wait_connected()
+        self._connected.clear()
+        await self._inbox.put(None)
+
+
+class _InMemoryConnection:
+    """Client side of an InMemoryTransport connection."""
+    
+    def __init__(self, transport: InMemoryTransport, inbox: asyncio.Queue[Optional[str]]):
+        self._transport = transport
+        self._inbox = inbox
+    
+    async def send(self, message: str) -> None:
+        self._transport.sent.append(json.loads(message))
+    
+    async def recv(self) -> str:
+        message = await self._inbox.get()
+        if message is None:
+            raise ConnectionError("stand-in server closed the connection")
+        return message
+    
+    async def close(self) -> None:
+        pass
+
+
+class PriceFeedSubscriber:
+    """Keeps a ticker subscription open and writes its updates into a PriceBook."""
+    
+    def __init__(
+        self,
+        book: PriceBook,
+        url: str,
+        transport: FeedTransport = websocket_transport,
+        headers: Optional[Callable[[], Dict[str, str]]] = None,
+        market_ids: Optional[List[str]] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0
+    ):
+        """
+        Args:
+            book: Table updates are written to
+            url: Feed websocket URL
+            transport: Opens feed connections (websockets by default)
+            headers: Called on every (re)connect for auth headers, so tokens stay fresh
+            market_ids: Markets to subscribe to (every market if None)
+            reconnect_delay: First delay after a dropped connection, in seconds
+            max_reconnect_delay: Cap on the doubling reconnect delay, in seconds
+        """
+        self.book = book
+        self.url = url
+        self.transport = transport
+        self.headers = headers
+        self.market_ids = market_ids
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.messages = 0
+        self.received = 0
+        self.reconnects = 0
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the background subscription loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="price-feed")
+    
+    async def stop(self) -> None:
+        """Stop the background subscription loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        """Stay subscribed, reconnecting with exponential backoff."""
+        delay = self.reconnect_delay
+        while True:
+            received = self.received
+            try:
+                await self._consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.received > received:
+                    # The connection worked, so the backoff starts over
+                    delay = self.reconnect_delay
+                print(f"⚠️ Price feed disconnected ({e}), reconnecting in {delay:.0f}s")
+            
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+    
+    async def _consume(self) -> None:
+        """Open one connection, subscribe and apply updates until it drops."""
+        connection = await self.transport(self.url, self.headers() if self.headers else {})
+        try:
+            await connection.send(json.dumps(self._subscribe_command()))
+            while True:
+                raw = await connection.recv()
+                self.received += 1
+                self.handle_message(raw)
+        finally:
+            await connection.close()
+    
+    def _subscribe_command(self) -> Dict[str, Any]:
+        """Build the ticker channel subscription command."""
+        params: Dict[str, Any] = {'channels': ['ticker']}
+        if self.market_ids:
+            params['market_tickers'] = list(self.market_ids)
+        return {'id': 1, 'cmd': 'subscribe', 'params': params}
+    
+    def handle_message(self, raw: str) -> Optional[PriceQuote]:
+        """
+        Apply one feed message to the book.
+        
+        Ticker messages quote prices in cents; they are stored as
+        probabilities to match MarketRecord.last_price. Other message types
+        (subscription acks, errors) are ignored.
+        
+        Args:
+            raw: JSON message text
+        
+        Returns:
+            The updated quote, or None if the message was not a ticker update
+        """
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            print(f"⚠️ Ignoring malformed price feed message: {raw[:80]}")
+            return None
+        
+        if not isinstance(message, dict) or message.get('type') != 'ticker':
+            return None
+        
+        data = message.get('msg')
+        if not isinstance(data, dict):
+            return None
+        market_id = data.get('market_ticker')
+        if not market_id:
+            return None
+        
+        self.messages += 1
+        return self.book.update(
+            market_id,
+            last_price=_cents(data.get('price')),
+            yes_bid=_cents(data.get('yes_bid')),
+            yes_ask=_cents(data.get('yes_ask')),
+            volume=data.get('volume'),
+            updated_at=data.get('ts')
+        )
+
+
+def _cents(value: Any) -> Optional[float]:
+    """Convert a price in cents to a probability."""
+    return None if value is None else float(value) / 100
+
+
+# Global book shared by the feed subscriber and the web report
+price_book = PriceBook()
@@ -0,0 +1,129 @@
+"""
+Request quota accounting for TheOddsAPI.
+
+Every TheOddsAPI response carries x-requests-remaining, x-requests-used and
+x-requests-last headers. QuotaTracker records them per API key so callers can
+report usage and stretch refresh intervals before the quota runs out, rather
+than failing hard once it has.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+
+class QuotaStatus(NamedTuple):
+    """Latest quota headers seen for one API key."""
+    remaining: Optional[int]
+    used: Optional[int]
+    last_cost: Optional[int]
+    updated_at: float
+    
+    @property
+    def remaining_fraction(self) -> Optional[float]:
+        """Share of the quota still available, if both counters are known."""
+        if self.remaining is None or self.used is None or self.remaining + self.used <= 0:
+            return None
+        return self.remaining / (self.remaining + self.used)
+
+
+class QuotaTracker:
+    """Records quota headers per API key and derives a refresh slowdown factor."""
+    
+    def __init__(
+        self,
+        low_fraction: float = 0.2,
+        reserve: int = 10,
+        max_slowdown: float = 8.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            low_fraction: Remaining share of the quota below which refreshes slow down
+            reserve: Remaining requests at or below which refreshes run at max_slowdown
+            max_slowdown: Largest factor applied to refresh intervals
+            clock: Wall-clock time source, in seconds since the epoch
+        """
+        self.low_fraction = low_fraction
+        self.reserve = reserve
+        self.max_slowdown = max_slowdown
+        self.clock = clock
+        self._statuses: Dict[str, QuotaStatus] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, api_key: str, headers: Mapping[str, str]) -> Optional[QuotaStatus]:
+        """
+        Record the quota headers of one response.
+        
+        Args:
+            api_key: Key the request was made with
+            headers: Response headers (case-insensitive mapping)
+        
+        Returns:
+            Updated status, or None if the response carried no quota headers
+        """
+        remaining = _header_int(headers, 'x-requests-remaining')
+        used = _header_int(headers, 'x-requests-used')
+        if remaining is None and used is None:
+            return None
+        
+        status = QuotaStatus(remaining, used, _header_int(headers, 'x-requests-last'), self.clock())
+        with self._lock:
+            self._statuses[key_id(api_key)] = status
+        return status
+    
+    def get(self, api_key: str) -> Optional[QuotaStatus]:
+        """Get the latest status recorded for an API key."""
+        with self._lock:
+            return self._statuses.get(key_id(api_key))
+    
+    def statuses(self) -> Dict[str, QuotaStatus]:
+        """Get every recorded status, keyed by a non-reversible key id."""
+        with self._lock:
+            return dict(self._statuses)
+    
+    def slowdown(self, api_key: str) -> float:
+        """
+        Get the factor to stretch refresh intervals by for an API key.
+        
+        1.0 while at least low_fraction of the quota remains, then growing
+        in inverse proportion to what is left, up to max_slowdown once only
+        the reserve remains.
+        
+        Args:
+            api_key: Key whose quota to check
+        
+        Returns:
+            Factor of at least 1.0
+        """
+        status = self.get(api_key)
+        if status is None or status.remaining is None:
+            return 1.0
+        if status.remaining <= self.reserve:
+            return self.max_slowdown
+        
+        fraction = status.remaining_fraction
+        if fraction is None or fraction >= self.low_fraction:
+            return 1.0
+        return min(self.low_fraction / max(fraction, 1e-9), self.max_slowdown)
+
+
+def key_id(api_key: str) -> str:
+    """Short, non-reversible identifier for an API key, safe to log or expose."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer header; TheOddsAPI may send floats such as "480.0"."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+# Global tracker shared by every odds client in the process
+quota_tracker = QuotaTracker()
@@ -0,0 +1,370 @@
+"""
+Retries, circuit breaking and deadlines for upstream HTTP calls.
+
+Every upstream call goes through a Resilience instance, which:
+- retries connection errors, timeouts, 429s and 5xx responses with jittered
+  exponential backoff
+- fails fast through a per-host circuit breaker once a host keeps failing
+- clamps every attempt's timeout to the caller's Deadline
+
+The sync (requests) and async (httpx) clients share one process-wide
+instance, so a host tripped by one path is skipped by the others.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+from src.core.models import Config
+
+
+# Status codes worth retrying: rate limiting and server-side failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Transport-level errors worth retrying, for both HTTP stacks
+RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+
+
+class UpstreamUnavailable(Exception):
+    """An upstream call was not attempted or abandoned by the resilience layer."""
+
+
+class CircuitOpenError(UpstreamUnavailable):
+    """The host's circuit breaker is open."""
+
+
+class DeadlineExceeded(UpstreamUnavailable):
+    """The caller's deadline ran out."""
+
+
+class Deadline:
+    """A point in time by which a run has to finish."""
+    
+    def __init__(self, seconds: Optional[float], clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            seconds: Time budget from now (None or <= 0 means no deadline)
+            clock: Monotonic time source, in seconds
+        """
+        self.clock = clock
+        self.expires_at = clock() + seconds if seconds and seconds > 0 else None
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - self.clock(), 0.0)
+    
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+    
+    def timeout(self, default: float) -> float:
+        """
+        Clamp a request timeout to the time left.
+        
+        Raises:
+            DeadlineExceeded: If no time is left
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if remaining <= 0:
+            raise DeadlineExceeded("run deadline exceeded")
+        return min(default, remaining)
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one host.
+    
+    After failure_threshold consecutive failures the breaker opens and calls
+    fail fast for reset_timeout seconds. Then one trial call is let through:
+    success closes the breaker, failure opens it for another reset_timeout.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            return self._state()
+    
+    def allow(self) -> bool:
+        """Check whether a call may go ahead, claiming the trial slot when half-open."""
+        with self._lock:
+            state = self._state()
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """Close the breaker."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker at the threshold or after a failed trial."""
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial_in_flight = False
+    
+    def release(self) -> None:
+        """Give back a claimed trial slot without counting a failure, for calls abandoned locally."""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+
+class Resilience:
+    """Retry, circuit-breaker and deadline policy applied around upstream calls."""
+    
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 4.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Args:
+            attempts: Tries per call, including the first
+            base_delay: Backoff before the first retry, in seconds, doubling per retry
+            max_delay: Cap on the backoff, in seconds
+            failure_threshold: Consecutive failures that open a host's breaker
+            reset_timeout: Seconds an open breaker waits before a trial call
+            clock: Monotonic time source, in seconds
+            sleep: Blocking sleep used between sync retries
+            rng: Uniform [0, 1) source for backoff jitter
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Config) -> 'Resilience':
+        """Create a policy with the configured retry and breaker settings."""
+        return cls(
+            attempts=config.http_retry_attempts,
+            failure_threshold=config.circuit_failure_threshold,
+            reset_timeout=config.circuit_reset_seconds
+        )
+    
+    def configure(self, config: Config) -> None:
+        """Apply configured settings in place, keeping breaker state."""
+        configured = self.from_config(config)
+        self.attempts = configured.attempts
+        self.failure_threshold = configured.failure_threshold
+        self.reset_timeout = configured.reset_timeout
+        with self._lock:
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = self.failure_threshold
+                breaker.reset_timeout = self.reset_timeout
+    
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Get the breaker for a URL's host."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.clock)
+                self._breakers[host] = breaker
+            return breaker
+    
+    def breaker_states(self) -> Dict[str, str]:
+        """Get every known host's breaker state."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.state for host, breaker in breakers.items()}
+    
+    def backoff(self, retry: int) -> float:
+        """Full-jitter delay before retry number `retry` (0-based)."""
+        return self.rng() * min(self.max_delay, self.base_delay * 2.0 ** retry)
+    
+    def call(
+        self,
+        url: str,
+        send: Callable[[float], Any],
+        timeout: float = 30.0,
+        deadline: Optional[Deadline] = None
+    ) -> Any:
+        """
+        Make a blocking call with retries.
+        
+        Args:
+            url: Request URL, whose host picks the breaker
+            send: Makes one attempt given its timeout, returning a response
+            timeout: Per-attempt timeout before clamping to the deadline
+            deadline: Run deadline bounding every attempt and backoff
+        
+        Returns:
+            The last response; one with a retryable status is returned once
+            attempts run out so callers keep their own status handling
+        
+        Raises:
+            CircuitOpenError: If the host's breaker is open
+            DeadlineExceeded: If the deadline ran out before an attempt
+        """
+        breaker = self.breaker(url)
+        for attempt in range(self.attempts):
+            attempt_timeout = self._start(breaker, url, timeout, deadline)
+            try:
+                response, error = send(attempt_timeout), None
+            except RETRY_EXCEPTIONS as e:
+                response, error = None, e
+            except BaseException:
+                # Cancellation or a local error says nothing about the host, so
+                # only free a half-open trial slot before propagating
+                breaker.release()
+                raise
+            self._record(breaker, response)
+            delay = self._retry_delay(attempt, response, error, deadline)
+            if delay is None:
+                return self._finish(response, error)
+            self.sleep(delay)
+    
+    async def acall(
+        self,
+        url: str,
+        send: Callable[[float], Awaitable[Any]],
+        timeout: float = 30.0,
+        deadline: Optional[Deadline] = None
+    ) -> Any:
+        """Async counterpart of call(); send returns an awaitable response."""
+        breaker = self.breaker(url)
+        for attempt in range(self.attempts):
+            attempt_timeout = self._start(breaker, url, timeout, deadline)
+            try:
+                response, error = await send(attempt_timeout), None
+            except RETRY_EXCEPTIONS as e:
+                response, error = None, e
+            except BaseException:
+                breaker.release()
+                raise
+            self._record(breaker, response)
+            delay = self._retry_delay(attempt, response, error, deadline)
+            if delay is None:
+                return self._finish(response, error)
+            await asyncio.sleep(delay)
+    
+    def _start(self, breaker: CircuitBreaker, url: str, timeout: float, deadline: Optional[Deadline]) -> float:
+        """Check the deadline and breaker before an attempt and get its timeout."""
+        attempt_timeout = deadline.timeout(timeout) if deadline is not None else timeout
+        if not breaker.allow():
+            raise CircuitOpenError(f"circuit open for {urlsplit(url).netloc}")
+        return attempt_timeout
+    
+    def _record(self, breaker: CircuitBreaker, response: Any) -> None:
+        """Count a transport error or retryable status as a breaker failure."""
+        if response is None or response.status_code in RETRY_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    
+    def _retry_delay(
+        self,
+        attempt: int,
+        response: Any,
+        error: Optional[BaseException],
+        deadline: Optional[Deadline]
+    ) -> Optional[float]:
+        """Get the backoff before the next attempt, or None to stop retrying."""
+        if error is None and response.status_code not in RETRY_STATUSES:
+            return None
+        if attempt + 1 >= self.attempts:
+            return None
+        
+        delay = self.backoff(attempt)
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+    
+    def _finish(self, response: Any, error: Optional[BaseException]) -> Any:
+        """Return the final response or re-raise the final error."""
+        if error is not None:
+            raise error
+        return response
+
+
+async def gather_within(aws: Iterable[Awaitable[Any]], deadline: Optional[Deadline]) -> List[Any]:
+    """
+    Run awaitables concurrently, keeping whatever finished by the deadline.
+    
+    Like asyncio.gather(..., return_exceptions=True), except that awaitables
+    still running at the deadline are cancelled and reported as
+    DeadlineExceeded instances in their slot.
+    
+    Args:
+        aws: Awaitables to run
+        deadline: Run deadline (None waits for everything)
+    
+    Returns:
+        Results or exceptions, in input order
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    
+    _, pending = await asyncio.wait(tasks, timeout=deadline.remaining() if deadline is not None else None)
+    for task in pending:
+        task.cancel()
+    
+    results: List[Any] = []
+    for task in tasks:
+        if task in pending:
+            results.append(DeadlineExceeded("run deadline exceeded"))
+        elif task.exception() is not None:
+            results.append(task.exception())
+        else:
+            results.append(task.result())
+    return results
+
+
+# Global policy shared by every upstream client in the process
+resilience = Resilience()
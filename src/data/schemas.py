@@ -0,0 +1,67 @@
+"""
+Upstream response schemas validated straight from raw bytes.
+
+TypeAdapter.validate_json parses and validates a whole response in one call
+inside pydantic-core, so clients skip building a generic dict tree with
+response.json() and the per-object try/except while walking it. Only the
+fields the clients read are declared; anything else in the payload is ignored.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+from typing_extensions import Required, TypedDict
+
+
+class OddsOutcome(TypedDict, total=False):
+    """One outcome of a TheOddsAPI bookmaker market."""
+    name: str
+    price: float
+    point: float
+
+
+class OddsMarket(TypedDict, total=False):
+    """A TheOddsAPI bookmaker market (h2h, spreads, totals)."""
+    key: str
+    outcomes: List[OddsOutcome]
+
+
+class OddsBookmaker(TypedDict, total=False):
+    """A bookmaker's markets for one game."""
+    key: str
+    title: str
+    markets: List[OddsMarket]
+
+
+class OddsGamePayload(TypedDict, total=False):
+    """One game from TheOddsAPI /sports/{sport}/odds."""
+    id: str
+    sport_key: str
+    commence_time: Required[datetime]
+    home_team: str
+    away_team: str
+    bookmakers: List[OddsBookmaker]
+
+
+class KalshiMarketPayload(TypedDict, total=False):
+    """One market from the Kalshi /markets endpoint."""
+    ticker: str
+    id: str
+    title: str
+    event_time: Required[datetime]
+    last_price: float
+    volume: int
+    open_interest: Optional[int]
+    market_side: str
+    outcome_description: str
+
+
+class KalshiMarketsPayload(TypedDict, total=False):
+    """A page of the Kalshi /markets endpoint."""
+    markets: List[KalshiMarketPayload]
+    cursor: Optional[str]
+
+
+ODDS_PAYLOAD_ADAPTER = TypeAdapter(List[OddsGamePayload])
+KALSHI_MARKETS_ADAPTER = TypeAdapter(KalshiMarketsPayload)
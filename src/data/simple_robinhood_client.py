@@ -4,25 +4,27 @@ This creates realistic prediction market data based on sportsbook odds.
 """
 
 import random
-from typing import List, Optional
-from src.core.models import KalshiMarket, Config
+from typing import Any, Dict, List, Optional
+from src.core.models import Config
+from src.core.records import MarketRecord
 from src.data.odds_client import OddsClient
 
 
 class SimpleRobinhoodClient:
     """Simple client for Robinhood prediction markets."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, odds_client: Optional[OddsClient] = None):
         self.config = config
-        self.odds_client = OddsClient(config)
+        # Accept a shared client so a pipeline run downloads each sport once
+        self.odds_client = odds_client or OddsClient(config)
     
-    def get_prediction_markets(self, lookahead_hours: Optional[int] = None) -> List[KalshiMarket]:
+    def get_prediction_markets(self, lookahead_hours: Optional[int] = None) -> List[MarketRecord]:
         """Get Robinhood prediction markets for sports events."""
         if self.config.use_fixtures:
             return self._get_fixture_markets()
         
-        # Get real sportsbook odds
-        sportsbook_odds = self.odds_client.get_odds()
+        # Get real sportsbook odds; one market pair per game, priced off its first-listed book
+        sportsbook_odds = self.odds_client.get_odds_table().to_records(primary_only=True)
         
         # Convert sportsbook odds to Robinhood prediction markets
         prediction_markets = []
@@ -34,7 +36,7 @@ class SimpleRobinhoodClient:
         
         return prediction_markets
     
-    def _create_prediction_markets_from_odds(self, odds) -> List[KalshiMarket]:
+    def _create_prediction_markets_from_odds(self, odds) -> List[MarketRecord]:
         """Create Robinhood prediction markets from sportsbook odds."""
         markets = []
         
@@ -47,7 +49,7 @@ class SimpleRobinhoodClient:
         away_robinhood_prob = self._add_market_inefficiency(away_prob)
         
         # Create prediction markets for each team winning
-        home_market = KalshiMarket(
+        home_market = MarketRecord(
             market_id=f"robinhood-{odds.game_id}-home-win",
             title=f"Will {odds.home_team} beat {odds.away_team}?",
             event_time=odds.start_time,
@@ -57,7 +59,7 @@ class SimpleRobinhoodClient:
             outcome_description=f"{odds.home_team} wins"
         )
         
-        away_market = KalshiMarket(
+        away_market = MarketRecord(
             market_id=f"robinhood-{odds.game_id}-away-win",
             title=f"Will {odds.away_team} beat {odds.home_team}?",
             event_time=odds.start_time,
@@ -86,7 +88,7 @@ class SimpleRobinhoodClient:
         # Ensure probability stays between 0.01 and 0.99
         return max(0.01, min(0.99, adjusted_prob))
     
-    def _get_fixture_markets(self) -> List[KalshiMarket]:
+    def _get_fixture_markets(self) -> List[MarketRecord]:
         """Get fixture prediction markets for testing."""
         from datetime import datetime, timedelta
         import pytz
@@ -95,7 +97,7 @@ class SimpleRobinhoodClient:
         now = datetime.now(tz)
         
         # Create some realistic fixture markets
-        fixtures = [
+        fixtures: List[Dict[str, Any]] = [
             {
                 "home_team": "Seattle Seahawks",
                 "away_team": "Jacksonville Jaguars",
@@ -119,7 +121,7 @@ class SimpleRobinhoodClient:
         markets = []
         for fixture in fixtures:
             # Home team market
-            home_market = KalshiMarket(
+            home_market = MarketRecord(
                 market_id=f"robinhood-fixture-{fixture['home_team'].lower().replace(' ', '-')}-win",
                 title=f"Will {fixture['home_team']} beat {fixture['away_team']}?",
                 event_time=fixture['start_time'],
@@ -130,7 +132,7 @@ class SimpleRobinhoodClient:
             )
             
             # Away team market
-            away_market = KalshiMarket(
+            away_market = MarketRecord(
                 market_id=f"robinhood-fixture-{fixture['away_team'].lower().replace(' ', '-')}-win",
                 title=f"Will {fixture['away_team']} beat {fixture['home_team']}?",
                 event_time=fixture['start_time'],
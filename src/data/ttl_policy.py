@@ -0,0 +1,179 @@
+"""
+Cache lifetime policy driven by time to game and observed price movement.
+
+Odds for a game days away barely move, while odds close to kickoff (or in
+play) move quickly. TTLPolicy gives each payload a lifetime proportional to
+the time until its nearest game, shortened further when prices moved a lot
+between consecutive observations of the same key.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, NamedTuple
+
+import numpy as np
+
+from src.core.models import Config
+from src.core.odds_math import american_to_implied_probability_array
+from src.core.odds_table import OddsTable
+
+
+class _Observation(NamedTuple):
+    """Last state seen for a cache key."""
+    observed_at: float
+    ttl: float
+    volatility: float
+    probs: Dict[str, float]
+
+
+class TTLPolicy:
+    """Derives per-key cache TTLs from the nearest start time and price volatility."""
+    
+    def __init__(
+        self,
+        min_ttl: float = 30,
+        max_ttl: float = 1800,
+        lead_fraction: float = 1 / 60,
+        volatility_scale: float = 0.002,
+        smoothing: float = 0.5,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            min_ttl: Shortest lifetime, used for games starting now or in play
+            max_ttl: Longest lifetime, used for far-off games or empty payloads
+            lead_fraction: Fraction of the time to the nearest game used as TTL
+                (1/60 gives one minute of TTL per hour of lead time)
+            volatility_scale: Implied-probability change per minute that halves the TTL
+            smoothing: Weight of the newest volatility sample in the moving average
+            clock: Wall-clock time source, in seconds since the epoch
+        """
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.lead_fraction = lead_fraction
+        self.volatility_scale = volatility_scale
+        self.smoothing = smoothing
+        self.clock = clock
+        self._observations: Dict[str, _Observation] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Config) -> 'TTLPolicy':
+        """Create a policy with the configured TTL bounds."""
+        return cls(min_ttl=config.odds_ttl_min_seconds, max_ttl=config.odds_ttl_max_seconds)
+    
+    def ttl(self, start_times: Iterable[datetime], volatility: float = 0.0) -> float:
+        """
+        Compute a TTL without recording anything.
+        
+        Args:
+            start_times: Start times of the games in a payload (naive times are UTC)
+            volatility: Implied-probability change per minute
+        
+        Returns:
+            TTL in seconds between min_ttl and max_ttl
+        """
+        now = self.clock()
+        leads = [_timestamp(start) - now for start in start_times]
+        upcoming = [lead for lead in leads if lead > 0]
+        
+        if upcoming:
+            ttl = min(upcoming) * self.lead_fraction
+        elif leads:
+            # Every game has started; in-play prices move fastest
+            ttl = self.min_ttl
+        else:
+            ttl = self.max_ttl
+        
+        ttl /= 1 + volatility / self.volatility_scale
+        return float(min(max(ttl, self.min_ttl), self.max_ttl))
+    
+    def observe(self, key: str, table: OddsTable) -> float:
+        """
+        Record a fresh payload for key and get its TTL.
+        
+        Volatility is the mean absolute change per minute in each game's
+        consensus away-side implied probability since the previous
+        observation of key, smoothed with an exponential moving average.
+        
+        Args:
+            key: Cache key the payload belongs to
+            table: Parsed payload
+        
+        Returns:
+            TTL in seconds
+        """
+        now = self.clock()
+        probs = _consensus_away_probs(table)
+        
+        with self._lock:
+            previous = self._observations.get(key)
+        
+        volatility = 0.0
+        if previous is not None:
+            volatility = previous.volatility
+            common = probs.keys() & previous.probs.keys()
+            minutes = (now - previous.observed_at) / 60
+            if common and minutes > 0:
+                change = float(np.mean([abs(probs[game_id] - previous.probs[game_id]) for game_id in common]))
+                volatility = self.smoothing * change / minutes + (1 - self.smoothing) * previous.volatility
+        
+        ttl = self.ttl((game.start_time for game in table.games), volatility)
+        with self._lock:
+            self._observations[key] = _Observation(now, ttl, volatility, probs)
+        return ttl
+    
+    def next_refresh(self, default: float) -> float:
+        """
+        Get seconds until the soonest observed key goes stale.
+        
+        Observations older than max_ttl are ignored, so keys that are no
+        longer fetched stop influencing the schedule.
+        
+        Args:
+            default: Seconds to return when nothing has been observed
+        
+        Returns:
+            Seconds between min_ttl and max_ttl, or default
+        """
+        now = self.clock()
+        with self._lock:
+            remaining = [
+                observation.observed_at + observation.ttl - now
+                for observation in self._observations.values()
+                if now - observation.observed_at <= self.max_ttl
+            ]
+        
+        if not remaining:
+            return default
+        return float(min(max(min(remaining), self.min_ttl), self.max_ttl))
+    
+    def volatility(self, key: str) -> float:
+        """Get the smoothed volatility last observed for key (0.0 if never observed)."""
+        with self._lock:
+            observation = self._observations.get(key)
+        return observation.volatility if observation else 0.0
+
+
+def _timestamp(moment: datetime) -> float:
+    """Get a POSIX timestamp, treating naive datetimes as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _consensus_away_probs(table: OddsTable) -> Dict[str, float]:
+    """Get each game's mean away-side implied probability across books."""
+    if not len(table):
+        return {}
+    
+    probs = american_to_implied_probability_array(table.moneyline[:, :, 0])
+    priced = ~np.isnan(probs)
+    counts = priced.sum(axis=1)
+    sums = np.where(priced, probs, 0.0).sum(axis=1)
+    return {
+        game.game_id: float(total / count)
+        for game, total, count in zip(table.games, sums, counts)
+        if count
+    }
@@ -5,20 +5,48 @@ Main entry point for EdgeFinder.
 import os
 import sys
 import argparse
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import PlainTextResponse, HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from src.config import load_config
+from src.core.models import Config
 from src.core.pipeline import EdgeFinderPipeline
+from src.core.records import MarketRecord
+from src.data.cache import cache as shared_cache, configure_shared_cache
+from src.data.http import create_async_http_client
+from src.data.kalshi_client import AsyncKalshiClient
+from src.data.mapping import canonical_team_name, extract_teams_from_kalshi_title, find_team_match
+from src.data.odds_client import AsyncOddsClient
+from src.data.price_feed import PriceFeedSubscriber, price_book
+from src.data.quota import quota_tracker
+from src.data.resilience import Deadline, gather_within, resilience
 from src.render.newsletter import NewsletterRenderer
+from src.services.report_refresher import ReportRefresher
 from src.util.log import setup_logging, get_logger
 
 
-def ensure_output_dir():
+# Sports the web report covers, in display order
+REPORT_SPORTS = [
+    ('americanfootball_nfl', 'NFL'),
+    ('americanfootball_ncaaf', 'College Football'),
+    ('basketball_nba', 'NBA'),
+    ('soccer_epl', 'Premier League'),
+    ('baseball_mlb', 'MLB')
+]
+
+# The web report covers the coming week's games, like the weekly newsletter.
+# Games further out are no longer requested (the page used to list every
+# upcoming game TheOddsAPI had posted).
+REPORT_LOOKAHEAD_HOURS = 7 * 24
+
+
+def ensure_output_dir() -> Path:
     """Ensure output directory exists."""
     output_dir = Path("out")
     output_dir.mkdir(exist_ok=True)
@@ -35,6 +63,11 @@ def run_pipeline() -> None:
         config = load_config()
         logger.info(f"Loaded configuration: {config.sports_filter}")
         
+        # Serve recent upstream payloads from disk after a restart
+        configure_shared_cache(config)
+        shared_cache.start_sweeper()
+        resilience.configure(config)
+        
         # Ensure output directory
         output_dir = ensure_output_dir()
         
@@ -73,10 +106,61 @@ def run_pipeline() -> None:
 
 def create_app() -> FastAPI:
     """Create FastAPI application."""
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Share one pooled async HTTP client across all upstream API clients."""
+        config = load_config()
+        disk_cache = configure_shared_cache(config)
+        shared_cache.start_sweeper()
+        resilience.configure(config)
+        app.state.http_client = create_async_http_client()
+        app.state.odds_client = AsyncOddsClient(config, app.state.http_client)
+        app.state.kalshi_client = AsyncKalshiClient(config, app.state.http_client)
+        # Each sport's body refreshes on its own TTL through the shared cache, so
+        # report_refresh_seconds is a floor: rebuild later when every sport is
+        # still fresh, and back off further as the TheOddsAPI quota runs low
+        ttl_policy = app.state.odds_client.ttl_policy
+        
+        def next_interval() -> float:
+            interval = config.report_refresh_seconds
+            if config.adaptive_ttl:
+                interval = max(interval, ttl_policy.next_refresh(interval))
+            return interval * quota_tracker.slowdown(config.odds_api_key)
+        
+        app.state.report_refresher = ReportRefresher(
+            generate_simple_real_report,
+            config.report_refresh_seconds,
+            store=disk_cache,
+            next_interval=next_interval
+        )
+        app.state.report_inputs = None
+        app.state.live_report = None
+        app.state.report_refresher.start()
+        # Keep the shared price book live between report builds
+        price_book.max_age = config.price_feed_max_age_seconds
+        app.state.price_feed = None
+        if config.price_feed_url:
+            kalshi_auth = app.state.kalshi_client.auth
+            app.state.price_feed = PriceFeedSubscriber(
+                price_book,
+                config.price_feed_url,
+                headers=lambda: kalshi_auth.get_auth_headers() if kalshi_auth else {}
+            )
+            app.state.price_feed.start()
+        try:
+            yield
+        finally:
+            if app.state.price_feed is not None:
+                await app.state.price_feed.stop()
+            await app.state.report_refresher.stop()
+            await app.state.http_client.aclose()
+            shared_cache.stop_sweeper(timeout=1)
+    
     app = FastAPI(
         title="EdgeFinder",
         description="Sports vs Prediction Markets Analysis",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
     
     # Mount static files
@@ -85,67 +169,82 @@ def create_app() -> FastAPI:
     # Setup templates
     templates = Jinja2Templates(directory="templates")
     
-    def generate_simple_real_report():
+    async def generate_simple_real_report() -> str:
         """Generate a comprehensive report comparing Robinhood prediction markets vs sportsbook odds across multiple sports."""
-        import requests
-        from datetime import datetime
-        import pytz
-        import random
         from src.config import load_config
         
         # Load config
         config = load_config()
+        odds_client = app.state.odds_client
+        kalshi_client = app.state.kalshi_client
         
-        # Define sports to fetch with more games per sport
-        sports = [
-            ('americanfootball_nfl', 'NFL'),
-            ('americanfootball_ncaaf', 'College Football'),
-            ('basketball_nba', 'NBA'),
-            ('soccer_epl', 'Premier League'),
-            ('baseball_mlb', 'MLB')
-        ]
-        
-        all_games_data = []
-        seattle_games = []
-        sport_summaries = {}
-        
-        # Fetch data for each sport
-        for sport_key, sport_name in sports:
-            try:
-                url = f"{config.odds_api_base_url}/sports/{sport_key}/odds"
-                params = {
-                    'apiKey': config.odds_api_key,
-                    'regions': 'us',
-                    'markets': 'h2h',
-                    'oddsFormat': 'american',
-                    'dateFormat': 'iso'
-                }
-                
-                response = requests.get(url, params=params, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"✅ Fetched {len(data)} {sport_name} games")
-                    
-                    # Process games for this sport
-                    sport_games = process_sport_games(data, sport_name, config)
-                    all_games_data.extend(sport_games)
-                    
-                    # Store sport summary
-                    sport_summaries[sport_name] = {
-                        'total_games': len(sport_games),
-                        'games': sport_games[:5]  # Top 5 games per sport
-                    }
-                    
-                    # Check for Seattle games
-                    for game in sport_games:
-                        if 'seattle' in game.get('game', '').lower():
-                            seattle_games.append(game)
-                else:
-                    print(f"❌ Failed to fetch {sport_name}: {response.status_code}")
-                    
-            except Exception as e:
-                print(f"❌ Error fetching {sport_name}: {e}")
+        # Fetch every sport and the Kalshi markets concurrently on the shared
+        # connection pool; anything still loading at the run deadline is
+        # reported as an error and skipped
+        deadline = Deadline(config.run_deadline_seconds)
+        *payloads, kalshi_markets = await gather_within(
+            [
+                *(
+                    odds_client.fetch_sport_payload(
+                        sport_key, REPORT_LOOKAHEAD_HOURS, markets='h2h', timeout=10, deadline=deadline
+                    )
+                    for sport_key, _ in REPORT_SPORTS
+                ),
+                kalshi_client.fetch_markets(REPORT_LOOKAHEAD_HOURS, deadline=deadline)
+            ],
+            deadline
+        )
+        
+        if isinstance(kalshi_markets, Exception):
+            print(f"❌ Error fetching Kalshi markets, simulating prediction prices: {kalshi_markets}")
+            kalshi_markets = []
+        
+        if all(isinstance(data, Exception) for data in payloads):
+            # Raise so the refresher keeps serving its last good snapshot
+            # instead of replacing it with an empty report
+            raise RuntimeError(f"Every sport failed to load: {payloads[0]}")
+        
+        for (_, sport_name), data in zip(REPORT_SPORTS, payloads):
+            if isinstance(data, Exception):
+                print(f"❌ Error fetching {sport_name}: {data}")
+            else:
+                print(f"✅ Fetched {len(data)} {sport_name} games")
+        
+        # Kept so reads can re-render with prices streamed after this build
+        app.state.report_inputs = (price_book.version, config, payloads, kalshi_markets)
+        return render_report(config, payloads, kalshi_markets)
+    
+    def render_report(config: Config, payloads: List[Any], kalshi_markets: List[MarketRecord]) -> str:
+        """Render the report from fetched sport payloads, overlaying the freshest streamed Kalshi prices."""
+        from datetime import datetime
+        import pytz
+        
+        all_games_data: List[Dict[str, Any]] = []
+        seattle_games: List[Dict[str, Any]] = []
+        sport_summaries: Dict[str, Dict[str, Any]] = {}
+        
+        # Overlay fresh streamed prices, keyed by the same market tickers
+        kalshi_markets = price_book.apply(kalshi_markets, config.price_feed_max_age_seconds)
+        
+        for (sport_key, sport_name), data in zip(REPORT_SPORTS, payloads):
+            if isinstance(data, Exception):
                 continue
+            
+            # Process games for this sport
+            market_prices = index_market_prices(kalshi_markets, sport_key)
+            sport_games = process_sport_games(data, sport_key, sport_name, config, market_prices)
+            all_games_data.extend(sport_games)
+            
+            # Store sport summary
+            sport_summaries[sport_name] = {
+                'total_games': len(sport_games),
+                'games': sport_games[:5]  # Top 5 games per sport
+            }
+            
+            # Check for Seattle games
+            for game in sport_games:
+                if 'seattle' in game.get('game', '').lower():
+                    seattle_games.append(game)
         
         if not all_games_data:
             return f"# EdgeFinder: Robinhood vs Sportsbooks\n\n❌ No games data available\n\n"
@@ -212,12 +311,43 @@ def create_app() -> FastAPI:
         report.append("")
         report.append("---")
         report.append("")
-        report.append("*Real-time data from TheOddsAPI and simulated Robinhood prediction markets*")
+        report.append("*Real-time data from TheOddsAPI; prediction market prices from Kalshi where listed, simulated otherwise*")
         
         return "\n".join(report)
     
-    def process_sport_games(data, sport_name, config):
-        """Process games for a specific sport."""
+    def index_market_prices(markets: List[MarketRecord], sport_key: str) -> Dict[FrozenSet[str], Dict[str, float]]:
+        """
+        Index Kalshi prices by game for one sport.
+        
+        Each market prices the team named in its outcome description (else
+        the first team in its title); a NO position prices the other team.
+        
+        Returns:
+            Unordered canonical team pair -> canonical team -> price
+        """
+        prices: Dict[FrozenSet[str], Dict[str, float]] = {}
+        for market in markets:
+            teams = extract_teams_from_kalshi_title(market.title, sport_key)
+            if not teams:
+                continue
+            
+            selection = find_team_match(market.outcome_description, sport_key) if market.outcome_description else None
+            if selection not in teams:
+                selection = teams[0]
+            if market.market_side.upper() == 'NO':
+                selection = teams[1] if selection == teams[0] else teams[0]
+            
+            prices.setdefault(frozenset(teams), {})[selection] = market.last_price
+        return prices
+    
+    def process_sport_games(
+        data: List[Dict[str, Any]],
+        sport_key: str,
+        sport_name: str,
+        config: Config,
+        market_prices: Dict[FrozenSet[str], Dict[str, float]]
+    ) -> List[Dict[str, Any]]:
+        """Process games for a specific sport, using Kalshi prices where the game is listed."""
         import pytz
         from datetime import datetime
         import random
@@ -260,7 +390,7 @@ def create_app() -> FastAPI:
             
             if best_away_odds and best_home_odds:
                 # Convert sportsbook odds to implied probabilities
-                def american_to_prob(odds):
+                def american_to_prob(odds: float) -> float:
                     if odds > 0:
                         return 100 / (odds + 100)
                     else:
@@ -269,9 +399,18 @@ def create_app() -> FastAPI:
                 away_prob = american_to_prob(best_away_odds)
                 home_prob = american_to_prob(best_home_odds)
                 
-                # Simulate Robinhood prediction market odds (with some inefficiency)
-                robinhood_away_prob = away_prob + random.uniform(-0.05, 0.05)
-                robinhood_home_prob = home_prob + random.uniform(-0.05, 0.05)
+                away_key = canonical_team_name(away_team, sport_key)
+                home_key = canonical_team_name(home_team, sport_key)
+                quoted = market_prices.get(frozenset((away_key, home_key)), {})
+                
+                if quoted:
+                    # One listed side implies the other
+                    robinhood_away_prob = quoted.get(away_key, 1 - quoted.get(home_key, 0.5))
+                    robinhood_home_prob = quoted.get(home_key, 1 - robinhood_away_prob)
+                else:
+                    # Simulate Robinhood prediction market odds (with some inefficiency)
+                    robinhood_away_prob = away_prob + random.uniform(-0.05, 0.05)
+                    robinhood_home_prob = home_prob + random.uniform(-0.05, 0.05)
                 
                 # Ensure probabilities stay within bounds
                 robinhood_away_prob = max(0.01, min(0.99, robinhood_away_prob))
@@ -405,7 +544,7 @@ def create_app() -> FastAPI:
             from src.services.newsletter_generator import NewsletterGenerator
             
             generator = NewsletterGenerator()
-            result = generator.send_weekly_newsletters()
+            result = await run_in_threadpool(generator.send_weekly_newsletters)
             
             return result
         except Exception as e:
@@ -456,7 +595,7 @@ def create_app() -> FastAPI:
             from src.services.newsletter_generator import NewsletterGenerator
             
             generator = NewsletterGenerator()
-            report_data = generator.generate_weekly_report()
+            report_data = await run_in_threadpool(generator.generate_weekly_report)
             
             return {
                 "status": "success",
@@ -468,19 +607,29 @@ def create_app() -> FastAPI:
     
     @app.post("/api/refresh")
     async def refresh_latest_report():
-        """Force refresh the latest report with new data."""
-        report = generate_simple_real_report()
-        if not report:
-            raise HTTPException(status_code=500, detail="Failed to generate report")
-        return {"message": "Report refreshed successfully"}
+        """Trigger a background rebuild of the latest report."""
+        app.state.report_refresher.request_refresh()
+        return {"message": "Report refresh scheduled"}
     
     @app.get("/api/latest", response_class=PlainTextResponse)
     async def get_latest_report():
-        """Get the latest report."""
-        try:
-            return generate_simple_real_report()
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to generate report: {str(e)}")
+        """Get the latest pre-built report snapshot, re-rendered with any newer streamed prices."""
+        refresher = app.state.report_refresher
+        snapshot = await refresher.get_snapshot()
+        if snapshot is None:
+            raise HTTPException(status_code=503, detail=f"Failed to generate report: {refresher.last_error}")
+        
+        # Snapshots are rebuilt every few minutes at most, while quotes stream
+        # in continuously: re-render the last fetched inputs (no upstream calls)
+        # once per book change so served prices stay live
+        inputs = app.state.report_inputs
+        if inputs is None or inputs[0] == price_book.version:
+            return snapshot.content
+        key = (snapshot.version, price_book.version)
+        if app.state.live_report is None or app.state.live_report[0] != key:
+            content = await run_in_threadpool(render_report, *inputs[1:])
+            app.state.live_report = (key, content)
+        return app.state.live_report[1]
     
     @app.get("/health")
     async def health_check():
@@ -501,13 +650,22 @@ def create_app() -> FastAPI:
                 "odds_api_key_set": bool(config.odds_api_key),
                 "kalshi_api_key_id_set": bool(getattr(config, 'kalshi_api_key_id', None)),
                 "kalshi_private_key_set": bool(getattr(config, 'kalshi_private_key', None))
-            }
+            },
+            "odds_api_quota": {
+                key: status._asdict()
+                for key, status in quota_tracker.statuses().items()
+            },
+            "price_feed": {
+                "enabled": bool(config.price_feed_url),
+                "markets": len(price_book)
+            },
+            "circuit_breakers": resilience.breaker_states()
         }
     
     return app
 
 
-def main():
+def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="EdgeFinder: Sports vs Prediction Markets Analysis")
     parser.add_argument("command", nargs="?", choices=["serve", "cli"], default="serve", help="Command to run")
@@ -5,14 +5,20 @@ Newsletter generation service.
 import requests
 import random
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pytz
 
 from src.config import load_config
+from src.data.odds_client import odds_query_params
+from src.data.resilience import Deadline, resilience
 from src.models.newsletter import NewsletterData
 from src.services.email_service import EmailService
 
 
+# A weekly send covers the coming week's games, not the pipeline's lookahead
+WEEKLY_REPORT_HOURS = 7 * 24
+
+
 class NewsletterGenerator:
     """Generates and sends weekly newsletters."""
     
@@ -23,11 +29,15 @@ class NewsletterGenerator:
     
     def generate_weekly_report(self) -> Dict[str, Any]:
         """Generate the weekly report data using live data from multiple sports."""
+        # One budget for the whole report, so a slow host cannot stall the send
+        deadline = Deadline(self.config.run_deadline_seconds)
         try:
             # First try to get data from our own website API
             try:
                 website_url = "https://edgefinder-czi3.onrender.com/api/latest"
-                response = requests.get(website_url, timeout=15)
+                response = resilience.call(
+                    website_url, lambda timeout: requests.get(website_url, timeout=timeout), timeout=15, deadline=deadline
+                )
                 if response.status_code == 200:
                     print("✅ Using live data from website")
                     return self._parse_website_data(response.text)
@@ -50,9 +60,12 @@ class NewsletterGenerator:
             seattle_games = []
             
             for sport_key, sport_name in sports:
+                if deadline.expired:
+                    print(f"⚠️ Run deadline reached, skipping {sport_name} and later sports")
+                    break
                 try:
                     print(f"📊 Fetching {sport_name} data...")
-                    games = self._fetch_sport_data(sport_key, sport_name)
+                    games = self._fetch_sport_data(sport_key, sport_name, deadline)
                     all_games_data.extend(games)
                     
                     # Check for Seattle games
@@ -91,18 +104,15 @@ class NewsletterGenerator:
             print(f"❌ Error generating report: {e}")
             return self._get_fallback_data()
     
-    def _fetch_sport_data(self, sport_key: str, sport_name: str) -> List[Dict[str, Any]]:
-        """Fetch data for a specific sport."""
+    def _fetch_sport_data(self, sport_key: str, sport_name: str, deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """Fetch data for a specific sport, retrying transient failures within the deadline."""
         url = f"{self.config.odds_api_base_url}/sports/{sport_key}/odds"
-        params = {
-            'apiKey': self.config.odds_api_key,
-            'regions': 'us',
-            'markets': 'h2h',
-            'oddsFormat': 'american',
-            'dateFormat': 'iso'
-        }
+        # Only moneylines are used below, for games in the week the newsletter covers
+        params = odds_query_params(self.config, WEEKLY_REPORT_HOURS, markets='h2h')
         
-        response = requests.get(url, params=params, timeout=10)
+        response = resilience.call(
+            url, lambda timeout: requests.get(url, params=params, timeout=timeout), timeout=10, deadline=deadline
+        )
         if response.status_code != 200:
             print(f"❌ API Error for {sport_name}: {response.status_code}")
             return []
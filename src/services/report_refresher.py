@@ -0,0 +1,152 @@
+"""
+Background refresher that keeps a pre-built report snapshot for the web app.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from src.core.models import ReportSnapshot
+from src.data.disk_cache import DiskCache
+from src.util.log import get_logger
+
+
+SNAPSHOT_KEY = "report:latest"
+
+
+class ReportRefresher:
+    """Rebuilds the report on a schedule and serves the latest snapshot."""
+    
+    def __init__(
+        self,
+        build_report: Callable[[], Awaitable[str]],
+        interval_seconds: float = 300,
+        store: Optional[DiskCache] = None,
+        snapshot_ttl: float = 24 * 3600,
+        next_interval: Optional[Callable[[], float]] = None
+    ):
+        """
+        Args:
+            build_report: Coroutine function returning the rendered report
+            interval_seconds: Seconds between scheduled rebuilds
+            store: Persistent cache the latest snapshot is saved to and restored from
+            snapshot_ttl: Seconds a saved snapshot may be served after a restart
+            next_interval: Called after each rebuild for the seconds until the
+                next one (e.g. from a TTL policy); defaults to interval_seconds
+        """
+        self.build_report = build_report
+        self.interval_seconds = interval_seconds
+        self.store = store
+        self.snapshot_ttl = snapshot_ttl
+        self.next_interval = next_interval
+        self.logger = get_logger()
+        self._snapshot: Optional[ReportSnapshot] = self._load_snapshot()
+        self._last_error: Optional[Exception] = None
+        self._refresh_requested = asyncio.Event()
+        self._first_attempt_done = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def snapshot(self) -> Optional[ReportSnapshot]:
+        """Latest successfully built snapshot, if any."""
+        return self._snapshot
+    
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Error from the most recent failed rebuild, cleared on success."""
+        return self._last_error
+    
+    def start(self) -> None:
+        """Start the background refresh loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="report-refresher")
+    
+    async def stop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def request_refresh(self) -> None:
+        """Ask the loop to rebuild now instead of waiting for the next interval."""
+        self._refresh_requested.set()
+    
+    async def get_snapshot(self) -> Optional[ReportSnapshot]:
+        """
+        Get the latest snapshot, waiting only for the very first build.
+        
+        Returns:
+            Latest snapshot, or None if the first build failed
+        """
+        if self._snapshot is None:
+            await self._first_attempt_done.wait()
+        return self._snapshot
+    
+    async def _run(self) -> None:
+        """Rebuild on every interval tick or explicit refresh request."""
+        while True:
+            self._refresh_requested.clear()
+            await self._rebuild()
+            try:
+                await asyncio.wait_for(self._refresh_requested.wait(), timeout=self._interval())
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _rebuild(self) -> None:
+        """Build a new snapshot and swap it in; keep the old one on failure."""
+        started = time.perf_counter()
+        try:
+            content = await self.build_report()
+            previous_version = self._snapshot.version if self._snapshot else 0
+            self._snapshot = ReportSnapshot(
+                content=content,
+                generated_at=datetime.now(timezone.utc),
+                build_seconds=time.perf_counter() - started,
+                version=previous_version + 1
+            )
+            self._last_error = None
+            self.logger.info(f"Report snapshot v{self._snapshot.version} built in {self._snapshot.build_seconds:.2f}s")
+            if self.store is not None:
+                await asyncio.to_thread(self._save_snapshot, self.store, self._snapshot)
+        except Exception as e:
+            self._last_error = e
+            self.logger.error(f"Report rebuild failed, keeping previous snapshot: {e}")
+        finally:
+            self._first_attempt_done.set()
+    
+    def _interval(self) -> float:
+        """Seconds to wait before the next scheduled rebuild."""
+        if self.next_interval is None:
+            return self.interval_seconds
+        try:
+            return self.next_interval()
+        except Exception as e:
+            self.logger.warning(f"Refresh interval policy failed, using {self.interval_seconds}s: {e}")
+            return self.interval_seconds
+    
+    def _load_snapshot(self) -> Optional[ReportSnapshot]:
+        """Restore the snapshot saved before the last restart, if still within its TTL."""
+        if self.store is None:
+            return None
+        try:
+            content = self.store.get(SNAPSHOT_KEY)
+            if content is None:
+                return None
+            snapshot = ReportSnapshot.model_validate_json(content)
+        except Exception as e:
+            self.logger.warning(f"Could not restore saved report snapshot: {e}")
+            return None
+        self.logger.info(f"Restored report snapshot v{snapshot.version} from {snapshot.generated_at.isoformat()}")
+        return snapshot
+    
+    def _save_snapshot(self, store: DiskCache, snapshot: ReportSnapshot) -> None:
+        """Persist a snapshot so a restart can serve it immediately."""
+        try:
+            store.set(SNAPSHOT_KEY, snapshot.model_dump_json().encode(), ttl=self.snapshot_ttl)
+        except Exception as e:
+            self.logger.warning(f"Could not save report snapshot: {e}")
@@ -0,0 +1,73 @@
+"""
+Bounded memoization utilities.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, TypeVar, cast
+
+
+_MISSING = object()
+
+T = TypeVar('T')
+
+
+class LRUMemo:
+    """Bounded, thread-safe memo table with least-recently-used eviction."""
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Get a memoized value, computing and storing it on a miss.
+        
+        compute runs outside the lock, so it must be a pure function of key;
+        two threads missing on the same key may both compute it.
+        
+        Args:
+            key: Memo key
+            compute: Zero-argument callable producing the value
+            
+        Returns:
+            Memoized or freshly computed value (None is a valid value)
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cast(T, value)
+            self.misses += 1
+        
+        computed = compute()
+        
+        with self._lock:
+            self._entries[key] = computed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        
+        return computed
+    
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss and eviction counters plus current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
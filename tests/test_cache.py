@@ -0,0 +1,276 @@
+"""
+Tests for the bounded in-process cache.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.core.models import Config
+from src.data import cache as cache_module
+from src.data.cache import SimpleCache, configure_shared_cache
+from src.data.disk_cache import DiskCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSimpleCache:
+    """Test LRU bounds, expiry sweeps and statistics."""
+    
+    @pytest.fixture
+    def clock(self):
+        """A fake clock the test controls."""
+        return FakeClock()
+    
+    def test_get_set_and_expiry(self, clock):
+        """Test values expire after their TTL."""
+        cache = SimpleCache(default_ttl=10, clock=clock)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        clock.now += 11
+        assert cache.get("a") is None
+        assert cache.stats()['expirations'] == 1
+    
+    def test_lru_eviction_by_entries(self, clock):
+        """Test the least recently used entry is evicted first."""
+        cache = SimpleCache(max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()['evictions'] == 1
+    
+    def test_byte_budget(self, clock):
+        """Test entries are evicted to stay under the byte budget."""
+        cache = SimpleCache(max_bytes=100, clock=clock)
+        cache.set("a", b"x" * 40)
+        cache.set("b", b"x" * 40)
+        cache.set("c", b"x" * 40)
+        cache.set("huge", b"x" * 200)
+        
+        stats = cache.stats()
+        assert cache.get("a") is None
+        assert cache.get("huge") is None
+        assert stats['bytes'] == 80
+        assert stats['rejections'] == 1
+    
+    def test_configured_limits_apply_to_shared_cache(self, clock, monkeypatch):
+        """Test configure_shared_cache applies the memory limits, evicting entries over them."""
+        shared = SimpleCache(clock=clock)
+        monkeypatch.setattr(cache_module, "cache", shared)
+        for key in "abc":
+            shared.set(key, b"x" * 40)
+        config = Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False,
+            cache_dir="",
+            memory_cache_max_entries=2,
+            memory_cache_max_mb=1
+        )
+        
+        assert configure_shared_cache(config) is None
+        
+        stats = shared.stats()
+        assert (stats['max_entries'], stats['max_bytes']) == (2, 1024 * 1024)
+        assert shared.get("a") is None
+        assert shared.get("c") == b"x" * 40
+    
+    def test_cleanup_expired_in_batches(self, clock):
+        """Test the heap sweep removes only expired entries, across several batches."""
+        cache = SimpleCache(max_entries=1000, sweep_batch=8, clock=clock)
+        for i in range(50):
+            cache.set(f"short_{i}", i, ttl=5)
+        cache.set("long", "kept", ttl=60)
+        clock.now += 10
+        
+        assert cache.cleanup_expired() == 50
+        assert cache.size() == 1
+        assert cache.get("long") == "kept"
+    
+    def test_overwritten_keys_keep_heap_bounded(self, clock):
+        """Test rewriting one key does not grow the expiry heap without bound."""
+        cache = SimpleCache(sweep_batch=4, clock=clock)
+        for i in range(10_000):
+            cache.set("hot", i, ttl=60)
+        
+        assert cache.get("hot") == 9_999
+        assert len(cache._expiry_heap) <= 2 * cache.size() + cache.sweep_batch + 1
+    
+    def test_heap_compaction_is_batched(self, clock):
+        """Test an oversized heap is compacted sweep_batch items per call, not in one pass."""
+        cache = SimpleCache(max_entries=1000, sweep_batch=4, clock=clock)
+        for i in range(100):
+            cache.set(f"key_{i}", i, ttl=60)
+        for i in range(300):
+            clock.now += 0.1
+            cache.set(f"key_{i % 100}", i, ttl=60)
+            if cache._compacting:
+                break
+        
+        assert 0 < cache._compact_pos <= cache.sweep_batch
+        
+        assert cache.cleanup_expired() == 0
+        assert not cache._compacting
+        assert len(cache._expiry_heap) == cache.size() == 100
+    
+    def test_overwrite_is_not_expired_by_stale_heap_item(self, clock):
+        """Test a refreshed key survives the expiry of its previous value."""
+        cache = SimpleCache(clock=clock)
+        cache.set("a", 1, ttl=5)
+        cache.set("a", 2, ttl=60)
+        clock.now += 10
+        
+        assert cache.cleanup_expired() == 0
+        assert cache.get("a") == 2
+    
+    def test_sweeper_thread_starts_and_stops(self):
+        """Test the background sweeper can be started and stopped."""
+        cache = SimpleCache()
+        cache.start_sweeper(interval=0.01)
+        
+        assert cache._sweeper.is_alive()
+        cache.stop_sweeper(timeout=1)
+        assert cache._sweeper is None
+    
+    def test_get_or_compute_single_flight(self):
+        """Test concurrent callers for one key share a single computation."""
+        cache = SimpleCache()
+        release = threading.Event()
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(cache.get_or_compute, "key", compute, 60) for _ in range(8)]
+            while cache.stats()['misses'] < 8:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+        
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+        assert cache.stats()['coalesced'] == 7
+        assert cache.get_or_compute("key", compute) == "value"
+        assert len(calls) == 1
+    
+    def test_aget_or_compute_single_flight_and_stale_refresh(self, clock):
+        """Test concurrent async callers share one computation and stale values refresh in the background."""
+        cache = SimpleCache(clock=clock)
+        calls = []
+        
+        async def compute():
+            calls.append(len(calls))
+            await asyncio.sleep(0.01)
+            return len(calls)
+        
+        async def run():
+            first = await asyncio.gather(*(cache.aget_or_compute("k", compute, ttl=10, stale_ttl=30) for _ in range(5)))
+            clock.now += 15
+            stale = await cache.aget_or_compute("k", compute, ttl=10, stale_ttl=30)
+            while cache._tasks:
+                await asyncio.sleep(0.01)
+            return first, stale, await cache.aget_or_compute("k", compute, ttl=10, stale_ttl=30)
+        
+        first, stale, refreshed = asyncio.run(run())
+        
+        assert first == [1] * 5
+        assert stale == 1
+        assert refreshed == 2
+        assert len(calls) == 2
+    
+    def test_get_or_compute_does_not_cache_errors(self, clock):
+        """Test a failed computation is raised and retried on the next call."""
+        cache = SimpleCache(clock=clock)
+        
+        def fail():
+            raise RuntimeError("upstream down")
+        
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("key", fail)
+        assert cache.get_or_compute("key", lambda: 42) == 42
+    
+    def test_stale_while_revalidate(self, clock):
+        """Test an expired value is served while one background refresh runs."""
+        cache = SimpleCache(clock=clock)
+        release = threading.Event()
+        refreshes = []
+        
+        def refresh():
+            refreshes.append(1)
+            release.wait(5)
+            return "new"
+        
+        cache.get_or_compute("key", lambda: "old", ttl=10, stale_ttl=30)
+        clock.now += 15
+        
+        assert cache.get("key") is None
+        assert cache.get_or_compute("key", refresh, ttl=10, stale_ttl=30) == "old"
+        assert cache.get_or_compute("key", refresh, ttl=10, stale_ttl=30) == "old"
+        
+        release.set()
+        while cache._inflight:
+            time.sleep(0.001)
+        
+        assert len(refreshes) == 1
+        assert cache.get_or_compute("key", refresh, ttl=10, stale_ttl=30) == "new"
+        assert cache.stats()['stale_hits'] == 2
+        
+        # Past the stale window the caller waits for a fresh value
+        clock.now += 100
+        assert cache.get_or_compute("key", lambda: "newest", ttl=10) == "newest"
+    
+    def test_disk_tier_serves_after_restart(self, tmp_path):
+        """Test a fresh process restores byte payloads from disk instead of recomputing."""
+        computed = []
+        
+        def compute():
+            computed.append(1)
+            return b"payload"
+        
+        first = SimpleCache(backing=DiskCache(tmp_path))
+        assert first.get_or_compute("odds:nfl", compute, ttl=60) == b"payload"
+        
+        restarted = SimpleCache(backing=DiskCache(tmp_path))
+        assert restarted.get_or_compute("odds:nfl", compute, ttl=60) == b"payload"
+        assert restarted.get_or_compute("odds:nfl", compute, ttl=60) == b"payload"
+        
+        assert len(computed) == 1
+        assert restarted.stats()['restored'] == 1
+    
+    def test_stale_disk_entry_is_served_while_refreshing(self, tmp_path):
+        """Test a stale payload restored from disk is returned while a refresh runs."""
+        disk_clock = [1_700_000_000.0]
+        disk = DiskCache(tmp_path, clock=lambda: disk_clock[0])
+        disk.set("odds:nfl", b"old", ttl=10, stale_ttl=60)
+        disk_clock[0] += 30
+        
+        cache = SimpleCache(backing=disk)
+        assert cache.get_or_compute("odds:nfl", lambda: b"new", ttl=10, stale_ttl=60) == b"old"
+        
+        while cache._inflight:
+            time.sleep(0.001)
+        assert cache.get("odds:nfl") == b"new"
@@ -0,0 +1,83 @@
+"""
+Tests for batched de-vig methods.
+"""
+
+import numpy as np
+import pytest
+from src.core.devig import DEVIG_METHODS, devig
+from src.core.odds_math import american_to_implied_probability_array, remove_vig
+
+
+class TestDevig:
+    """Test de-vig methods over whole slates."""
+    
+    @pytest.fixture
+    def slate(self):
+        """Games x books x outcomes implied probabilities with missing prices."""
+        return american_to_implied_probability_array(np.array([
+            [[-110, -110], [150, -180], [200, np.nan]],
+            [[300, -400], [np.nan, np.nan], [-105, -115]],
+        ]))
+    
+    @pytest.mark.parametrize("method", [m for m in DEVIG_METHODS if m != "none"])
+    def test_outcome_sets_sum_to_one(self, slate, method):
+        """Test every complete outcome set becomes a fair distribution."""
+        fair = devig(slate, method)
+        
+        assert fair.shape == slate.shape
+        assert fair[0, 0] == pytest.approx([0.5, 0.5])
+        assert np.nansum(fair, axis=-1)[[0, 0, 1], [0, 1, 2]] == pytest.approx([1.0, 1.0, 1.0])
+        assert fair[0, 1, 1] > fair[0, 1, 0]
+    
+    @pytest.mark.parametrize("method", DEVIG_METHODS)
+    def test_incomplete_outcome_sets_unchanged(self, slate, method):
+        """Test sets with fewer than two prices keep their raw values."""
+        fair = devig(slate, method)
+        
+        assert fair[0, 2, 0] == pytest.approx(slate[0, 2, 0])
+        assert np.isnan(fair[0, 2, 1])
+        assert np.isnan(fair[1, 1]).all()
+    
+    def test_multiplicative_matches_remove_vig(self, slate):
+        """Test the default method is proportional scaling."""
+        fair = devig(slate, "multiplicative")
+        
+        assert fair[1, 2] == pytest.approx(remove_vig(slate[1, 2].tolist()))
+    
+    def test_power_solves_common_exponent(self):
+        """Test power de-vig raises every outcome to the same exponent."""
+        probs = np.array([0.5, 0.3, 0.25])
+        fair = devig(probs, "power")
+        exponents = np.log(fair) / np.log(probs)
+        
+        assert fair.sum() == pytest.approx(1.0)
+        assert exponents == pytest.approx(np.full(3, exponents[0]))
+        assert exponents[0] > 1
+    
+    def test_shin_two_way_matches_additive(self):
+        """Test Shin reduces to equal margin removal for two outcomes."""
+        probs = american_to_implied_probability_array(np.array([[300, -400], [150, -180]]))
+        
+        assert devig(probs, "shin") == pytest.approx(devig(probs, "additive"))
+    
+    def test_shin_shrinks_longshots_more(self):
+        """Test Shin takes proportionally more margin from the longshot."""
+        probs = np.array([0.5, 0.3, 0.25])
+        fair = devig(probs, "shin")
+        
+        assert fair.sum() == pytest.approx(1.0)
+        assert fair[2] / probs[2] < fair[0] / probs[0]
+    
+    def test_outcome_axis(self, slate):
+        """Test the outcome axis can be chosen."""
+        transposed = np.swapaxes(slate, 1, 2)
+        
+        np.testing.assert_allclose(
+            np.swapaxes(devig(transposed, "power", axis=1), 1, 2),
+            devig(slate, "power")
+        )
+    
+    def test_unknown_method(self, slate):
+        """Test unknown methods are rejected."""
+        with pytest.raises(ValueError):
+            devig(slate, "bogus")
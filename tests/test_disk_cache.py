@@ -0,0 +1,81 @@
+"""
+Tests for the persistent disk cache tier.
+"""
+
+import pytest
+from src.data.disk_cache import DiskCache
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+    
+    def __init__(self):
+        self.now = 1_700_000_000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDiskCache:
+    """Test TTLs, size budget and persistence across reopen."""
+    
+    @pytest.fixture
+    def clock(self):
+        """A fake clock the test controls."""
+        return FakeClock()
+    
+    def test_values_survive_reopen(self, tmp_path, clock):
+        """Test a value written by one instance is read by the next."""
+        DiskCache(tmp_path, clock=clock).set("key", b"payload", ttl=60)
+        
+        reopened = DiskCache(tmp_path, clock=clock)
+        
+        assert reopened.get("key") == b"payload"
+    
+    def test_ttl_and_stale_window(self, tmp_path, clock):
+        """Test expired values are only returned with their remaining stale window."""
+        cache = DiskCache(tmp_path, clock=clock)
+        cache.set("key", b"payload", ttl=10, stale_ttl=20)
+        clock.now += 15
+        
+        assert cache.get("key") is None
+        assert cache.get_with_ttl("key") == (b"payload", -5.0, 15.0)
+        
+        clock.now += 20
+        assert cache.get_with_ttl("key") is None
+        assert cache.stats()['size'] == 0
+    
+    def test_size_budget_evicts_least_recently_used(self, tmp_path, clock):
+        """Test writes beyond the byte budget evict the least recently used values."""
+        cache = DiskCache(tmp_path, max_bytes=100, clock=clock)
+        for key in ("a", "b", "c"):
+            clock.now += 1
+            cache.set(key, b"x" * 40, ttl=60)
+            if key == "b":
+                clock.now += 1
+                cache.get("a")
+        
+        stats = cache.stats()
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert stats['bytes'] == 80
+        assert stats['evictions'] == 1
+    
+    def test_cleanup_expired(self, tmp_path, clock):
+        """Test cleanup removes only entries past their stale window."""
+        cache = DiskCache(tmp_path, clock=clock)
+        cache.set("short", b"1", ttl=5)
+        cache.set("long", b"2", ttl=60)
+        clock.now += 10
+        
+        assert cache.cleanup_expired() == 1
+        assert cache.get("long") == b"2"
+    
+    def test_corrupt_file_is_recreated(self, tmp_path):
+        """Test an unreadable database is replaced instead of failing startup."""
+        (tmp_path / DiskCache.FILENAME).write_bytes(b"not a sqlite database" * 100)
+        
+        cache = DiskCache(tmp_path)
+        cache.set("key", b"payload", ttl=60)
+        
+        assert cache.get("key") == b"payload"
@@ -0,0 +1,155 @@
+"""
+Tests for the Kalshi markets client.
+"""
+
+import asyncio
+import json
+import httpx
+import pytest
+import requests
+from src.core.models import Config
+from src.data.cache import SimpleCache
+from src.data.kalshi_client import AsyncKalshiClient, KalshiClient
+
+
+def make_page(series: str, page: int, pages: int, volume: int = 1500) -> bytes:
+    """Build one /markets page with two markets and a cursor to the next page."""
+    markets = [
+        {"id": f"{series}-{page}-{n}", "title": "Seahawks vs 49ers", "event_time": "2030-01-01T18:00:00Z",
+         "last_price": 0.45, "volume": volume if n == 0 else 10}
+        for n in range(2)
+    ]
+    cursor = f"{series}-{page + 1}" if page + 1 < pages else ""
+    return json.dumps({"markets": markets, "cursor": cursor}).encode()
+
+
+def serve_page(params: dict, pages: int) -> bytes:
+    """Answer a /markets request from its series and cursor parameters."""
+    series = params.get('series_ticker', 'ALL')
+    page = int(params['cursor'].rsplit('-', 1)[1]) if params.get('cursor') else 0
+    return make_page(series, page, pages)
+
+
+class TestKalshiPagination:
+    """Test cursor-paginated market ingestion."""
+    
+    @pytest.fixture
+    def config(self):
+        """Test configuration hitting the (stubbed) live API path."""
+        return Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+    
+    def test_follows_cursors_per_series(self, config, monkeypatch):
+        """Test every page of every series is ingested in order and cached by cursor."""
+        config.kalshi_series = ["KXNFLGAME", "KXNBAGAME"]
+        cache = SimpleCache()
+        requests_made = []
+        
+        def fake_request(url, params, deadline=None):
+            requests_made.append((params['series_ticker'], params.get('cursor')))
+            return serve_page(params, pages=3)
+        
+        client = KalshiClient(config, cache=cache)
+        monkeypatch.setattr(client, "_request_markets_content", fake_request)
+        
+        markets = client.get_markets()
+        
+        assert [m.market_id for m in markets] == [
+            "KXNFLGAME-0-0", "KXNFLGAME-1-0", "KXNFLGAME-2-0",
+            "KXNBAGAME-0-0", "KXNBAGAME-1-0", "KXNBAGAME-2-0",
+        ]
+        assert len(requests_made) == 6
+        assert ("KXNBAGAME", "KXNBAGAME-2") in requests_made
+        
+        assert client.get_markets() == markets
+        assert len(requests_made) == 6
+    
+    def test_failed_series_is_skipped(self, config, monkeypatch):
+        """Test an HTTP error or malformed page drops only its own series."""
+        config.kalshi_series = ["KXNFLGAME", "KXNBAGAME", "KXMLBGAME"]
+        config.kalshi_cache_ttl_seconds = 0
+        
+        def fake_request(url, params, deadline=None):
+            if params['series_ticker'] == "KXNBAGAME":
+                raise requests.HTTPError("500 Server Error")
+            if params['series_ticker'] == "KXMLBGAME":
+                return b"<html>bad gateway</html>"
+            return serve_page(params, pages=2)
+        
+        client = KalshiClient(config)
+        monkeypatch.setattr(client, "_request_markets_content", fake_request)
+        
+        markets = client._ingest_markets(48)
+        
+        assert [m.market_id for m in markets] == ["KXNFLGAME-0-0", "KXNFLGAME-1-0"]
+    
+    def test_markets_are_keyed_by_ticker(self, config):
+        """Test records carry the market ticker the price feed quotes, falling back to the id."""
+        page = json.loads(make_page("KXNFLGAME", 0, 1))
+        page["markets"][0]["ticker"] = "KXNFLGAME-30JAN01SEASF-SEA"
+        client = KalshiClient(config)
+        
+        batch = client._parse_markets_content(json.dumps(page).encode())
+        page["markets"][0]["event_time"] = "not a time"
+        page["markets"].append({**page["markets"][0], "ticker": "KXNFLGAME-30JAN01SEASF-SF", "event_time": "2030-01-01T18:00:00Z"})
+        single = client._parse_markets_content(json.dumps(page).encode())
+        
+        assert [m.market_id for m in batch] == ["KXNFLGAME-30JAN01SEASF-SEA"]
+        assert [m.market_id for m in single] == ["KXNFLGAME-30JAN01SEASF-SF"]
+    
+    def test_page_budget_stops_runaway_cursor(self, config, monkeypatch):
+        """Test pagination stops at kalshi_max_pages."""
+        config.kalshi_max_pages = 2
+        config.kalshi_cache_ttl_seconds = 0
+        client = KalshiClient(config)
+        monkeypatch.setattr(client, "_request_markets_content", lambda url, params, deadline=None: serve_page(params, pages=100))
+        
+        markets = client.get_markets()
+        
+        assert [m.market_id for m in markets] == ["ALL-0-0", "ALL-1-0"]
+    
+    def test_async_pagination(self, config):
+        """Test the async client pages through each series over the shared client."""
+        config.kalshi_series = ["KXNFLGAME", "KXMLBGAME"]
+        
+        def handler(request):
+            return httpx.Response(200, content=serve_page(dict(request.url.params), pages=2))
+        
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncKalshiClient(config, http_client)
+            try:
+                return await client.get_markets()
+            finally:
+                await http_client.aclose()
+        
+        markets = asyncio.run(run())
+        
+        assert [m.market_id for m in markets] == [
+            "KXNFLGAME-0-0", "KXNFLGAME-1-0", "KXMLBGAME-0-0", "KXMLBGAME-1-0"
+        ]
+    
+    def test_async_fetch_markets_raises_instead_of_fixtures(self, config):
+        """Test fetch_markets surfaces upstream errors rather than returning fixture markets."""
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+            client = AsyncKalshiClient(config, http_client)
+            try:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await client.fetch_markets()
+                return await client.get_markets()
+            finally:
+                await http_client.aclose()
+        
+        markets = asyncio.run(run())
+        
+        assert markets and all(m.market_id.startswith("fixture_") for m in markets)
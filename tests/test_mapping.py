@@ -4,6 +4,8 @@ Tests for team mapping utilities.
 
 import pytest
 from datetime import datetime, timedelta
+from src.core.models import Game
+from src.data import mapping
 from src.data.mapping import (
     normalize_team_name,
     find_team_match,
@@ -42,6 +44,76 @@ class TestTeamMapping:
         # No match
         assert find_team_match("Random Team Name", "americanfootball_nfl") is None
     
+    def test_find_team_match_tie_breaking(self):
+        """Test that names containing several aliases resolve deterministically."""
+        # The team listed first in the alias table wins, regardless of word order
+        assert find_team_match("Boston Celtics at Brooklyn Nets", "basketball_nba") == "celtics"
+        assert find_team_match("Brooklyn Nets at Boston Celtics", "basketball_nba") == "celtics"
+        
+        # Exact alias hits and substring hits agree
+        assert find_team_match("la lakers", "basketball_nba") == "lakers"
+        assert find_team_match("The LA Lakers tonight", "basketball_nba") == "lakers"
+        
+        # Unknown sport falls through to no match
+        assert find_team_match("Seattle Seahawks", "unknown") is None
+    
+    def test_team_match_memo_counts_hits(self):
+        """Test that repeated lookups are served from the memo."""
+        find_team_match("Memo Test Patriots", "americanfootball_nfl")
+        before = mapping.team_match_cache_stats()
+        
+        for _ in range(5):
+            assert find_team_match("Memo Test Patriots", "americanfootball_nfl") == "patriots"
+        
+        after = mapping.team_match_cache_stats()
+        assert after['hits'] - before['hits'] == 5
+        assert after['misses'] == before['misses']
+    
+    def test_team_match_memo_invalidated_on_alias_change(self):
+        """Test that reloading after editing the alias tables invalidates memoized matches."""
+        assert find_team_match("Seattle Sonics", "basketball_nba") is None
+        
+        mapping.TEAM_ALIASES["basketball_nba"]["sonics"] = ["seattle supersonics"]
+        try:
+            mapping.reload_team_aliases()
+            assert find_team_match("Seattle Sonics", "basketball_nba") is None
+            mapping.TEAM_ALIASES["basketball_nba"]["sonics"].append("seattle sonics")
+            mapping.reload_team_aliases()
+            assert find_team_match("Seattle Sonics", "basketball_nba") == "sonics"
+        finally:
+            del mapping.TEAM_ALIASES["basketball_nba"]["sonics"]
+            mapping.reload_team_aliases()
+        
+        assert find_team_match("Seattle Sonics", "basketball_nba") is None
+    
+    def test_alias_helpers_invalidate_memoized_lookups(self):
+        """Test that set_team_aliases and remove_team_aliases invalidate names and titles."""
+        title = "Seattle Sonics vs Los Angeles Lakers"
+        assert extract_teams_from_kalshi_title(title, "basketball_nba") is None
+        
+        mapping.set_team_aliases("basketball_nba", "sonics", ["seattle sonics"])
+        try:
+            assert find_team_match("Seattle Sonics", "basketball_nba") == "sonics"
+            assert extract_teams_from_kalshi_title(title, "basketball_nba") == ("sonics", "lakers")
+        finally:
+            mapping.remove_team_aliases("basketball_nba", "sonics")
+        
+        assert find_team_match("Seattle Sonics", "basketball_nba") is None
+        assert extract_teams_from_kalshi_title(title, "basketball_nba") is None
+    
+    def test_titles_have_their_own_memo(self):
+        """Test that title lookups are memoized apart from team name lookups."""
+        title = "Memo Test Patriots vs Buffalo Bills"
+        extract_teams_from_kalshi_title(title, "americanfootball_nfl")
+        names = mapping.team_match_cache_stats()
+        titles = mapping.team_title_cache_stats()
+        
+        for _ in range(3):
+            assert extract_teams_from_kalshi_title(title, "americanfootball_nfl") == ("patriots", "bills")
+        
+        assert mapping.team_title_cache_stats()['hits'] - titles['hits'] == 3
+        assert mapping.team_match_cache_stats() == names
+    
     def test_is_seattle_team(self):
         """Test Seattle team identification."""
         # Seattle teams
@@ -67,6 +139,20 @@ class TestTeamMapping:
         teams = extract_teams_from_kalshi_title("Random Market Title", "americanfootball_nfl")
         assert teams is None
     
+    def test_extract_teams_separator_priority(self):
+        """Test that separators are tried in priority order on one parse."""
+        # "vs" outranks "at" even though "at" appears first
+        assert mapping._split_title("A at B vs C") == (("A at B", "C"), ("A", "B vs C"))
+        
+        # Falls through to a lower-priority separator when teams do not resolve
+        teams = extract_teams_from_kalshi_title("Seattle Seahawks beat San Francisco 49ers", "americanfootball_nfl")
+        assert teams == ("seahawks", "49ers")
+        
+        # Repeated titles are served from cache with the same answer
+        assert extract_teams_from_kalshi_title(
+            "Seattle Seahawks beat San Francisco 49ers", "americanfootball_nfl"
+        ) == ("seahawks", "49ers")
+    
     def test_create_game_from_market(self):
         """Test game creation from market."""
         market_title = "Seattle Seahawks vs San Francisco 49ers"
@@ -99,3 +185,25 @@ class TestTeamMapping:
         assert len(matches) == 2
         assert matches[0][0].sport == "americanfootball_nfl"
         assert matches[1][0].sport == "basketball_nba"
+    
+    def test_match_games_within_timeframe_first_match(self):
+        """Test window bounds, either team order and earliest-listed wins."""
+        base_time = datetime(2030, 1, 5, 18, 0)
+        
+        def game(away, home, hours):
+            return Game(sport="americanfootball_nfl", away_team=away, home_team=home,
+                        start_time=base_time + timedelta(hours=hours))
+        
+        kalshi_games = [game("seahawks", "49ers", 0), game("rams", "cardinals", 0)]
+        sportsbook_games = [
+            game("seahawks", "49ers", 72),    # next week's game, outside window
+            game("49ers", "seahawks", 1.5),   # reversed order, inside window
+            game("seahawks", "49ers", -0.5),  # closer in time but listed later
+            game("rams", "cardinals", 2.5),   # outside window
+        ]
+        
+        matches = match_games_within_timeframe(kalshi_games, sportsbook_games, 2)
+        
+        assert len(matches) == 1
+        assert matches[0][0] is kalshi_games[0]
+        assert matches[0][1] is sportsbook_games[1]
@@ -2,9 +2,17 @@
 Tests for odds math utilities.
 """
 
+import numpy as np
 import pytest
 from src.core.odds_math import (
     american_to_implied_probability,
+    american_to_implied_probability_array,
+    remove_vig_array,
+    calculate_payout_ratio_array,
+    calculate_edge_vs_best_array,
+    calculate_expected_value_array,
+    calculate_best_price_array,
+    calculate_consensus_array,
     decimal_to_implied_probability,
     implied_probability_to_american,
     implied_probability_to_decimal,
@@ -111,3 +119,61 @@ class TestOddsMath:
         # EV = (0.4 * 1.0) - (0.6 * 1.0) = -0.2
         ev = calculate_expected_value(0.4, 0.5, 1.0)
         assert ev == pytest.approx(-0.2, rel=1e-3)
+
+
+
+class TestOddsMathArrays:
+    """Test batched odds math over NumPy arrays."""
+    
+    def test_american_to_implied_probability_array(self):
+        """Test array conversion matches the scalar function and keeps NaN."""
+        odds = np.array([[150, -150], [200, np.nan]])
+        probs = american_to_implied_probability_array(odds)
+        
+        assert probs.shape == (2, 2)
+        assert probs[0, 0] == pytest.approx(american_to_implied_probability(150))
+        assert probs[0, 1] == pytest.approx(american_to_implied_probability(-150))
+        assert probs[1, 0] == pytest.approx(american_to_implied_probability(200))
+        assert np.isnan(probs[1, 1])
+    
+    def test_remove_vig_array(self):
+        """Test each outcome set is normalized independently."""
+        probs = np.array([[0.55, 0.55], [0.6, 0.5]])
+        fair = remove_vig_array(probs)
+        
+        assert fair.sum(axis=1) == pytest.approx([1.0, 1.0])
+        assert fair[0] == pytest.approx([0.5, 0.5])
+        assert fair[1] == pytest.approx(remove_vig([0.6, 0.5]))
+    
+    def test_payout_and_expected_value_arrays(self):
+        """Test payout ratios and EVs, including out-of-range inputs."""
+        assert calculate_payout_ratio_array([0.5, 0.25, 0.0, 1.0]) == pytest.approx([1.0, 3.0, 0.0, 0.0])
+        assert calculate_expected_value_array([0.6, 0.4, 0.5], [0.5, 0.5, 1.0]) == pytest.approx([0.2, -0.2, 0.0])
+    
+    def test_calculate_edge_vs_best_array(self):
+        """Test per-game stats over books x outcomes, ignoring missing prices."""
+        probs = np.array([
+            [[0.45, 0.50], [0.55, np.nan]],
+            [[np.nan, np.nan], [np.nan, np.nan]],
+        ])
+        min_probs, avg_probs, max_probs = calculate_edge_vs_best_array(probs, axis=(1, 2))
+        
+        assert min_probs == pytest.approx([0.45, 0.0])
+        assert avg_probs == pytest.approx([0.50, 0.0])
+        assert max_probs == pytest.approx([0.55, 0.0])
+    
+    def test_best_price_and_consensus_arrays(self):
+        """Test per-side best price and median over books, with empty sides."""
+        prices = np.array([
+            [[120, -140], [115, -135], [125, np.nan]],
+            [[np.nan, -110], [np.nan, -105], [np.nan, np.nan]],
+        ])
+        probs = american_to_implied_probability_array(prices)
+        
+        best = calculate_best_price_array(prices, axis=1)
+        consensus = calculate_consensus_array(probs, axis=1)
+        
+        assert best[0].tolist() == [125, -135]
+        assert np.isnan(best[1, 0]) and best[1, 1] == -105
+        assert consensus[0, 0] == pytest.approx(100 / 220)
+        assert consensus[1] == pytest.approx([0.0, (110 / 210 + 105 / 205) / 2])
@@ -0,0 +1,525 @@
+"""
+Tests for the sportsbook odds client.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import httpx
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.core.models import Config, SportsbookOdds
+from src.core.odds_table import OddsTable
+from src.data.cache import SimpleCache
+from src.data.odds_client import AsyncOddsClient, OddsClient, odds_query_params
+from src.data.quota import QuotaTracker
+from src.data.resilience import Resilience
+
+
+def make_odds(sport: str, game_id: str, book_name: str = "DraftKings") -> SportsbookOdds:
+    """Build a minimal odds row for a sport."""
+    return SportsbookOdds(
+        game_id=game_id,
+        sport=sport,
+        away_team="Away Team",
+        home_team="Home Team",
+        start_time=datetime.now() + timedelta(hours=24),
+        book_name=book_name,
+        moneyline_away=120,
+        moneyline_home=-140
+    )
+
+
+def make_table(sport: str, *game_ids: str) -> OddsTable:
+    """Build a one-book odds table for a sport."""
+    return OddsTable.from_models([make_odds(sport, game_id) for game_id in game_ids])
+
+
+class TestOddsClient:
+    """Test odds client functionality."""
+    
+    @pytest.fixture
+    def config(self):
+        """Test configuration hitting the (stubbed) live API path."""
+        return Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["baseball_mlb", "americanfootball_nfl", "basketball_nba", "icehockey_nhl", "soccer_epl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+    
+    def test_get_odds_fetches_sports_concurrently(self, config, monkeypatch):
+        """Test that wall time tracks the slowest sport, not the sum."""
+        client = OddsClient(config)
+        
+        def fake_fetch(sport, hours, deadline=None):
+            time.sleep(0.2)
+            return make_table(sport, f"{sport}_1")
+        
+        monkeypatch.setattr(client, "_fetch_sport_odds", fake_fetch)
+        
+        start = time.perf_counter()
+        odds = client.get_odds()
+        elapsed = time.perf_counter() - start
+        
+        assert len(odds) == 5
+        assert elapsed < 0.2 * 3
+    
+    def test_get_odds_preserves_sport_order(self, config, monkeypatch):
+        """Test that results follow sports_filter order, not completion order."""
+        client = OddsClient(config)
+        delays = {sport: 0.05 * (5 - i) for i, sport in enumerate(config.sports_filter)}
+        
+        def fake_fetch(sport, hours, deadline=None):
+            time.sleep(delays[sport])
+            return make_table(sport, f"{sport}_1", f"{sport}_2")
+        
+        monkeypatch.setattr(client, "_fetch_sport_odds", fake_fetch)
+        
+        odds = client.get_odds()
+        
+        assert [o.game_id for o in odds] == [
+            f"{sport}_{n}" for sport in config.sports_filter for n in (1, 2)
+        ]
+    
+    def test_get_odds_isolates_sport_errors(self, config, monkeypatch):
+        """Test that one failing sport does not drop the others."""
+        client = OddsClient(config)
+        
+        def fake_fetch(sport, hours, deadline=None):
+            if sport == "basketball_nba":
+                raise Exception("API returned 500")
+            return make_table(sport, f"{sport}_1")
+        
+        monkeypatch.setattr(client, "_fetch_sport_odds", fake_fetch)
+        
+        odds = client.get_odds()
+        
+        assert len(odds) == 4
+        assert all(o.sport != "basketball_nba" for o in odds)
+    
+    def test_get_odds_bounds_worker_count(self, config, monkeypatch):
+        """Test that no more than odds_fetch_workers sports run at once."""
+        config.odds_fetch_workers = 2
+        client = OddsClient(config)
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+        
+        def fake_fetch(sport, hours, deadline=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return make_table(sport, f"{sport}_1")
+        
+        monkeypatch.setattr(client, "_fetch_sport_odds", fake_fetch)
+        
+        client.get_odds()
+        
+        assert peak[0] == 2
+    
+    def test_run_deadline_returns_finished_sports(self, config, monkeypatch):
+        """Test a sport still loading at the run deadline is dropped instead of stalling the run."""
+        config.run_deadline_seconds = 1
+        client = OddsClient(config)
+        release = threading.Event()
+        
+        def fake_fetch(sport, hours, deadline=None):
+            if sport == "basketball_nba":
+                release.wait(5)
+            return make_table(sport, f"{sport}_1")
+        
+        monkeypatch.setattr(client, "_fetch_sport_odds", fake_fetch)
+        
+        started = time.perf_counter()
+        try:
+            odds = client.get_odds()
+        finally:
+            release.set()
+        
+        assert time.perf_counter() - started < 3
+        assert [o.sport for o in odds] == ["baseball_mlb", "americanfootball_nfl", "icehockey_nhl", "soccer_epl"]
+
+
+class TestAsyncOddsClient:
+    """Test async odds client functionality."""
+    
+    @pytest.fixture
+    def config(self):
+        """Test configuration hitting the (mocked) live API path."""
+        return Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl", "basketball_nba"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+    
+    def test_get_odds_over_shared_client(self, config):
+        """Test async fetch, parse and per-sport error isolation."""
+        def handler(request):
+            if "basketball_nba" in request.url.path:
+                return httpx.Response(500, text="upstream error")
+            return httpx.Response(200, json=[{
+                "id": "game_1",
+                "sport_key": "americanfootball_nfl",
+                "home_team": "San Francisco 49ers",
+                "away_team": "Seattle Seahawks",
+                "commence_time": "2030-01-01T18:00:00Z",
+                "bookmakers": [{
+                    "title": "DraftKings",
+                    "markets": [{"key": "h2h", "outcomes": [
+                        {"name": "Seattle Seahawks", "price": 120},
+                        {"name": "San Francisco 49ers", "price": -140}
+                    ]}]
+                }, {
+                    "title": "FanDuel",
+                    "markets": [{"key": "h2h", "outcomes": [
+                        {"name": "Seattle Seahawks", "price": 115},
+                        {"name": "San Francisco 49ers", "price": -135}
+                    ]}]
+                }]
+            }])
+        
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncOddsClient(config, http_client, cache=SimpleCache(), resilience=Resilience(rng=lambda: 0))
+            try:
+                return await client.get_odds()
+            finally:
+                await http_client.aclose()
+        
+        odds = asyncio.run(run())
+        
+        assert [o.book_name for o in odds] == ["DraftKings", "FanDuel"]
+        assert all(o.game_id == "game_1" for o in odds)
+        assert [o.moneyline_away for o in odds] == [120, 115]
+    
+    def test_conditional_requests_and_quota(self, config):
+        """Test quota headers are recorded, 304s reuse the last body and unchanged bodies skip the parse."""
+        body = json.dumps([{
+            "id": "game_1",
+            "sport_key": "americanfootball_nfl",
+            "home_team": "Home",
+            "away_team": "Away",
+            "commence_time": "2030-01-01T18:00:00Z",
+            "bookmakers": [{"title": "DraftKings", "markets": [
+                {"key": "h2h", "outcomes": [{"name": "Away", "price": 120}, {"name": "Home", "price": -140}]}
+            ]}]
+        }]).encode()
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request.headers.get("if-none-match"))
+            remaining = str(500 - len(requests_seen))
+            headers = {"x-requests-remaining": remaining, "x-requests-used": str(len(requests_seen)), "x-requests-last": "1"}
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers=headers)
+            return httpx.Response(200, content=body, headers={**headers, "etag": '"v1"'})
+        
+        quota = QuotaTracker()
+        config.odds_cache_ttl_seconds = 0
+        
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncOddsClient(config, http_client, quota=quota)
+            try:
+                tables = [await client._fetch_sport_odds("americanfootball_nfl", 48) for _ in range(3)]
+                return client, tables
+            finally:
+                await http_client.aclose()
+        
+        client, tables = asyncio.run(run())
+        
+        assert requests_seen == [None, '"v1"', '"v1"']
+        assert tables[0] is tables[1] is tables[2]
+        assert client.parse_skips == 2
+        assert client.quota_status().remaining == 497
+        assert client.quota_status().used == 3
+        assert client.quota_status().last_cost == 1
+    
+    def test_rate_limited_response_records_quota(self, config):
+        """Test quota headers on an error response are recorded before it is raised."""
+        def handler(request):
+            return httpx.Response(429, text="quota exhausted", headers={"x-requests-remaining": "0", "x-requests-used": "500"})
+        
+        quota = QuotaTracker()
+        config.odds_cache_ttl_seconds = 0
+        
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncOddsClient(config, http_client, quota=quota, resilience=Resilience(rng=lambda: 0))
+            try:
+                with pytest.raises(Exception, match="429"):
+                    await client.fetch_sport_payload("americanfootball_nfl")
+                return client
+            finally:
+                await http_client.aclose()
+        
+        client = asyncio.run(run())
+        
+        assert client.quota_status().remaining == 0
+        assert client.quota_status().used == 500
+    
+    def test_async_fetches_share_the_response_cache(self, config):
+        """Test async payload and table fetches make one upstream request per sport and TTL."""
+        start = datetime.now(timezone.utc) + timedelta(hours=6)
+        body = json.dumps([{
+            "id": "game_1",
+            "sport_key": "americanfootball_nfl",
+            "home_team": "Home",
+            "away_team": "Away",
+            "commence_time": start.isoformat(),
+            "bookmakers": [{"title": "DraftKings", "markets": [
+                {"key": "h2h", "outcomes": [{"name": "Away", "price": 120}, {"name": "Home", "price": -140}]}
+            ]}]
+        }]).encode()
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request.url.path)
+            return httpx.Response(200, content=body)
+        
+        cache = SimpleCache()
+        
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncOddsClient(config, http_client, cache=cache)
+            try:
+                payloads = await asyncio.gather(*(client.fetch_sport_payload("americanfootball_nfl") for _ in range(3)))
+                table = await client._fetch_sport_odds("americanfootball_nfl", config.lookahead_hours)
+                return payloads, table
+            finally:
+                await http_client.aclose()
+        
+        payloads, table = asyncio.run(run())
+        
+        assert len(requests_seen) == 1
+        assert all(payload == json.loads(body) for payload in payloads)
+        assert payloads[0] is payloads[1] is payloads[2]
+        assert [game.game_id for game in table] == ["game_1"]
+        entry = next(iter(cache._cache.values()))
+        assert entry.expires_at - cache.clock() == pytest.approx(360, abs=5)
+
+
+class TestFetchContext:
+    """Test per-run request coalescing."""
+    
+    @pytest.fixture
+    def config(self):
+        """Test configuration hitting the (stubbed) live API path."""
+        return Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl", "basketball_nba"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+    
+    def test_fetch_context_shares_downloads(self, config, monkeypatch):
+        """Test that repeat get_odds calls in one run download each sport once."""
+        client = OddsClient(config)
+        downloads = []
+        
+        def fake_download(request):
+            sport = request.sport
+            downloads.append(sport)
+            return make_table(sport, f"{sport}_1")
+        
+        monkeypatch.setattr(client, "_download_sport_odds", fake_download)
+        
+        with client.fetch_context():
+            first = client.get_odds()
+            second = client.get_odds()
+        
+        assert sorted(downloads) == sorted(config.sports_filter)
+        assert [o.game_id for o in first] == [o.game_id for o in second]
+        
+        # Outside a run, nothing is shared
+        client.get_odds()
+        assert len(downloads) == 2 * len(config.sports_filter)
+    
+    def test_response_cache_shared_across_clients(self, config, monkeypatch):
+        """Test that clients sharing a cache request each sport's body once per TTL."""
+        cache = SimpleCache()
+        requests_made = []
+        
+        def fake_request(request):
+            requests_made.append(request.url)
+            return json.dumps([]).encode()
+        
+        for _ in range(3):
+            client = OddsClient(config, cache=cache)
+            monkeypatch.setattr(client, "_request_sport_content", fake_request)
+            client._fetch_all_sports(config.sports_filter, 48)
+        
+        assert len(requests_made) == len(config.sports_filter)
+        
+        config.odds_cache_ttl_seconds = 0
+        client._fetch_all_sports(config.sports_filter, 48)
+        assert len(requests_made) == 2 * len(config.sports_filter)
+    
+    def test_adaptive_ttl_from_payload(self, config, monkeypatch):
+        """Test cached bodies get the TTL policy's lifetime and are parsed once."""
+        cache = SimpleCache()
+        client = OddsClient(config, cache=cache)
+        start = datetime.now(timezone.utc) + timedelta(hours=6)
+        body = json.dumps([{
+            "id": "game_1",
+            "sport_key": "americanfootball_nfl",
+            "commence_time": start.isoformat(),
+            "home_team": "Home",
+            "away_team": "Away",
+            "bookmakers": [{"title": "DraftKings", "markets": [
+                {"key": "h2h", "outcomes": [{"name": "Away", "price": 120}, {"name": "Home", "price": -140}]}
+            ]}]
+        }]).encode()
+        parses = []
+        parse = client._parse_sport_content
+        monkeypatch.setattr(client, "_request_sport_content", lambda request: body)
+        monkeypatch.setattr(client, "_parse_sport_content", lambda sport, content: parses.append(sport) or parse(sport, content))
+        
+        table = client._fetch_sport_odds("americanfootball_nfl", 48)
+        
+        entry = next(iter(cache._cache.values()))
+        assert [game.game_id for game in table] == ["game_1"]
+        assert len(parses) == 1
+        assert entry.expires_at - cache.clock() == pytest.approx(360, abs=5)
+
+
+class TestOddsTable:
+    """Test the columnar odds layout."""
+    
+    def test_round_trip_keeps_every_book(self):
+        """Test that models survive a round trip with books in listed order."""
+        odds_list = [
+            make_odds("americanfootball_nfl", "game_1", "FanDuel"),
+            make_odds("americanfootball_nfl", "game_1", "DraftKings"),
+            make_odds("americanfootball_nfl", "game_2", "DraftKings"),
+        ]
+        odds_list[0].spread_away = 2.5
+        for odds in odds_list:
+            odds.start_time = odds_list[0].start_time
+        
+        table = OddsTable.from_models(odds_list)
+        
+        assert len(table) == 2
+        assert table.num_rows == 3
+        assert table.moneyline.shape == (2, 2, 2)
+        assert [o.model_dump() for o in table.to_models()] == [o.model_dump() for o in odds_list]
+        assert [o.book_name for o in table.to_models(primary_only=True)] == ["FanDuel", "DraftKings"]
+    
+    def test_concat_and_select_merge_book_columns(self):
+        """Test that book columns are merged across sports and trimmed on select."""
+        nfl = OddsTable.from_models([make_odds("americanfootball_nfl", "nfl_1", "FanDuel")])
+        nba = OddsTable.from_models([
+            make_odds("basketball_nba", "nba_1", "DraftKings"),
+            make_odds("basketball_nba", "nba_1", "FanDuel"),
+        ])
+        
+        table = OddsTable.concat([nfl, OddsTable.empty(), nba])
+        
+        assert table.books == ["FanDuel", "DraftKings"]
+        assert [game.game_id for game in table] == ["nfl_1", "nba_1"]
+        assert [o.book_name for o in table.to_models()] == ["FanDuel", "DraftKings", "FanDuel"]
+        
+        selected = table.select([0])
+        assert selected.books == ["FanDuel"]
+        assert selected.moneyline_rows().tolist() == [[120, -140]]
+    
+    def test_parse_payload_keeps_every_book(self):
+        """Test that the parser keeps all bookmakers and drops games without moneylines."""
+        client = OddsClient(Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        ))
+        game = {
+            "id": "game_1",
+            "sport_key": "americanfootball_nfl",
+            "home_team": "Home",
+            "away_team": "Away",
+            "commence_time": "2030-01-01T18:00:00Z",
+            "bookmakers": [
+                {"title": book, "markets": [
+                    {"key": "h2h", "outcomes": [{"name": "Away", "price": price}, {"name": "Home", "price": -price - 20}]},
+                    {"key": "totals", "outcomes": [{"name": "Over", "point": 44.5}, {"name": "Under", "point": 44.5}]}
+                ]}
+                for book, price in [("DraftKings", 120), ("FanDuel", 115), ("BetMGM", 110)]
+            ]
+        }
+        no_moneyline = dict(game, id="game_2", bookmakers=[{"title": "DraftKings", "markets": []}])
+        
+        table = client._parse_sport_payload("americanfootball_nfl", [game, no_moneyline])
+        
+        assert [g.game_id for g in table] == ["game_1"]
+        assert table.books == ["DraftKings", "FanDuel", "BetMGM"]
+        assert table.moneyline[0, :, 0].tolist() == [120, 115, 110]
+        assert table.total[0, :, 0].tolist() == [44.5, 44.5, 44.5]
+
+
+class TestOddsQueryParams:
+    """Test source-side projection of odds requests."""
+    
+    @pytest.fixture
+    def config(self):
+        """Test configuration with default markets and bookmakers."""
+        return Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+    
+    def test_window_markets_and_regions(self, config):
+        """Test the commence-time window is hour-aligned and markets default to config."""
+        now = datetime(2030, 1, 1, 12, 34, 56, tzinfo=timezone.utc)
+        
+        params = odds_query_params(config, 48, now=now)
+        
+        assert params['commenceTimeFrom'] == "2030-01-01T12:00:00Z"
+        assert params['commenceTimeTo'] == "2030-01-03T13:00:00Z"
+        assert params['markets'] == "h2h"
+        assert params['regions'] == "us"
+        assert 'bookmakers' not in params
+        assert odds_query_params(config, 48, markets="h2h,totals", now=now)['markets'] == "h2h,totals"
+    
+    def test_bookmaker_allow_list_replaces_region(self, config):
+        """Test a bookmaker allow-list is sent instead of a region and keys the payload."""
+        config.odds_bookmakers = ["draftkings", "fanduel"]
+        client = OddsClient(config)
+        
+        request = client._sport_odds_request("americanfootball_nfl", 24)
+        
+        assert request.params['bookmakers'] == "draftkings,fanduel"
+        assert 'regions' not in request.params
+        assert request.key == "odds:americanfootball_nfl:h2h:draftkings,fanduel:24h"
+        assert request.url == "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds"
@@ -5,7 +5,9 @@ Tests for the main pipeline.
 import pytest
 from datetime import datetime, timedelta
 from src.core.models import Config, KalshiMarket, SportsbookOdds, Game
+from src.core.odds_table import OddsTable
 from src.core.pipeline import EdgeFinderPipeline
+from src.core.ranking import RankingEngine, SectionSpec
 
 
 class TestPipeline:
@@ -137,15 +139,11 @@ class TestPipeline:
             start_time=datetime.now() + timedelta(hours=24)
         )
         
-        odds_by_game = {}
-        for odds in sample_sportsbook_odds:
-            if odds.game_id not in odds_by_game:
-                odds_by_game[odds.game_id] = []
-            odds_by_game[odds.game_id].append(odds)
+        odds_index = pipeline._build_odds_index(OddsTable.from_models(sample_sportsbook_odds))
+        matching_odds = pipeline._find_matching_odds(game, odds_index)
         
-        matching_odds = pipeline._find_matching_odds(game, odds_by_game)
-        
-        assert len(matching_odds) == 1  # Only one odds entry in fixture
+        assert len(matching_odds) == 1  # Only one matching game in fixture
+        assert matching_odds.num_rows == 2  # Every book is kept
         assert all(odds.sport == "americanfootball_nfl" for odds in matching_odds)
     
     def test_process_match(self, config, sample_kalshi_markets, sample_sportsbook_odds):
@@ -170,10 +168,69 @@ class TestPipeline:
         assert len(matched_game.book_probs) > 0
         assert matched_game.discrepancy_abs >= 0
     
-    def test_generate_rankings(self, config):
-        """Test ranking generation."""
+    def test_process_match_uses_every_book(self, config, sample_kalshi_markets, sample_sportsbook_odds):
+        """Test that book statistics span all books, not just the first one."""
         pipeline = EdgeFinderPipeline(config)
+        config.devig_method = "none"
+        
+        game = Game(
+            sport="americanfootball_nfl",
+            away_team="Seattle Seahawks",
+            home_team="San Francisco 49ers",
+            start_time=datetime.now() + timedelta(hours=24)
+        )
+        odds_table = OddsTable.from_models(sample_sportsbook_odds)
+        matching_odds = pipeline._find_matching_odds(game, pipeline._build_odds_index(odds_table))
+        
+        matched_game = pipeline._process_match(game, sample_kalshi_markets[0], matching_odds)
         
+        assert [odds.book_name for odds in matched_game.sportsbook_odds] == ["DraftKings", "FanDuel"]
+        assert len(matched_game.book_probs) == 2
+        assert matched_game.min_book_prob == pytest.approx(100 / 220)
+        assert matched_game.max_book_prob == pytest.approx(100 / 215)
+    
+    def test_process_matches_compares_market_side_only(self, config, sample_sportsbook_odds):
+        """Test that each market is compared with its own side's prices."""
+        pipeline = EdgeFinderPipeline(config)
+        config.devig_method = "none"
+        event_time = datetime.now() + timedelta(hours=24)
+        odds_table = OddsTable.from_models(sample_sportsbook_odds).select([0])
+        
+        def make_market(market_id, outcome_description, market_side="YES"):
+            return KalshiMarket(
+                market_id=market_id,
+                title="Will San Francisco 49ers beat Seattle Seahawks?",
+                event_time=event_time,
+                last_price=0.5,
+                volume=1000,
+                market_side=market_side,
+                outcome_description=outcome_description
+            )
+        
+        # Title order (49ers first) is the reverse of the sportsbook's away/home order
+        game = Game(sport="americanfootball_nfl", away_team="49ers", home_team="seahawks", start_time=event_time)
+        markets = [
+            make_market("m1", "San Francisco 49ers wins"),
+            make_market("m2", "Seahawks win"),
+            make_market("robinhood-test_1-away-win", "test"),
+            make_market("m4", "test"),
+            make_market("m5", "San Francisco 49ers wins", market_side="NO"),
+        ]
+        
+        matched_games = pipeline._process_matches([(game, market, odds_table) for market in markets])
+        
+        assert [m.selection for m in matched_games] == ["49ers", "seahawks", "seahawks", "49ers", "seahawks"]
+        niners, seahawks = matched_games[0], matched_games[1]
+        assert niners.book_probs == pytest.approx([140 / 240, 135 / 235])
+        assert niners.best_price == -135
+        assert niners.opponent_best_price == 120
+        assert niners.consensus_prob == pytest.approx((140 / 240 + 135 / 235) / 2)
+        assert niners.book_spread == pytest.approx(140 / 240 - 135 / 235)
+        assert seahawks.avg_book_prob == pytest.approx(niners.opponent_consensus_prob)
+        assert seahawks.discrepancy_abs == pytest.approx(abs(0.5 - (100 / 220 + 100 / 215) / 2))
+    
+    def test_generate_rankings(self, config):
+        """Test ranking generation."""
         # Create mock matched games
         matched_games = []
         for i in range(3):
@@ -213,9 +270,64 @@ class TestPipeline:
             )
             matched_games.append(matched_game)
         
-        rankings = pipeline._generate_rankings(matched_games)
+        spec = SectionSpec(
+            title="By discrepancy",
+            description="Every game by discrepancy",
+            score=lambda columns: [columns['discrepancy']]
+        )
+        section, = RankingEngine(config.top_n, [spec]).build_sections(matched_games)
+        rankings = section.rankings
         
         assert len(rankings) == 3
         assert rankings[0].rank == 1
         assert rankings[0].discrepancy_score >= rankings[1].discrepancy_score
         assert rankings[1].discrepancy_score >= rankings[2].discrepancy_score
+    
+    def test_run_downloads_each_sport_once(self, config, monkeypatch):
+        """Test that markets and odds consumers share one download per sport."""
+        config.use_fixtures = False
+        config.sports_filter = ["americanfootball_nfl", "basketball_nba"]
+        pipeline = EdgeFinderPipeline(config)
+        base_time = datetime.now() + timedelta(hours=24)
+        downloads = []
+        
+        def fake_download(request):
+            sport = request.sport
+            downloads.append(sport)
+            return OddsTable.from_models([SportsbookOdds(
+                game_id=f"{sport}_1",
+                sport=sport,
+                away_team="Seattle Seahawks",
+                home_team="San Francisco 49ers",
+                start_time=base_time,
+                book_name="DraftKings",
+                moneyline_away=120,
+                moneyline_home=-140
+            )])
+        
+        monkeypatch.setattr(pipeline.odds_client, "_download_sport_odds", fake_download)
+        
+        report = pipeline.run()
+        
+        assert sorted(downloads) == ["americanfootball_nfl", "basketball_nba"]
+        assert report.total_markets == 4
+    
+    def test_find_matching_odds_ignores_home_away_order(self, config, sample_sportsbook_odds):
+        """Test that the odds index matches a game listed in either order."""
+        pipeline = EdgeFinderPipeline(config)
+        
+        game = Game(
+            sport="americanfootball_nfl",
+            away_team="49ers",
+            home_team="seahawks",
+            start_time=datetime.now() + timedelta(hours=24)
+        )
+        
+        odds_index = pipeline._build_odds_index(OddsTable.from_models(sample_sportsbook_odds))
+        matching_odds = pipeline._find_matching_odds(game, odds_index)
+        
+        assert [odds.game_id for odds in matching_odds] == ["test_1"]
+        assert len(pipeline._find_matching_odds(
+            Game(sport="basketball_nba", away_team="49ers", home_team="seahawks", start_time=game.start_time),
+            odds_index
+        )) == 0
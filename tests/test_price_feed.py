@@ -0,0 +1,178 @@
+"""
+Tests for the streamed price book and feed subscriber.
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from src.core.models import KalshiMarket
+from src.core.records import MarketRecord
+from src.data.price_feed import InMemoryTransport, PriceBook, PriceFeedSubscriber
+
+
+def make_market(market_id: str, last_price: float = 0.45) -> MarketRecord:
+    """Build a polled market record."""
+    return MarketRecord(
+        market_id=market_id,
+        title="Seahawks vs 49ers",
+        event_time=datetime(2030, 1, 1, 18, 0),
+        last_price=last_price,
+        volume=1500,
+        market_side="YES",
+        outcome_description="Seahawks win"
+    )
+
+
+def ticker(market_id: str, **fields) -> dict:
+    """Build a ticker channel message."""
+    return {"type": "ticker", "sid": 1, "msg": {"market_ticker": market_id, **fields}}
+
+
+class TestPriceBook:
+    """Test the in-memory quote table."""
+    
+    @pytest.fixture
+    def clock(self):
+        """A mutable wall clock."""
+        return [1000.0]
+    
+    @pytest.fixture
+    def book(self, clock):
+        """Empty book on the fake clock."""
+        return PriceBook(clock=lambda: clock[0])
+    
+    def test_partial_updates_merge(self, book):
+        """Test fields missing from an update keep their previous value."""
+        book.update("M1", last_price=0.40, yes_bid=0.39, yes_ask=0.41, volume=100)
+        quote = book.update("M1", last_price=0.42)
+        
+        assert (quote.last_price, quote.yes_bid, quote.yes_ask, quote.volume) == (0.42, 0.39, 0.41, 100)
+        assert book.get("M2") is None
+        assert len(book) == 1
+    
+    def test_apply_overlays_fresh_prices(self, book, clock):
+        """Test fresh, tradeable quotes replace polled prices without mutating inputs."""
+        markets = [make_market("M1"), make_market("M2"), make_market("M3")]
+        book.update("M1", last_price=0.55, volume=2000)
+        book.update("M2", last_price=1.0)
+        clock[0] += 60
+        book.update("M3", last_price=0.60)
+        
+        fresh = book.apply(markets, max_age=30)
+        
+        assert [m.last_price for m in fresh] == [0.45, 0.45, 0.60]
+        assert [m.last_price for m in book.apply(markets)] == [0.55, 0.45, 0.60]
+        assert book.apply(markets)[0].volume == 2000
+        assert markets[2].last_price == 0.45
+        
+        model = make_market("M3").to_model()
+        assert book.apply([model])[0] == model.model_copy(update={"last_price": 0.60})
+        assert isinstance(book.apply([model])[0], KalshiMarket)
+    
+    def test_old_quotes_age_out(self, clock):
+        """Test quotes not updated within max_age are dropped as new ones arrive."""
+        book = PriceBook(clock=lambda: clock[0], max_age=600)
+        book.update("M1", last_price=0.40)
+        clock[0] += 300
+        book.update("M2", last_price=0.50)
+        clock[0] += 400
+        book.update("M3", last_price=0.60)
+        
+        assert book.get("M1") is None
+        assert book.get("M2").last_price == 0.50
+        assert len(book) == 2
+        assert book.version == 3
+
+
+class TestPriceFeedSubscriber:
+    """Test the subscriber against the in-memory stand-in server."""
+    
+    def test_subscribes_and_applies_ticker_updates(self):
+        """Test the subscribe command, cent conversion and ignored message types."""
+        book = PriceBook()
+        
+        async def run():
+            transport = InMemoryTransport()
+            subscriber = PriceFeedSubscriber(book, "wss://feed.test", transport=transport, market_ids=["M1"])
+            subscriber.start()
+            await transport.publish({"type": "subscribed", "id": 1})
+            await transport.publish(ticker("M1", price=48, yes_bid=45, yes_ask=53, volume=3000, ts=1700000000))
+            await transport.publish(ticker("M1", price=50))
+            while subscriber.messages < 2:
+                await asyncio.sleep(0)
+            await subscriber.stop()
+            return transport
+        
+        transport = asyncio.run(run())
+        quote = book.get("M1")
+        
+        assert transport.sent == [{"id": 1, "cmd": "subscribe", "params": {"channels": ["ticker"], "market_tickers": ["M1"]}}]
+        assert (quote.last_price, quote.yes_bid, quote.yes_ask, quote.volume) == (0.50, 0.45, 0.53, 3000)
+    
+    def test_reconnects_after_disconnect(self):
+        """Test a dropped connection is reopened and resubscribed."""
+        book = PriceBook()
+        
+        async def run():
+            transport = InMemoryTransport()
+            subscriber = PriceFeedSubscriber(
+                book, "wss://feed.test", transport=transport, headers=lambda: {"Authorization": "Bearer t"},
+                reconnect_delay=0
+            )
+            subscriber.start()
+            await transport.disconnect()
+            await transport.publish(ticker("M2", price=61))
+            while subscriber.messages < 1:
+                await asyncio.sleep(0)
+            await subscriber.stop()
+            return transport, subscriber
+        
+        transport, subscriber = asyncio.run(run())
+        
+        assert transport.connections == 2
+        assert subscriber.reconnects == 1
+        assert len(transport.sent) == 2
+        assert book.get("M2").last_price == 0.61
+    
+    def test_backoff_resets_after_a_working_connection(self, monkeypatch):
+        """Test a connection that received messages restarts the reconnect backoff."""
+        delays = []
+        sleep = asyncio.sleep
+        
+        async def fake_sleep(delay):
+            if delay:
+                delays.append(delay)
+            await sleep(0)
+        
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        
+        async def run():
+            transport = InMemoryTransport()
+            subscriber = PriceFeedSubscriber(
+                PriceBook(), "wss://feed.test", transport=transport, reconnect_delay=1, max_reconnect_delay=30
+            )
+            subscriber.start()
+            await transport.disconnect()
+            await transport.disconnect()
+            await transport.publish(ticker("M1", price=50))
+            await transport.disconnect()
+            await transport.disconnect()
+            while subscriber.reconnects < 4:
+                await asyncio.sleep(0)
+            await subscriber.stop()
+        
+        asyncio.run(run())
+        
+        assert delays == [1, 2, 1, 2]
+    
+    def test_malformed_messages_are_ignored(self):
+        """Test junk and non-ticker messages leave the book untouched."""
+        subscriber = PriceFeedSubscriber(PriceBook(), "wss://feed.test", transport=InMemoryTransport())
+        
+        assert subscriber.handle_message("not json") is None
+        assert subscriber.handle_message(json.dumps({"type": "error", "msg": {"code": 8}})) is None
+        assert subscriber.handle_message(json.dumps(ticker("", price=10))) is None
+        assert subscriber.handle_message(json.dumps([1, 2])) is None
+        assert subscriber.handle_message(json.dumps({"type": "ticker", "msg": "M1"})) is None
+        assert len(subscriber.book) == 0
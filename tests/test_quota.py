@@ -0,0 +1,48 @@
+"""
+Tests for TheOddsAPI quota accounting.
+"""
+
+import pytest
+from src.data.quota import QuotaTracker, key_id
+
+
+class TestQuotaTracker:
+    """Test quota header recording and refresh slowdown."""
+    
+    @pytest.fixture
+    def tracker(self):
+        """Tracker with a fixed clock."""
+        return QuotaTracker(low_fraction=0.2, reserve=10, max_slowdown=8.0, clock=lambda: 1000.0)
+    
+    def test_record_reads_quota_headers(self, tracker):
+        """Test headers are parsed, including float values, and keyed per API key."""
+        status = tracker.record("key_a", {"x-requests-remaining": "480.0", "x-requests-used": "20", "x-requests-last": "3"})
+        
+        assert status == tracker.get("key_a")
+        assert (status.remaining, status.used, status.last_cost, status.updated_at) == (480, 20, 3, 1000.0)
+        assert status.remaining_fraction == pytest.approx(0.96)
+        assert tracker.get("key_b") is None
+        assert tracker.record("key_a", {"content-type": "application/json"}) is None
+        assert tracker.get("key_a") == status
+    
+    def test_statuses_mask_api_keys(self, tracker):
+        """Test exposed statuses are keyed by a non-reversible id."""
+        tracker.record("secret_key", {"x-requests-remaining": "10", "x-requests-used": "5"})
+        
+        statuses = tracker.statuses()
+        
+        assert list(statuses) == [key_id("secret_key")]
+        assert "secret_key" not in key_id("secret_key")
+    
+    def test_slowdown_grows_as_quota_runs_out(self, tracker):
+        """Test refreshes slow down below low_fraction and cap at the reserve."""
+        assert tracker.slowdown("key") == 1.0
+        
+        tracker.record("key", {"x-requests-remaining": "300", "x-requests-used": "200"})
+        assert tracker.slowdown("key") == 1.0
+        
+        tracker.record("key", {"x-requests-remaining": "50", "x-requests-used": "450"})
+        assert tracker.slowdown("key") == pytest.approx(2.0)
+        
+        tracker.record("key", {"x-requests-remaining": "10", "x-requests-used": "490"})
+        assert tracker.slowdown("key") == 8.0
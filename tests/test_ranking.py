@@ -0,0 +1,115 @@
+"""
+Tests for top-K ranking of matched games.
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime
+from src.core.models import Game, KalshiMarket, MatchedGame
+from src.core.ranking import RankingEngine, SectionSpec, descending_ranks, top_k_indices
+
+
+def make_matched_game(discrepancy: float, volume: int, payout_ratio: float = 1.0) -> MatchedGame:
+    """Build a matched game with the fields ranking looks at."""
+    start_time = datetime(2030, 1, 1)
+    return MatchedGame(
+        game=Game(sport="nfl", away_team="Away", home_team="Home", start_time=start_time),
+        kalshi_market=KalshiMarket(
+            market_id="market",
+            title="Away vs Home",
+            event_time=start_time,
+            last_price=0.5,
+            volume=volume,
+            market_side="YES",
+            outcome_description="Away wins"
+        ),
+        sportsbook_odds=[],
+        prediction_prob=0.5,
+        book_probs=[0.5],
+        min_book_prob=0.5,
+        avg_book_prob=0.5,
+        max_book_prob=0.5,
+        discrepancy_abs=discrepancy,
+        discrepancy_vs_best=0.0,
+        volume=volume,
+        payout_ratio=payout_ratio,
+        expected_value=0.0
+    )
+
+
+class TestTopK:
+    """Test partition-based top-K selection."""
+    
+    def test_matches_stable_descending_sort(self):
+        """Test selection order equals a full stable sort on every key."""
+        rng = np.random.default_rng(0)
+        primary = rng.integers(0, 5, 200).astype(float)
+        secondary = rng.integers(0, 3, 200).astype(float)
+        
+        expected = sorted(range(200), key=lambda i: (-primary[i], -secondary[i], i))[:17]
+        
+        assert top_k_indices([primary, secondary], 17).tolist() == expected
+    
+    def test_mask_and_small_inputs(self):
+        """Test eligibility masks, k larger than the input and k of zero."""
+        scores = np.array([0.3, np.nan, 0.9, 0.1])
+        
+        assert top_k_indices([scores], 10).tolist() == [2, 0, 3, 1]
+        assert top_k_indices([scores], 2, mask=scores < 0.5).tolist() == [0, 3]
+        assert top_k_indices([scores], 0).tolist() == []
+    
+    def test_descending_ranks(self):
+        """Test ranks equal positions in a stable descending sort."""
+        scores = np.array([0.2, 0.5, 0.2, 0.9])
+        
+        assert descending_ranks(scores, np.array([0, 2, 3])).tolist() == [3, 4, 1]
+
+
+class TestRankingEngine:
+    """Test building newsletter sections."""
+    
+    @pytest.fixture
+    def matched_games(self):
+        """Matched games with distinct discrepancy, volume and payout."""
+        return [
+            make_matched_game(0.10, 5000, payout_ratio=3.0),
+            make_matched_game(0.30, 1000),
+            make_matched_game(0.20, 3000, payout_ratio=2.5),
+            make_matched_game(0.05, 4000),
+        ]
+    
+    def test_default_sections(self, matched_games):
+        """Test the default sections select and rank like the old full sorts."""
+        sections = RankingEngine(top_n=2).build_sections(matched_games)
+        
+        assert [section.title for section in sections] == [
+            "Best Robinhood Opportunities",
+            "Most Popular on Robinhood",
+            "Highest Payout Potential on Robinhood",
+        ]
+        assert [r.matched_game.volume for r in sections[0].rankings] == [1000, 3000]
+        assert [r.matched_game.volume for r in sections[1].rankings] == [5000, 4000]
+        assert [r.matched_game.volume for r in sections[2].rankings] == [5000, 3000]
+        
+        # Ranks are discrepancy ranks, and shared games share one ranking
+        assert [r.rank for r in sections[1].rankings] == [3, 4]
+        assert sections[2].rankings[1] is sections[0].rankings[1]
+    
+    def test_custom_section(self, matched_games):
+        """Test a pluggable scoring function and filter."""
+        spec = SectionSpec(
+            title="Longshots",
+            description="Biggest payouts",
+            score=lambda columns: [columns["payout_ratio"]],
+            include=lambda columns: columns["volume"] >= 2000
+        )
+        
+        sections = RankingEngine(top_n=5, sections=[spec]).build_sections(matched_games)
+        
+        assert [r.matched_game.volume for r in sections[0].rankings] == [5000, 3000, 4000]
+    
+    def test_no_games(self):
+        """Test sections are still produced with nothing to rank."""
+        sections = RankingEngine(top_n=3).build_sections([])
+        
+        assert [len(section.rankings) for section in sections] == [0, 0, 0]
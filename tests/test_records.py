@@ -0,0 +1,96 @@
+"""
+Tests for lightweight internal records.
+"""
+
+import pytest
+from datetime import datetime
+from pydantic import ValidationError
+from src.core.models import Config, KalshiMarket, SportsbookOdds
+from src.core.records import MarketRecord, OddsRecord, as_kalshi_market
+from src.data.kalshi_client import KalshiClient
+
+
+class TestRecords:
+    """Test record conversion at the model boundary."""
+    
+    @pytest.fixture
+    def market_record(self):
+        """A valid market record."""
+        return MarketRecord(
+            market_id="market_1",
+            title="Seattle Seahawks vs San Francisco 49ers",
+            event_time=datetime(2030, 1, 1, 18, 0),
+            last_price=0.45,
+            volume=1500,
+            market_side="YES",
+            outcome_description="Seahawks win"
+        )
+    
+    def test_records_are_slotted(self, market_record):
+        """Test records carry no per-instance __dict__."""
+        assert not hasattr(market_record, "__dict__")
+        assert not hasattr(OddsRecord(
+            game_id="g", sport="nfl", away_team="A", home_team="B",
+            start_time=datetime(2030, 1, 1), book_name="DraftKings"
+        ), "__dict__")
+    
+    def test_market_round_trip(self, market_record):
+        """Test records convert to equal models and back."""
+        model = market_record.to_model()
+        
+        assert isinstance(model, KalshiMarket)
+        assert model.model_dump() == {
+            "market_id": "market_1",
+            "title": "Seattle Seahawks vs San Francisco 49ers",
+            "event_time": datetime(2030, 1, 1, 18, 0),
+            "last_price": 0.45,
+            "volume": 1500,
+            "open_interest": None,
+            "market_side": "YES",
+            "outcome_description": "Seahawks win",
+        }
+        assert MarketRecord.from_model(model) == market_record
+        assert as_kalshi_market(model) is model
+    
+    def test_odds_round_trip(self):
+        """Test odds records convert to equal models and back."""
+        model = SportsbookOdds(
+            game_id="g", sport="nfl", away_team="A", home_team="B",
+            start_time=datetime(2030, 1, 1), book_name="DraftKings",
+            moneyline_away=120, moneyline_home=-140, total_over=45.5
+        )
+        
+        assert OddsRecord.from_model(model).to_model() == model
+    
+    def test_validation_at_boundary(self, market_record):
+        """Test invalid values are only rejected when converted to a model."""
+        market_record.last_price = 1.5
+        
+        with pytest.raises(ValidationError):
+            market_record.to_model()
+    
+    def test_kalshi_parser_enforces_price_bounds(self):
+        """Test the Kalshi parser drops markets the model would reject."""
+        client = KalshiClient(Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        ))
+        market = {
+            "id": "market_1",
+            "title": "Seattle Seahawks vs San Francisco 49ers",
+            "event_time": "2030-01-01T18:00:00Z",
+            "last_price": 0.45,
+            "volume": 1500,
+        }
+        
+        markets = client._parse_markets_payload({"markets": [market, dict(market, id="market_2", last_price=0)]})
+        
+        assert [m.market_id for m in markets] == ["market_1"]
+        assert isinstance(markets[0], MarketRecord)
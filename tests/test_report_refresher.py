@@ -0,0 +1,253 @@
+"""
+Tests for the background report refresher.
+"""
+
+import asyncio
+import httpx
+import src.main as main
+from datetime import datetime
+from src.core.models import Config
+from src.core.records import MarketRecord
+from src.data.disk_cache import DiskCache
+from src.data.kalshi_client import AsyncKalshiClient
+from src.data.odds_client import AsyncOddsClient
+from src.data.price_feed import PriceBook
+from src.services.report_refresher import ReportRefresher
+
+
+class TestReportRefresher:
+    """Test report snapshot refreshing."""
+    
+    def test_snapshot_served_without_rebuilding(self):
+        """Test that reads reuse the snapshot instead of rebuilding."""
+        builds = []
+        
+        async def build():
+            builds.append(1)
+            return f"report {len(builds)}"
+        
+        async def run():
+            refresher = ReportRefresher(build, interval_seconds=60)
+            refresher.start()
+            try:
+                first = await refresher.get_snapshot()
+                for _ in range(10):
+                    assert await refresher.get_snapshot() is first
+                return first
+            finally:
+                await refresher.stop()
+        
+        snapshot = asyncio.run(run())
+        
+        assert snapshot.content == "report 1"
+        assert snapshot.version == 1
+        assert len(builds) == 1
+    
+    def test_request_refresh_rebuilds(self):
+        """Test that an explicit refresh swaps in a new snapshot."""
+        async def build():
+            return "report"
+        
+        async def run():
+            refresher = ReportRefresher(build, interval_seconds=60)
+            refresher.start()
+            try:
+                await refresher.get_snapshot()
+                refresher.request_refresh()
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if refresher.snapshot.version == 2:
+                        break
+                return refresher.snapshot
+            finally:
+                await refresher.stop()
+        
+        assert asyncio.run(run()).version == 2
+    
+    def test_failed_rebuild_keeps_previous_snapshot(self):
+        """Test that a failing rebuild does not drop the last good snapshot."""
+        results = ["good"]
+        
+        async def build():
+            if not results:
+                raise RuntimeError("upstream down")
+            return results.pop()
+        
+        async def run():
+            refresher = ReportRefresher(build, interval_seconds=60)
+            refresher.start()
+            try:
+                await refresher.get_snapshot()
+                refresher.request_refresh()
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if refresher.last_error is not None:
+                        break
+                return refresher
+            finally:
+                await refresher.stop()
+        
+        refresher = asyncio.run(run())
+        
+        assert refresher.snapshot.content == "good"
+        assert isinstance(refresher.last_error, RuntimeError)
+    
+    def test_web_report_failing_upstream_keeps_saved_snapshot(self, tmp_path, monkeypatch):
+        """Test a web report build where every fetch fails keeps the saved snapshot in memory and on disk."""
+        config = Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+        
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("upstream down")
+        
+        monkeypatch.setattr(main, "load_config", lambda: config)
+        monkeypatch.setattr("src.config.load_config", lambda: config)
+        monkeypatch.setattr(main, "configure_shared_cache", lambda config: DiskCache(tmp_path))
+        monkeypatch.setattr(AsyncOddsClient, "fetch_sport_payload", unavailable)
+        monkeypatch.setattr(AsyncKalshiClient, "fetch_markets", unavailable)
+        
+        async def good_report():
+            return "good report"
+        
+        async def run():
+            refresher = ReportRefresher(good_report, interval_seconds=60, store=DiskCache(tmp_path))
+            refresher.start()
+            try:
+                await refresher.get_snapshot()
+            finally:
+                await refresher.stop()
+            
+            app = main.create_app()
+            async with app.router.lifespan_context(app):
+                refresher = app.state.report_refresher
+                for _ in range(100):
+                    if refresher.last_error is not None:
+                        break
+                    await asyncio.sleep(0.01)
+            return refresher
+        
+        refresher = asyncio.run(run())
+        
+        assert refresher.snapshot.content == "good report"
+        assert isinstance(refresher.last_error, RuntimeError)
+        assert ReportRefresher(good_report, store=DiskCache(tmp_path)).snapshot.version == 1
+    
+    def test_web_report_serves_prices_streamed_after_the_build(self, tmp_path, monkeypatch):
+        """Test reads re-render the saved inputs with quotes that arrived after the snapshot was built."""
+        config = Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+        game = {
+            "home_team": "San Francisco 49ers",
+            "away_team": "Seattle Seahawks",
+            "commence_time": "2030-01-01T18:00:00Z",
+            "bookmakers": [{"markets": [{"key": "h2h", "outcomes": [
+                {"name": "Seattle Seahawks", "price": 120},
+                {"name": "San Francisco 49ers", "price": -140}
+            ]}]}]
+        }
+        market = MarketRecord(
+            market_id="KXNFLGAME-SEASF",
+            title="Seattle Seahawks vs San Francisco 49ers",
+            event_time=datetime(2030, 1, 1, 18, 0),
+            last_price=0.40,
+            volume=1500,
+            market_side="YES",
+            outcome_description=""
+        )
+        
+        async def sport_payload(self, sport, *args, **kwargs):
+            return [game] if sport == "americanfootball_nfl" else []
+        
+        async def markets(*args, **kwargs):
+            return [market]
+        
+        book = PriceBook()
+        monkeypatch.setattr(main, "load_config", lambda: config)
+        monkeypatch.setattr("src.config.load_config", lambda: config)
+        monkeypatch.setattr(main, "configure_shared_cache", lambda config: DiskCache(tmp_path))
+        monkeypatch.setattr(main, "price_book", book)
+        monkeypatch.setattr(AsyncOddsClient, "fetch_sport_payload", sport_payload)
+        monkeypatch.setattr(AsyncKalshiClient, "fetch_markets", markets)
+        
+        async def run():
+            app = main.create_app()
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    built = (await client.get("/api/latest")).text
+                    book.update("KXNFLGAME-SEASF", last_price=0.63)
+                    live = (await client.get("/api/latest")).text
+                    again = (await client.get("/api/latest")).text
+                return built, live, again, app.state.report_refresher.snapshot.content
+        
+        built, live, again, snapshot = asyncio.run(run())
+        
+        assert "**Robinhood Seattle Seahawks:** 40.0%" in built
+        assert "**Robinhood Seattle Seahawks:** 63.0%" in live
+        assert again == live
+        assert snapshot == built
+    
+    def test_snapshot_restored_after_restart(self, tmp_path):
+        """Test that a saved snapshot is served immediately by a new refresher."""
+        async def build():
+            return "report"
+        
+        async def never_finishes():
+            await asyncio.Event().wait()
+        
+        async def run():
+            refresher = ReportRefresher(build, interval_seconds=60, store=DiskCache(tmp_path))
+            refresher.start()
+            try:
+                await refresher.get_snapshot()
+            finally:
+                await refresher.stop()
+            
+            restarted = ReportRefresher(never_finishes, interval_seconds=60, store=DiskCache(tmp_path))
+            restarted.start()
+            try:
+                return await asyncio.wait_for(restarted.get_snapshot(), timeout=1)
+            finally:
+                await restarted.stop()
+        
+        snapshot = asyncio.run(run())
+        
+        assert snapshot.content == "report"
+        assert snapshot.version == 1
+    
+    def test_next_interval_sets_schedule(self):
+        """Test that a refresh interval policy replaces the fixed interval."""
+        async def build():
+            return "report"
+        
+        async def run():
+            refresher = ReportRefresher(build, interval_seconds=3600, next_interval=lambda: 0.01)
+            refresher.start()
+            try:
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if refresher.snapshot and refresher.snapshot.version >= 3:
+                        break
+                return refresher.snapshot
+            finally:
+                await refresher.stop()
+        
+        assert asyncio.run(run()).version >= 3
@@ -0,0 +1,177 @@
+"""
+Tests for retries, circuit breakers and run deadlines.
+"""
+
+import asyncio
+import pytest
+import requests
+from src.data.resilience import CircuitBreaker, CircuitOpenError, Deadline, DeadlineExceeded, Resilience, gather_within
+
+
+URL = "https://api.example.com/v1/things"
+
+
+class FakeResponse:
+    """Response stand-in carrying only a status code."""
+    
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class TestResilience:
+    """Test retry, breaker and deadline behaviour around one call."""
+    
+    @pytest.fixture
+    def clock(self):
+        """A mutable monotonic clock."""
+        return [0.0]
+    
+    @pytest.fixture
+    def sleeps(self):
+        """Backoff delays the policy slept for."""
+        return []
+    
+    @pytest.fixture
+    def policy(self, clock, sleeps):
+        """Three attempts, no jitter randomness and a fake clock."""
+        return Resilience(
+            attempts=3, base_delay=1.0, max_delay=4.0, failure_threshold=3, reset_timeout=30,
+            clock=lambda: clock[0], sleep=sleeps.append, rng=lambda: 0.5
+        )
+    
+    def test_retries_transient_failures(self, policy, sleeps):
+        """Test connection errors and 503s are retried with growing backoff."""
+        outcomes = [requests.ConnectionError("reset"), FakeResponse(503), FakeResponse(200)]
+        timeouts = []
+        
+        def send(timeout):
+            timeouts.append(timeout)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        
+        response = policy.call(URL, send, timeout=10)
+        
+        assert response.status_code == 200
+        assert sleeps == [0.5, 1.0]
+        assert timeouts == [10, 10, 10]
+        assert policy.breaker(URL).state == 'closed'
+    
+    def test_gives_up_after_attempts(self, policy):
+        """Test the last retryable response is returned and client errors are not retried."""
+        policy.failure_threshold = 10
+        calls = []
+        
+        assert policy.call(URL, lambda timeout: calls.append(1) or FakeResponse(503)).status_code == 503
+        assert len(calls) == 3
+        assert policy.call(URL, lambda timeout: calls.append(1) or FakeResponse(404)).status_code == 404
+        assert len(calls) == 4
+        
+        with pytest.raises(requests.Timeout):
+            policy.call(URL, lambda timeout: (_ for _ in ()).throw(requests.Timeout("slow")))
+    
+    def test_circuit_opens_and_recovers(self, policy, clock):
+        """Test a failing host is skipped until a half-open trial succeeds."""
+        policy.call(URL, lambda timeout: FakeResponse(500))
+        
+        assert policy.breaker(URL).state == 'open'
+        with pytest.raises(CircuitOpenError):
+            policy.call(URL, lambda timeout: FakeResponse(200))
+        assert policy.breaker("https://other.example.com/").state == 'closed'
+        
+        clock[0] += 30
+        assert policy.breaker(URL).state == 'half-open'
+        assert policy.call(URL, lambda timeout: FakeResponse(200)).status_code == 200
+        assert policy.breaker_states() == {"api.example.com": 'closed', "other.example.com": 'closed'}
+    
+    def test_failed_trial_reopens(self):
+        """Test one failure in half-open state reopens the breaker."""
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: clock[0])
+        breaker.record_failure()
+        clock[0] += 10
+        
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == 'open'
+    
+    def test_cancellation_is_not_a_failure(self, policy, clock):
+        """Test cancelled or locally failing calls free the trial slot without tripping the breaker."""
+        
+        async def cancelled(timeout):
+            raise asyncio.CancelledError()
+        
+        def broken(timeout):
+            raise KeyError("local bug")
+        
+        for _ in range(3):
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(policy.acall(URL, cancelled))
+            with pytest.raises(KeyError):
+                policy.call(URL, broken)
+        
+        breaker = policy.breaker(URL)
+        assert (breaker.state, breaker.failures) == ('closed', 0)
+        
+        policy.call(URL, lambda timeout: FakeResponse(500))
+        clock[0] += 30
+        with pytest.raises(KeyError):
+            policy.call(URL, broken)
+        assert breaker.state == 'half-open'
+        assert policy.call(URL, lambda timeout: FakeResponse(200)).status_code == 200
+    
+    def test_deadline_bounds_attempts(self, policy, clock, sleeps):
+        """Test timeouts are clamped to the deadline and no retry outlives it."""
+        deadline = Deadline(0.8, clock=lambda: clock[0])
+        timeouts = []
+        
+        def sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+        
+        policy.sleep = sleep
+        response = policy.call(URL, lambda timeout: timeouts.append(timeout) or FakeResponse(503), timeout=10, deadline=deadline)
+        
+        assert response.status_code == 503
+        assert timeouts == [0.8, pytest.approx(0.3)]
+        assert sleeps == [0.5]
+        
+        clock[0] += 1
+        assert deadline.expired
+        with pytest.raises(DeadlineExceeded):
+            policy.call(URL, lambda timeout: FakeResponse(200), deadline=deadline)
+        assert Deadline(0).remaining() is None
+    
+    def test_async_retries(self, policy):
+        """Test acall retries like call without blocking the loop."""
+        statuses = [502, 200]
+        policy.base_delay = 0
+        
+        async def send(timeout):
+            return FakeResponse(statuses.pop(0))
+        
+        assert asyncio.run(policy.acall(URL, send)).status_code == 200
+
+
+class TestGatherWithin:
+    """Test partial results at a deadline."""
+    
+    def test_late_awaitables_are_cut_off(self):
+        """Test finished results and errors are kept and late ones become DeadlineExceeded."""
+        async def value(result, delay=0.0):
+            await asyncio.sleep(delay)
+            return result
+        
+        async def fail():
+            raise ValueError("bad payload")
+        
+        async def run():
+            return await gather_within([value("fast"), value("slow", 5), fail()], Deadline(0.05))
+        
+        fast, slow, failed = asyncio.run(run())
+        
+        assert fast == "fast"
+        assert isinstance(slow, DeadlineExceeded)
+        assert isinstance(failed, ValueError)
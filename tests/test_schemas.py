@@ -0,0 +1,92 @@
+"""
+Tests for parsing upstream responses straight from bytes.
+"""
+
+import json
+import pytest
+from src.core.models import Config
+from src.data.kalshi_client import KalshiClient
+from src.data.odds_client import OddsClient
+
+
+def make_game(game_id: str, books=(("DraftKings", 120, -140), ("FanDuel", 115, -135))) -> dict:
+    """Build a TheOddsAPI game with h2h and totals for each book."""
+    return {
+        "id": game_id,
+        "sport_key": "americanfootball_nfl",
+        "commence_time": "2030-01-01T18:00:00Z",
+        "home_team": "San Francisco 49ers",
+        "away_team": "Seattle Seahawks",
+        "bookmakers": [
+            {"key": title.lower(), "title": title, "last_update": "2030-01-01T12:00:00Z", "markets": [
+                {"key": "h2h", "outcomes": [
+                    {"name": "Seattle Seahawks", "price": away},
+                    {"name": "San Francisco 49ers", "price": home}
+                ]},
+                {"key": "totals", "outcomes": [
+                    {"name": "Over", "price": -110, "point": 45.5},
+                    {"name": "Under", "price": -110, "point": 45.5}
+                ]}
+            ]}
+            for title, away, home in books
+        ]
+    }
+
+
+class TestPayloadParsing:
+    """Test batch validation and the per-item fallback."""
+    
+    @pytest.fixture
+    def config(self):
+        """Test configuration hitting the (stubbed) live API path."""
+        return Config(
+            kalshi_base_url="https://api.kalshi.com",
+            odds_api_base_url="https://api.the-odds-api.com/v4",
+            odds_api_key="test_key",
+            timezone="America/Los_Angeles",
+            sports_filter=["americanfootball_nfl"],
+            lookahead_hours=48,
+            min_volume=100,
+            top_n=5,
+            use_fixtures=False
+        )
+    
+    def test_odds_batch_matches_per_game_parse(self, config):
+        """Test the bytes path yields the same odds as the dict path."""
+        client = OddsClient(config)
+        payload = [make_game("game_1"), make_game("game_2", books=(("BetMGM", -105, -115),))]
+        
+        batch = client._parse_sport_content("americanfootball_nfl", json.dumps(payload).encode())
+        per_game = client._parse_sport_payload("americanfootball_nfl", payload)
+        
+        assert [o.model_dump() for o in batch.to_models()] == [o.model_dump() for o in per_game.to_models()]
+        assert batch.books == ["DraftKings", "FanDuel", "BetMGM"]
+    
+    def test_odds_invalid_game_falls_back(self, config):
+        """Test one malformed game drops only itself."""
+        client = OddsClient(config)
+        bad_game = dict(make_game("game_2"), commence_time="not a time")
+        content = json.dumps([make_game("game_1"), bad_game]).encode()
+        
+        table = client._parse_sport_content("americanfootball_nfl", content)
+        
+        assert [game.game_id for game in table] == ["game_1"]
+    
+    def test_kalshi_batch_filters_before_building(self, config):
+        """Test volume and price filtering on the bytes path and its fallback."""
+        client = KalshiClient(config)
+        markets = [
+            {"id": "keep", "title": "Seahawks vs 49ers", "event_time": "2030-01-01T18:00:00Z",
+             "last_price": 0.45, "volume": 1500, "market_side": "YES", "outcome_description": "Seahawks win"},
+            {"id": "low_volume", "title": "Seahawks vs 49ers", "event_time": "2030-01-01T18:00:00Z",
+             "last_price": 0.45, "volume": 10},
+            {"id": "bad_price", "title": "Seahawks vs 49ers", "event_time": "2030-01-01T18:00:00Z",
+             "last_price": 1.5, "volume": 1500},
+        ]
+        
+        batch = client._parse_markets_content(json.dumps({"markets": markets, "cursor": None}).encode())
+        fallback = client._parse_markets_content(json.dumps({"markets": markets + [{"id": "no_time"}]}).encode())
+        
+        assert [m.market_id for m in batch] == ["keep"]
+        assert batch == fallback
+        assert batch[0].to_model().outcome_description == "Seahawks win"
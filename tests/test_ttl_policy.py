@@ -0,0 +1,82 @@
+"""
+Tests for the time-to-game and volatility aware TTL policy.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import pytz
+from src.core.models import SportsbookOdds
+from src.core.odds_table import OddsTable
+from src.data.ttl_policy import TTLPolicy
+
+
+NOW = datetime(2030, 1, 1, 12, 0, tzinfo=pytz.UTC)
+
+
+def make_table(start_time: datetime, moneyline_away: int = 120) -> OddsTable:
+    """Build a one-game table starting at start_time."""
+    return OddsTable.from_models([SportsbookOdds(
+        game_id="game_1",
+        sport="americanfootball_nfl",
+        away_team="Seattle Seahawks",
+        home_team="San Francisco 49ers",
+        start_time=start_time,
+        book_name="DraftKings",
+        moneyline_away=moneyline_away,
+        moneyline_home=-140
+    )])
+
+
+class TestTTLPolicy:
+    """Test TTLs derived from lead time and price movement."""
+    
+    @pytest.fixture
+    def clock(self):
+        """A mutable wall clock starting at NOW."""
+        return [NOW.timestamp()]
+    
+    @pytest.fixture
+    def policy(self, clock):
+        """Policy with default bounds and a fake clock."""
+        return TTLPolicy(min_ttl=30, max_ttl=1800, clock=lambda: clock[0])
+    
+    def test_ttl_scales_with_lead_time(self, policy):
+        """Test near games get short TTLs and far games long ones."""
+        assert policy.ttl([NOW + timedelta(minutes=30)]) == 30
+        assert policy.ttl([NOW + timedelta(hours=6)]) == 360
+        assert policy.ttl([NOW + timedelta(days=3)]) == 1800
+        assert policy.ttl([NOW + timedelta(days=3), NOW + timedelta(hours=6)]) == 360
+    
+    def test_ttl_edge_cases(self, policy):
+        """Test empty payloads, in-play games and naive times."""
+        assert policy.ttl([]) == 1800
+        assert policy.ttl([NOW - timedelta(minutes=10)]) == 30
+        assert policy.ttl([(NOW + timedelta(hours=6)).replace(tzinfo=None)]) == 360
+    
+    def test_volatility_shortens_ttl(self, policy, clock):
+        """Test prices moving between observations shorten the next TTL."""
+        start = NOW + timedelta(hours=6)
+        
+        assert policy.observe("odds:nfl", make_table(start, 120)) == 360
+        clock[0] += 60
+        assert policy.observe("odds:nfl", make_table(start, 120)) == pytest.approx(359, abs=1)
+        
+        clock[0] += 60
+        moved_ttl = policy.observe("odds:nfl", make_table(start, 100))
+        
+        assert policy.volatility("odds:nfl") > 0
+        assert moved_ttl < 200
+    
+    def test_next_refresh_follows_soonest_key(self, policy, clock):
+        """Test the refresh schedule follows the most time-sensitive key."""
+        assert policy.next_refresh(300) == 300
+        
+        policy.observe("odds:nfl", make_table(NOW + timedelta(days=3)))
+        policy.observe("odds:nba", make_table(NOW + timedelta(hours=2)))
+        clock[0] += 60
+        
+        assert policy.next_refresh(300) == 60
+        
+        # Observations older than max_ttl no longer count
+        clock[0] += 3600
+        assert policy.next_refresh(300) == 300